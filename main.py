@@ -8,47 +8,300 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QPushButton, QLabel, QComboBox, QTabWidget,
                              QFrame, QGridLayout, QScrollArea, QSplitter,
                              QDialog, QTextEdit, QMessageBox, QLineEdit, QFileDialog,
-                             QProgressBar)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QPixmap, QPalette, QColor, QIcon
+                             QProgressBar, QCheckBox, QHeaderView, QSpinBox, QTimeEdit)
+from PyQt5.QtCore import Qt, QThread, QTimer, QTime, QFileSystemWatcher, pyqtSignal
+from PyQt5.QtGui import QFont, QPixmap, QImage, QPalette, QColor, QIcon
 import requests
 from io import BytesIO
+import datetime
 import json
 import os
-import subprocess
+import threading
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+import perf_metrics
+import DataRetrieval
+import launch_backends
+import enrich_launches
+import update_pipeline
+import refresh_schedule
+import launch_charts
+import launch_map
+import launch_timeline
+import chart_cache
+import memory_budget
+import reliability
+import launch_api
+import file_watch
+import session_snapshot
+from launch_backends import prepare_launch_frame, filter_frame, diff_launches
+from launch_sources import launch_to_row
+
+LAUNCHES_CSV = 'data/spacex_launches.csv'
+SESSION_DIR = 'data/session'   # None: oturum kaydedilmez ve geri yüklenmez (ör. kıyaslamalar)
+TABLE_HEADERS = ['Mission Name', 'Date', 'Flight No', 'Success', 'Rocket ID', 'Launchpad', 'Payload (kg)']
+TABLE_ALIGNMENTS = {3: Qt.AlignCenter, 6: Qt.AlignRight | Qt.AlignVCenter}
+FILE_WATCH_DEBOUNCE_MS = 500
+GALLERY_IMAGE_SIZE = (200, 150)
+DETAIL_IMAGE_SIZE = (400, 300)
+MAP_ZOOM_STEP = 1.5   # Harita: tekerlek adımı başına yakınlaştırma
+SUCCESS_LABELS = {True: "✅", False: "❌"}
+
 class UpdateThread(QThread):
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(bool, str)
 
+    def __init__(self, backend, filters, scheduled=False, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+        self.filters = filters
+        self.scheduled = scheduled
+        self.cancel_event = threading.Event()
+        self.refresh = None
+        self.next_launch = None
+
+    def cancel(self):
+        self.cancel_event.set()
+
     def run(self):
         try:
-            scripts = [
-                ('scripts/CsvConvert.py', "Fetching latest launch data..."),
-                ('scripts/rocket_analysis.py', "Fetching rocket details..."),
-                ('scripts/download_rocket_images.py', "Downloading rocket images...")
-            ]
-            total_steps = len(scripts)
-
-            for i, (script, message) in enumerate(scripts):
-                self.progress.emit(int((i / total_steps) * 100), message)
-                
-                process = subprocess.Popen(['python', script], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                stdout, stderr = process.communicate()
-
-                if process.returncode != 0:
-                    error_message = f"Error running {script}:\\n{stderr}"
-                    self.finished.emit(False, error_message)
-                    return
-            
-            self.progress.emit(100, "Update complete!")
-            time.sleep(1) # Kullanıcının mesajı görmesi için kısa bir bekleme
-            self.finished.emit(True, "All data has been updated successfully.")
+            # Adımlar staging klasörüne yazar; yarıda kalırsa bir sonraki güncelleme kaldığı yerden devam eder
+            pipeline = update_pipeline.UpdatePipeline()
+            success, message = pipeline.run(progress=self.progress.emit, cancelled=self.cancel_event.is_set)
+            if success:
+                # Yeni veri kümesi de bu iş parçacığında hazırlanır; arayüz yalnızca takas eder
+                self.progress.emit(95, "Preparing refreshed data...")
+                with perf_metrics.timer("update.build_refresh"):
+                    self.refresh = build_refresh(self.backend, self.filters)
+                self.next_launch = fetch_next_launch()
+                self.progress.emit(100, "Update complete!")
+                if not self.scheduled:
+                    time.sleep(1) # Kullanıcının mesajı görmesi için kısa bir bekleme
+            self.finished.emit(success, message)
 
         except Exception as e:
             self.finished.emit(False, f"An unexpected error occurred: {e}")
 
+class SnapshotThread(QThread):
+    # Veri servisinin yayımladığı yeni sürüm arayüzü bekletmeden açılır
+    ready = pyqtSignal()
+
+    def __init__(self, backend, filters, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+        self.filters = filters
+        self.refresh = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.refresh = build_refresh(self.backend, self.filters)
+        except Exception as e:
+            self.error = str(e)
+        self.ready.emit()
+
+class DataReloadThread(QThread):
+    # İzleyicinin bildirdiği dosyalardan yalnızca değişen parçalar arayüzü bekletmeden okunur
+    ready = pyqtSignal()
+
+    def __init__(self, backend, filters, targets, file_targets, rockets_info, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+        self.filters = filters
+        self.targets = targets
+        self.file_targets = file_targets
+        self.rockets_info = rockets_info
+        self.results = {}
+        self.signatures = {}
+        self.hashes = {}
+        self.retry = []
+        self.errors = []
+
+    def run(self):
+        for target in self.targets:
+            before = self.file_targets.signature(target)
+            if target in ("rockets", "related"):
+                self.hashes[self.file_targets.path(target)] = session_snapshot.file_hash(self.file_targets.path(target))
+            try:
+                with perf_metrics.timer(f"hot_reload.{target.split(':')[0]}"):
+                    value = self.load(target)
+            except Exception as e:
+                # Yarım yazılmış ya da bozuk dosya; imzası oturunca yeniden denenir
+                self.retry.append(target)
+                self.errors.append(f"{target}: {e}")
+                continue
+            if self.file_targets.signature(target) != before:
+                # Okuma sırasında yeniden yazıldı
+                self.retry.append(target)
+                continue
+            self.results[target] = value
+            self.signatures[target] = before
+        self.ready.emit()
+
+    def load(self, target):
+        if target == "launches":
+            if not file_watch.csv_complete(LAUNCHES_CSV):
+                raise ValueError("the last row is not complete yet")
+            return build_refresh(self.backend, self.filters)
+        if target in ("rockets", "launch_images"):
+            # read_rockets_info hataları yutar; yarım dosya burada boş listeye dönüşmemeli
+            with open(self.file_targets.path(target), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        if target == "related":
+            return (enrich_launches.load_launchpad_names(), enrich_launches.load_payload_mass(),
+                    enrich_launches.load_launchpad_locations())
+        # Klasördeki görsel değişti: yalnızca o klasörü kullanan roketlerin kartları yenilenir
+        folder = target[len(file_watch.IMAGE_PREFIX):]
+        images = {}
+        for rocket in self.rockets_info:
+            if rocket['name'].replace(' ', '_') == folder:
+                image_path = find_rocket_image(rocket['name'])
+                image = QImage(image_path) if image_path else QImage()
+                images[rocket['name']] = None if image.isNull() else image.scaled(
+                    *GALLERY_IMAGE_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return images
+
+def find_rocket_image(rocket_name):
+    rocket_folder = f"assets/images/{rocket_name.replace(' ', '_')}"
+    if os.path.exists(rocket_folder):
+        # Özel dosya isimleri için kontrol
+        if rocket_name == "Falcon 1":
+            specific_file = os.path.join(rocket_folder, "UserView-1.jpg")
+            if os.path.exists(specific_file):
+                return specific_file
+        elif rocket_name == "Falcon 9":
+            specific_file = os.path.join(rocket_folder, "image_6.jpg")
+            if os.path.exists(specific_file):
+                return specific_file
+        
+        # Genel dosya arama (fallback)
+        for file in sorted(os.listdir(rocket_folder)):
+            if file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                return os.path.join(rocket_folder, file)
+    return None
+
+def dataset_files():
+    # Oturum kaydı bu dosyaların içeriğine bağlı; tablo satırları rampa adlarını ve yük kütlelerini de gösterir
+    return [LAUNCHES_CSV, os.path.join('data', 'rockets_info.json'), os.path.join('data', 'spacex_related.sqlite')]
+
+def read_rockets_info():
+    try:
+        with open('data/rockets_info.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except:
+        return []
+
+def fetch_next_launch():
+    # Zamanlayıcı yakın fırlatmalarda daha sık yeniler; ağ hatası yenilemeyi bozmasın
+    try:
+        return DataRetrieval.fetch_next()[0]
+    except Exception:
+        return None
+
+def build_refresh(backend, filters):
+    """Load the freshly updated files without touching the widgets; safe off the GUI thread."""
+    # Özetler okunan dosyalara bağlanır; özet okumadan önce alınır ki sonradan değişen dosya eşleşmesin
+    refresh = {"filters": filters, "base_df": backend.df, "diff": None,
+               "hashes": session_snapshot.file_hashes(dataset_files())}
+    if backend.name == "shared":
+        # Sütunlar servisin anlık görüntüsünden bellek eşlemeli açılır; fark da servisten gelir
+        refresh["shared_version"], refresh["df"], refresh["diff"] = backend.open_latest()
+        refresh["filtered_df"] = filter_frame(refresh["df"], **filters)
+        if refresh["diff"] is None and refresh["base_df"]['id'].is_unique and refresh["df"]['id'].is_unique:
+            refresh["diff"] = diff_launches(refresh["base_df"], refresh["df"])
+    elif backend.in_memory:
+        fresh = launch_backends.PandasBackend()
+        fresh.load(LAUNCHES_CSV)
+        refresh["df"] = fresh.df
+        refresh["filtered_df"] = filter_frame(fresh.df, **filters)
+        if refresh["base_df"]['id'].is_unique and fresh.df['id'].is_unique:
+            refresh["diff"] = diff_launches(refresh["base_df"], fresh.df)
+    else:
+        # Yeni tablo ve indeksleri ikinci bağlantıda kurulur; takas yalnızca yeniden adlandırma
+        refresh["diff"] = backend.prepare_reload(LAUNCHES_CSV, page_filters=filters)
+        refresh["filtered_df"] = backend.staged_page
+    refresh["rockets_info"] = read_rockets_info()
+    refresh["launchpad_names"] = enrich_launches.load_launchpad_names()
+    refresh["launchpad_locations"] = enrich_launches.load_launchpad_locations()
+    refresh["payload_mass"] = enrich_launches.load_payload_mass()
+    return refresh
+
+class LatestLaunchPoller(QThread):
+    # /latest ve /next uçlarını ETag ile yoklar; yalnızca değişen fırlatmaları bildirir
+    launch_changed = pyqtSignal(dict)
+    status = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        latest_etag = next_etag = None
+        next_launch = None
+        self.stop_event.clear()
+        while not self.stop_event.is_set():
+            try:
+                with perf_metrics.timer("live.poll"):
+                    latest, latest_etag = DataRetrieval.fetch_latest(latest_etag)
+                    upcoming, next_etag = DataRetrieval.fetch_next(next_etag)
+                if upcoming is not None:
+                    next_launch = upcoming
+                    self.launch_changed.emit(upcoming)
+                if latest is not None:
+                    self.launch_changed.emit(latest)
+                if latest is None and upcoming is None:
+                    perf_metrics.count("live.not_modified")
+                interval = DataRetrieval.poll_interval(next_launch)
+                self.status.emit(f"Last poll {time.strftime('%H:%M:%S')}, next in {interval}s")
+            except Exception as e:
+                interval = DataRetrieval.NEAR_LAUNCH_INTERVAL
+                self.status.emit(f"Poll failed: {e}")
+            self.stop_event.wait(interval)
+
+class EventLoopStallMonitor:
+    # Olay döngüsü gecikmelerini ölçer: zamanlayıcı geç tetiklenirse aradaki fark bir takılmadır
+    def __init__(self, interval_ms=50, threshold_ms=30):
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.last_tick = time.perf_counter()
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.tick)
+
+    def start(self):
+        self.last_tick = time.perf_counter()
+        self.timer.start(self.interval_ms)
+
+    def stop(self):
+        self.timer.stop()
+
+    def tick(self):
+        now = time.perf_counter()
+        late_ms = (now - self.last_tick) * 1000.0 - self.interval_ms
+        self.last_tick = now
+        if late_ms > self.threshold_ms:
+            perf_metrics.record("event_loop.stall", late_ms)
+            perf_metrics.count("event_loop.stalls")
+
+class ChartSource:
+    """Backend aggregates plus the dashboard's reliability engine and timeline store."""
+
+    def __init__(self, gui):
+        self.gui = gui
+
+    def __getattr__(self, name):
+        return getattr(self.gui.backend, name)
+
+    def reliability(self):
+        return self.gui.reliability_stats()
+
+    def timelines(self):
+        return self.gui.launch_timelines()
+
+
 class ModernButton(QPushButton):
     def __init__(self, text, color="#3a86ff"):
         super().__init__(text)
@@ -73,10 +326,12 @@ class ModernButton(QPushButton):
 class RocketDetailDialog(QDialog):
     photo_changed = pyqtSignal()
 
-    def __init__(self, launch_id, rocket_info, parent=None):
+    def __init__(self, launch_id, rocket_info, parent=None, launch_details=None, reliability=None):
         super().__init__(parent)
         self.launch_id = launch_id
         self.rocket_info = rocket_info
+        self.launch_details = launch_details or {}
+        self.reliability = reliability or {}
         self.parent_gui = parent
         self.setWindowTitle(f"🚀 {self.rocket_info['name']} - Details")
         self.setGeometry(200, 200, 800, 600)
@@ -132,6 +387,8 @@ class RocketDetailDialog(QDialog):
         <h4 style="color: #3a86ff; margin-top: 20px; margin-bottom: 10px;">Description</h4>
         <p style="line-height: 1.6; color: #c9d1d9;">{self.rocket_info['description']}</p>
         """
+        details_text += self.reliability_html()
+        details_text += self.mission_details_html()
         
         details_label = QLabel(details_text)
         details_label.setWordWrap(True)
@@ -145,32 +402,75 @@ class RocketDetailDialog(QDialog):
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
         
+    def reliability_html(self):
+        # Sabit success_rate_pct yerine fırlatma geçmişinden hesaplanan güvenilirlik
+        row = '<tr><td style="padding: 8px; font-weight: bold; color: #8b949e;">{}:</td><td style="padding: 8px;">{}</td></tr>'
+        rows = []
+        for label, key in (("Rocket", "rocket"), ("Launchpad", "launchpad")):
+            summary = self.reliability.get(key)
+            if not summary or not summary['launches']:
+                continue
+            streak = "success" if summary['current_streak_success'] else "failure"
+            rows.append(row.format(label, (
+                f"{summary['rate'] * 100:.1f}% of {summary['launches']} launches "
+                f"(95% CI {summary['low'] * 100:.1f}–{summary['high'] * 100:.1f}%), "
+                f"last {summary['recent_launches']}: {summary['recent_rate'] * 100:.1f}%, "
+                f"current streak {summary['current_streak']} {streak}, "
+                f"longest success streak {summary['longest_success_streak']}")))
+        if not rows:
+            return ""
+
+        return f"""
+        <h4 style="color: #3a86ff; margin-top: 20px; margin-bottom: 10px;">Reliability</h4>
+        <table style="width: 100%; border-collapse: collapse;">
+        {''.join(rows)}
+        </table>
+        """
+
+    def mission_details_html(self):
+        # enrich_launches.py ile kaydedilen rampa, yük, çekirdek ve mürettebat bilgileri
+        pad = self.launch_details.get('launchpad')
+        payloads = self.launch_details.get('payloads') or []
+        cores = self.launch_details.get('cores') or []
+        crew = self.launch_details.get('crew') or []
+        if not (pad or payloads or cores or crew):
+            return ""
+
+        row = '<tr><td style="padding: 8px; font-weight: bold; color: #8b949e;">{}:</td><td style="padding: 8px;">{}</td></tr>'
+        rows = []
+        if pad:
+            rows.append(row.format("Launchpad", f"{pad['full_name'] or pad['name']} ({pad['locality']}, {pad['region']})"))
+        for payload in payloads:
+            mass = f"{payload['mass_kg']:,.0f} kg" if payload['mass_kg'] is not None else "mass unknown"
+            rows.append(row.format("Payload", f"{payload['name']} - {payload['type']}, {mass}, {payload['orbit']}"))
+        for core in cores:
+            landing = {1: "landed", 0: "landing failed"}.get(core['landing_success'], "no landing")
+            reused = ", reused" if core['reused'] else ""
+            rows.append(row.format("Core", f"{core['serial'] or core['core_id']} (flight {core['flight']}{reused}, {landing})"))
+        if crew:
+            rows.append(row.format("Crew", ", ".join(f"{c['name']} ({c['agency']})" for c in crew)))
+
+        return f"""
+        <h4 style="color: #3a86ff; margin-top: 20px; margin-bottom: 10px;">Mission</h4>
+        <table style="width: 100%; border-collapse: collapse;">
+        {''.join(rows)}
+        </table>
+        """
+
+    @perf_metrics.timed("image.launch_detail")
     def load_launch_image(self):
-        pixmap = QPixmap()
-        image_loaded = False
-        
-        
-        launch_image_path = self.parent_gui.get_launch_specific_image(self.launch_id)
-        if launch_image_path and os.path.exists(launch_image_path):
-            if pixmap.load(launch_image_path):
-                image_loaded = True
-        
-        if not image_loaded:
-            rocket_image_path = self.parent_gui.get_rocket_image_path(self.rocket_info['name'])
-            if rocket_image_path and os.path.exists(rocket_image_path):
-                if pixmap.load(rocket_image_path):
-                    image_loaded = True
-
-     
-        if not image_loaded:
-            fallback_image_path = "assets/M3k.jpg"
-            if os.path.exists(fallback_image_path):
-                if pixmap.load(fallback_image_path):
-                    image_loaded = True
-
-        if image_loaded:
-            pixmap = pixmap.scaled(400, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pixmap = None
+        # Ölçeklenmiş görüntü ana penceredeki önbellekten gelir; her açılışta tam boy resim çözülmez
+        for image_path in (self.parent_gui.get_launch_specific_image(self.launch_id),
+                           self.parent_gui.get_rocket_image_path(self.rocket_info['name']),
+                           "assets/M3k.jpg"):
+            pixmap = self.parent_gui.cached_pixmap(image_path, *DETAIL_IMAGE_SIZE)
+            if pixmap is not None:
+                break
+
+        if pixmap is not None:
             self.image_label.setPixmap(pixmap)
+            self.image_label.setStyleSheet("")
         else:
             self.image_label.setText("Image not found")
             self.image_label.setStyleSheet("font-size: 24px; text-align: center; color: #c93c37;")
@@ -289,28 +589,120 @@ class SpaceXGUI(QMainWindow):
         """)
         
         # Load data
-        self.df = pd.read_csv('data/spacex_launches.csv')
-        self.df['date_utc'] = pd.to_datetime(self.df['date_utc'], errors='coerce')
-        self.df = self.df.dropna(subset=['date_utc'])
-        self.df['year'] = self.df['date_utc'].dt.year
+        self.backend = launch_backends.create_backend()
+        self.dataset_version = 0
+        # Dosyalar değişmediyse önceki görünüm oturum kaydından hemen çizilir
+        self.loaded_hashes = session_snapshot.file_hashes(dataset_files())
+        self.data_matches_files = True
+        self.session = session_snapshot.load(SESSION_DIR, self.backend.name, self.loaded_hashes) if SESSION_DIR else None
+        self.saved_frame_hashes = None
+        if self.session is not None and self.session.frame is not None:
+            # Doğrulanmış kare oturumdan gelir; CSV ayrıştırma ve şema denetimi atlanır
+            self.backend.df = self.session.frame
+            self.saved_frame_hashes = self.loaded_hashes
+            self.mark_data_changed()
+        else:
+            self.load_launch_data()
         
         # Load rocket info
         self.load_rocket_info()
+        self.load_related_data()
         self.load_launch_images_db() # Fırlatma resim veritabanını yükle
-        self.filtered_df = self.df.copy() # Filtrelenmiş DataFrame için
+        self.filtered_df = self.df # Filtrelenmiş DataFrame için
         
         # Matplotlib style
         plt.style.use('dark_background')
         
+        self.stall_monitor = EventLoopStallMonitor()
+        self.chart_cache = chart_cache.ChartBitmapCache()
+        self.pixmap_cache = chart_cache.ChartBitmapCache(memory_budget.mb(memory_budget.PIXMAP_BUDGET_MB),
+                                                         metric="pixmap_cache")
+        self.memory_ledger = memory_budget.MemoryLedger()
+        self.frame_memory_key = None
+        self.frame_memory_bytes = 0
+        self.allocation_snapshot = None
+        self.thumbnails_used = set()
+        self.chart_generation = 0
+        self.drawn_generation = 0
+        self.chart_pick_data = None
+        self.map_drag = None
+        self.chart_source = ChartSource(self)
+        self.reliability_engine = reliability.ReliabilityEngine()
+        self.reliability_version = None
+        self.timeline_store = None
+        self.timeline_signature = None
+        self.refresh_settings = refresh_schedule.load_settings()
+        self.auto_refresh_timer = QTimer(self)
+        self.auto_refresh_timer.setSingleShot(True)
+        self.auto_refresh_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.auto_refresh_due = None
+        self.next_launch = None
+        self.auto_refresh_timer.timeout.connect(self.run_scheduled_refresh)
+        self.file_targets = file_watch.FileTargets('data', 'assets/images')
+        self.file_change_tracker = file_watch.ChangeTracker(self.file_targets)
+        self.file_change_tracker.mark_loaded()
+        self.file_watch_timer = QTimer(self)
+        self.file_watch_timer.setSingleShot(True)
+        self.file_watch_timer.timeout.connect(self.check_file_changes)
         self.init_ui()
+        self.file_watch_checkbox.setChecked(True)
+        # Bütçe aşılınca önce grafik görüntüleri, sonra resimler atılır; DataFrame ve tuval yalnızca sayılır
+        self.memory_ledger.register("charts", lambda: self.chart_cache.used_bytes, self.chart_cache.shrink)
+        self.memory_ledger.register("pixmaps", lambda: self.pixmap_cache.used_bytes, self.pixmap_cache.shrink)
+        self.memory_ledger.register("dataframes", self.frame_memory)
+        self.memory_ledger.register("figure", self.figure_memory)
+        self.memory_ledger.register("timelines", lambda: self.timeline_store.nbytes if self.timeline_store else 0)
+        self.refresh_memory_label()
+        if self.session is not None:
+            self.chart_combo.blockSignals(True)
+            self.chart_combo.setCurrentText(self.session.state["chart"])
+            self.chart_combo.blockSignals(False)
+            self.tabs.setCurrentIndex(self.session.state["tab"])
+        self.tabs.currentChanged.connect(self.tab_changed)
+        if self.tabs.currentWidget() is self.charts_widget:
+            QTimer.singleShot(0, lambda: self.tab_changed(self.tabs.currentIndex()))
+
+        if self.backend.name == "shared":
+            # Sürüm sayacı paylaşılan bellekten okunur; okuma dosya açmadan yapılır
+            self.snapshot_thread = None
+            self.shared_version_timer = QTimer(self)
+            self.shared_version_timer.timeout.connect(self.check_shared_version)
+            self.shared_version_timer.start(1000)
+        if perf_metrics.is_enabled():
+            self.stall_monitor.start()
+        if self.refresh_settings["enabled"]:
+            self.schedule_auto_refresh()
+
+    @property
+    def df(self):
+        # SQL arka uçlarında yalnızca geçerli sayfa bellektedir
+        return self.backend.df
+
+    @df.setter
+    def df(self, value):
+        self.backend.df = value
+        self.mark_data_changed()
+
+    def mark_data_changed(self):
+        # Veri sürümü grafik önbelleği anahtarının parçası; eski görüntüler artık eşleşmez
+        self.dataset_version += 1
+        self.publish_api_source()
+
+    @perf_metrics.timed("csv.parse")
+    def load_launch_data(self):
+        self.backend.load(LAUNCHES_CSV)
+        self.mark_data_changed()
         
     def load_rocket_info(self):
-        try:
-            with open('data/rockets_info.json', 'r', encoding='utf-8') as f:
-                self.rockets_info = json.load(f)
-        except:
-            self.rockets_info = []
-        
+        self.rockets_info = read_rockets_info()
+        self.backend.set_rockets(self.rockets_info)
+        
+    def load_related_data(self):
+        # Rampa adları ve toplam yük kütlesi tabloda satır başına istek atmadan gösterilir
+        self.launchpad_names = enrich_launches.load_launchpad_names()
+        self.payload_mass = enrich_launches.load_payload_mass()
+        self.launchpad_locations = enrich_launches.load_launchpad_locations()
+
     def load_launch_images_db(self):
         self.launch_images_db_path = 'data/launch_images.json'
         try:
@@ -324,6 +716,7 @@ class SpaceXGUI(QMainWindow):
         try:
             with open(self.launch_images_db_path, 'w', encoding='utf-8') as f:
                 json.dump(self.launch_images, f, indent=2)
+            self.file_change_tracker.mark_loaded(["launch_images"])
             QMessageBox.information(self, "Success", "Launch image has been updated.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not save launch image database: {e}")
@@ -403,17 +796,24 @@ class SpaceXGUI(QMainWindow):
         
         layout.addWidget(header_frame)
 
-    def create_stat_cards(self, layout):
-        total_launches = len(self.df)
-        success_launches = len(self.df[self.df['success'] == True])
+    @perf_metrics.timed("create_stat_cards")
+    def compute_stats(self):
+        stats = self.backend.stats()
+        total_launches = stats['total']
+        success_launches = stats['successful']
         success_rate = (success_launches / total_launches) * 100 if total_launches > 0 else 0
         
-        stats = [
+        return [
             ("Total Launches", str(total_launches), "#3a86ff"),
             ("Successful Launches", str(success_launches), "#23c552"),
             ("Success Rate", f"{success_rate:.1f}%", "#e69b00"),
-            ("First Launch", str(self.df['year'].min()), "#e14a4a")
+            ("First Launch", str(stats['first_year']), "#e14a4a"),
+            ("Latest Launch", str(stats['latest_name'] or "-"), "#58a6ff")
         ]
+
+    def create_stat_cards(self, layout):
+        self.stat_value_labels = {}
+        stats = self.session.state["stats"] if self.session is not None and self.session.valid else self.compute_stats()
         
         for title, value, color in stats:
             card = QFrame()
@@ -423,6 +823,8 @@ class SpaceXGUI(QMainWindow):
             value_label = QLabel(value)
             value_label.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {color};")
             value_label.setAlignment(Qt.AlignCenter)
+            value_label.setWordWrap(True)
+            self.stat_value_labels[title] = value_label
 
             title_label = QLabel(title)
             title_label.setStyleSheet("font-size: 13px; color: #8b949e; font-weight: bold;")
@@ -432,6 +834,11 @@ class SpaceXGUI(QMainWindow):
             card_layout.addWidget(title_label)
             
             layout.addWidget(card)
+
+    def update_stat_cards(self):
+        for title, value, color in self.compute_stats():
+            if title in self.stat_value_labels:
+                self.stat_value_labels[title].setText(value)
         
     def create_data_tab(self, tabs):
         data_widget = QWidget()
@@ -466,7 +873,7 @@ class SpaceXGUI(QMainWindow):
         year_label = QLabel("Year:")
         year_label.setStyleSheet("font-weight: bold; margin-right: 10px; margin-left: 20px; color: #8b949e;")
         self.year_combo = QComboBox()
-        years = sorted(self.df['year'].unique())
+        years = self.session.state["years"] if self.session is not None and self.session.valid else self.backend.years()
         self.year_combo.addItem("All")
         self.year_combo.addItems([str(year) for year in years])
         self.year_combo.currentTextChanged.connect(self.filter_data)
@@ -484,6 +891,24 @@ class SpaceXGUI(QMainWindow):
         filter_layout.addWidget(self.year_combo)
         filter_layout.addWidget(success_label)
         filter_layout.addWidget(self.success_combo)
+
+        # Takvim grafiğinden seçilen gün; tıklanınca filtre kalkar
+        self.date_filter = None
+        self.date_filter_btn = QPushButton("")
+        self.date_filter_btn.setStyleSheet("background-color: #3a86ff; color: white; border: none; border-radius: 6px; padding: 6px 12px; margin-left: 20px;")
+        self.date_filter_btn.setToolTip("Clear the date filter")
+        self.date_filter_btn.clicked.connect(lambda: self.set_date_filter(None))
+        self.date_filter_btn.setVisible(False)
+        filter_layout.addWidget(self.date_filter_btn)
+
+        # Harita kümesinden seçilen rampalar; tıklanınca filtre kalkar
+        self.launchpad_filter = None
+        self.launchpad_filter_btn = QPushButton("")
+        self.launchpad_filter_btn.setStyleSheet("background-color: #3a86ff; color: white; border: none; border-radius: 6px; padding: 6px 12px; margin-left: 10px;")
+        self.launchpad_filter_btn.setToolTip("Clear the launchpad filter")
+        self.launchpad_filter_btn.clicked.connect(lambda: self.set_launchpad_filter(None))
+        self.launchpad_filter_btn.setVisible(False)
+        filter_layout.addWidget(self.launchpad_filter_btn)
         
         # Dışa aktarma butonu
         export_btn = ModernButton("Export Data", "#16a34a")
@@ -500,7 +925,7 @@ class SpaceXGUI(QMainWindow):
         layout.addWidget(self.table)
         
         # Load data
-        self.load_table_data()
+        self.restore_session_view()
         
         tabs.addTab(data_widget, "Launch Data")
         
@@ -516,11 +941,7 @@ class SpaceXGUI(QMainWindow):
         chart_label = QLabel("Select Chart:")
         chart_label.setStyleSheet("font-weight: bold; margin-right: 10px; color: #8b949e;")
         self.chart_combo = QComboBox()
-        self.chart_combo.addItems([
-            "Launches per Year",
-            "Success/Failure Distribution", 
-            "Success Rate by Year"
-        ])
+        self.chart_combo.addItems(launch_charts.CHART_TYPES)
         self.chart_combo.currentTextChanged.connect(self.show_chart)
         
         chart_layout.addWidget(chart_label)
@@ -530,11 +951,21 @@ class SpaceXGUI(QMainWindow):
         layout.addWidget(chart_frame)
         
         # Chart display
-        self.figure = Figure(figsize=(12, 8), facecolor='#161b22')
+        self.figure = Figure(figsize=(12, 8), facecolor=launch_charts.FIGURE_FACECOLOR)
         self.canvas = FigureCanvas(self.figure)
         self.figure.canvas.mpl_connect('pick_event', self.on_pick)
+        self.figure.canvas.mpl_connect('draw_event', self.on_chart_drawn)
+        # Harita: tekerlekle yakınlaştırma, boş alanda sürükleyerek kaydırma
+        self.figure.canvas.mpl_connect('scroll_event', self.on_map_scroll)
+        self.figure.canvas.mpl_connect('button_press_event', self.on_map_press)
+        self.figure.canvas.mpl_connect('motion_notify_event', self.on_map_drag)
+        self.figure.canvas.mpl_connect('button_release_event', self.on_map_release)
         layout.addWidget(self.canvas)
+        self.chart_info_label = QLabel("")
+        self.chart_info_label.setStyleSheet("color: #8b949e;")
+        layout.addWidget(self.chart_info_label)
         
+        self.charts_widget = charts_widget
         tabs.addTab(charts_widget, "Charts")
         
     def create_rocket_gallery_tab(self, tabs):
@@ -550,8 +981,17 @@ class SpaceXGUI(QMainWindow):
         scroll.setWidgetResizable(True)
         scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
         
+        self.gallery_scroll = scroll
+        self.populate_rocket_gallery()
+        layout.addWidget(scroll)
+        
+        tabs.addTab(gallery_widget, "Rocket Gallery")
+        
+    def populate_rocket_gallery(self):
+        # Roket listesi değişince kartlar yeniden kurulur; görsel değişince yalnızca o kart
         scroll_widget = QWidget()
         scroll_layout = QGridLayout(scroll_widget)
+        self.gallery_image_labels = {}
         
         # Load rocket images
         for i, rocket in enumerate(self.rockets_info):
@@ -563,25 +1003,8 @@ class SpaceXGUI(QMainWindow):
             image_label = QLabel()
             image_path = self.get_rocket_image_path(rocket['name'])
             
-            pixmap = QPixmap()
-            image_loaded = False
-            
-            if image_path and os.path.exists(image_path):
-                if pixmap.load(image_path):
-                    image_loaded = True
-            
-            if not image_loaded:
-                fallback_image_path = "assets/M3k.jpg"
-                if os.path.exists(fallback_image_path):
-                    if pixmap.load(fallback_image_path):
-                        image_loaded = True
-            
-            if image_loaded:
-                pixmap = pixmap.scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                image_label.setPixmap(pixmap)
-            else:
-                image_label.setText("Image not found")
-                image_label.setStyleSheet("font-size: 16px; text-align: center; color: #c93c37;")
+            self.show_gallery_image(image_label, self.gallery_pixmap(image_path))
+            self.gallery_image_labels[rocket['name']] = image_label
             
             image_label.setAlignment(Qt.AlignCenter)
             rocket_layout.addWidget(image_label)
@@ -605,11 +1028,62 @@ class SpaceXGUI(QMainWindow):
             
             scroll_layout.addWidget(rocket_frame, i // 3, i % 3)
         
-        scroll.setWidget(scroll_widget)
-        layout.addWidget(scroll)
-        
-        tabs.addTab(gallery_widget, "Rocket Gallery")
-        
+        self.gallery_scroll.setWidget(scroll_widget)
+
+    def gallery_pixmap(self, image_path):
+        with perf_metrics.timer("image.gallery"):
+            pixmap = self.cached_pixmap(image_path, *GALLERY_IMAGE_SIZE)
+            if pixmap is None:
+                pixmap = self.cached_pixmap("assets/M3k.jpg", *GALLERY_IMAGE_SIZE)
+        return pixmap
+
+    def cached_pixmap(self, image_path, width, height):
+        """image_path scaled to fit width x height, from the pixmap cache; None when it cannot be loaded."""
+        try:
+            # Değiştirme zamanı anahtarda: dosya yenilenince eski görüntü kendiliğinden eşleşmez
+            key = (image_path, os.stat(image_path).st_mtime_ns, width, height)
+        except (OSError, TypeError):
+            return None
+        pixmap = self.pixmap_cache.get(key)
+        if pixmap is None:
+            thumbnail = session_snapshot.thumbnail_path(SESSION_DIR, *key) if SESSION_DIR else None
+            pixmap = QPixmap()
+            # Önceki oturumda ölçeklenmiş küçük kopya varsa büyük resim hiç çözülmez
+            if thumbnail is None or not pixmap.load(thumbnail):
+                if not pixmap.load(image_path):
+                    return None
+                pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                if thumbnail is not None:
+                    os.makedirs(os.path.dirname(thumbnail), exist_ok=True)
+                    pixmap.save(thumbnail, "PNG")
+            if thumbnail is not None:
+                self.thumbnails_used.add(thumbnail)
+            self.pixmap_cache.put(key, pixmap, pixmap.width() * pixmap.height() * 4)
+            self.memory_ledger.enforce()
+        return pixmap
+
+    def frame_memory(self):
+        # deep ölçüm metinleri de sayar ama büyük karelerde yavaştır; veri değişmedikçe yeniden ölçülmez
+        key = (self.dataset_version, id(self.filtered_df))
+        if key != self.frame_memory_key:
+            frames = [self.df] if self.filtered_df is self.df else [self.df, self.filtered_df]
+            self.frame_memory_bytes = sum(memory_budget.frame_bytes(frame) for frame in frames)
+            self.frame_memory_key = key
+        return self.frame_memory_bytes
+
+    def figure_memory(self):
+        # Agg tuvalinin RGBA arabelleği
+        width, height = self.canvas.get_width_height(physical=True)
+        return width * height * 4
+
+    def show_gallery_image(self, image_label, pixmap):
+        if pixmap is not None:
+            image_label.setPixmap(pixmap)
+            image_label.setStyleSheet("")
+        else:
+            image_label.setText("Image not found")
+            image_label.setStyleSheet("font-size: 16px; text-align: center; color: #c93c37;")
+
     def create_settings_tab(self, tabs):
         settings_widget = QWidget()
         layout = QVBoxLayout(settings_widget)
@@ -627,12 +1101,15 @@ class SpaceXGUI(QMainWindow):
         update_title = QLabel("Update Application Data")
         update_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #c9d1d9; margin-bottom: 10px;")
         
-        update_desc = QLabel("Fetch the latest launch and rocket data from the SpaceX API. This may take a few moments.")
+        update_desc = QLabel("Fetch the latest launch and rocket data from the SpaceX API. This may take a few moments. A cancelled or interrupted update resumes from its last finished step.")
         update_desc.setWordWrap(True)
         update_desc.setStyleSheet("color: #8b949e; margin-bottom: 20px;")
         
         self.update_btn = ModernButton("Update Data Now", "#1d914b")
         self.update_btn.clicked.connect(self.start_update_process)
+        self.cancel_update_btn = ModernButton("Cancel Update", "#da3633")
+        self.cancel_update_btn.clicked.connect(self.cancel_update_process)
+        self.cancel_update_btn.setVisible(False)
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -642,10 +1119,99 @@ class SpaceXGUI(QMainWindow):
         update_layout.addWidget(update_title)
         update_layout.addWidget(update_desc)
         update_layout.addWidget(self.update_btn)
+        update_layout.addWidget(self.cancel_update_btn)
         update_layout.addWidget(self.progress_bar)
         update_layout.addWidget(self.progress_label)
+        self.update_status_label = QLabel("")
+        self.update_status_label.setWordWrap(True)
+        self.update_status_label.setStyleSheet("color: #8b949e;")
+        update_layout.addWidget(self.update_status_label)
 
         layout.addWidget(update_frame)
+
+        # Zamanlanmış arka plan yenilemesi
+        layout.addWidget(self.create_auto_refresh_panel())
+
+        # Canlı son fırlatma takibi
+        live_frame = QFrame()
+        live_frame.setObjectName("StatCard")
+        live_layout = QVBoxLayout(live_frame)
+
+        live_title = QLabel("Live Latest Launch")
+        live_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #c9d1d9; margin-bottom: 10px;")
+
+        live_desc = QLabel("Keep the latest and next launch current without running a full update. Polling speeds up near launch windows; unchanged polls cost a 304 response.")
+        live_desc.setWordWrap(True)
+        live_desc.setStyleSheet("color: #8b949e; margin-bottom: 10px;")
+
+        self.live_checkbox = QCheckBox("Enable live mode")
+        self.live_checkbox.setStyleSheet("color: #c9d1d9; font-weight: bold;")
+        self.live_checkbox.toggled.connect(self.toggle_live_mode)
+        self.live_status_label = QLabel("")
+        self.live_status_label.setStyleSheet("color: #8b949e;")
+
+        live_layout.addWidget(live_title)
+        live_layout.addWidget(live_desc)
+        live_layout.addWidget(self.live_checkbox)
+        live_layout.addWidget(self.live_status_label)
+
+        layout.addWidget(live_frame)
+
+        # data/ ve assets/images/ izleme
+        watch_frame = QFrame()
+        watch_frame.setObjectName("StatCard")
+        watch_layout = QVBoxLayout(watch_frame)
+
+        watch_title = QLabel("Watch Data Folders")
+        watch_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #c9d1d9; margin-bottom: 10px;")
+
+        watch_desc = QLabel("Reload launches, rockets, launchpad data and rocket images as soon as files are dropped into "
+                            "data/ or assets/images/. Only the changed parts are reloaded, and only once a file has stopped changing.")
+        watch_desc.setWordWrap(True)
+        watch_desc.setStyleSheet("color: #8b949e; margin-bottom: 10px;")
+
+        self.file_watch_checkbox = QCheckBox("Reload changed files automatically")
+        self.file_watch_checkbox.setStyleSheet("color: #c9d1d9; font-weight: bold;")
+        self.file_watch_checkbox.toggled.connect(self.toggle_file_watch)
+        self.file_watch_status_label = QLabel("")
+        self.file_watch_status_label.setWordWrap(True)
+        self.file_watch_status_label.setStyleSheet("color: #8b949e;")
+
+        watch_layout.addWidget(watch_title)
+        watch_layout.addWidget(watch_desc)
+        watch_layout.addWidget(self.file_watch_checkbox)
+        watch_layout.addWidget(self.file_watch_status_label)
+
+        layout.addWidget(watch_frame)
+
+        # Yerel JSON API
+        api_frame = QFrame()
+        api_frame.setObjectName("StatCard")
+        api_layout = QVBoxLayout(api_frame)
+
+        api_title = QLabel("Local API")
+        api_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #c9d1d9; margin-bottom: 10px;")
+
+        api_desc = QLabel("Serve the filtered launches, stat cards and chart series as read-only JSON on this machine "
+                          "(see scripts/launch_api.py), so other tools need not scrape exported CSV files.")
+        api_desc.setWordWrap(True)
+        api_desc.setStyleSheet("color: #8b949e; margin-bottom: 10px;")
+
+        self.api_checkbox = QCheckBox(f"Serve local API on port {launch_api.DEFAULT_PORT}")
+        self.api_checkbox.setStyleSheet("color: #c9d1d9; font-weight: bold;")
+        self.api_checkbox.toggled.connect(self.toggle_api_server)
+        self.api_status_label = QLabel("")
+        self.api_status_label.setStyleSheet("color: #8b949e;")
+
+        api_layout.addWidget(api_title)
+        api_layout.addWidget(api_desc)
+        api_layout.addWidget(self.api_checkbox)
+        api_layout.addWidget(self.api_status_label)
+
+        layout.addWidget(api_frame)
+
+        # Performans paneli
+        layout.addWidget(self.create_performance_panel())
         
         # Kapatma bölümü
         close_frame = QFrame()
@@ -669,15 +1235,523 @@ class SpaceXGUI(QMainWindow):
         layout.addWidget(close_frame)
         tabs.addTab(settings_widget, "Settings")
 
-    def start_update_process(self):
+    def create_performance_panel(self):
+        perf_frame = QFrame()
+        perf_frame.setObjectName("StatCard")
+        perf_layout = QVBoxLayout(perf_frame)
+
+        perf_title = QLabel("Performance")
+        perf_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #c9d1d9; margin-bottom: 10px;")
+
+        perf_desc = QLabel("Record hot-path latencies and event-loop stalls. Profiling adds a small overhead while enabled.")
+        perf_desc.setWordWrap(True)
+        perf_desc.setStyleSheet("color: #8b949e; margin-bottom: 10px;")
+
+        self.perf_checkbox = QCheckBox("Enable profiling")
+        self.perf_checkbox.setStyleSheet("color: #c9d1d9; font-weight: bold;")
+        self.perf_checkbox.setChecked(perf_metrics.is_enabled())
+        self.perf_checkbox.toggled.connect(self.toggle_profiling)
+
+        self.perf_table = QTableWidget(0, 5)
+        self.perf_table.setHorizontalHeaderLabels(['Metric', 'Count', 'p50 (ms)', 'p95 (ms)', 'Max (ms)'])
+        self.perf_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.perf_table.verticalHeader().setVisible(False)
+        self.perf_table.setMinimumHeight(220)
+
+        self.perf_counters_label = QLabel("")
+        self.perf_counters_label.setStyleSheet("color: #8b949e;")
+
+        self.memory_label = QLabel("")
+        self.memory_label.setWordWrap(True)
+        self.memory_label.setStyleSheet("color: #8b949e;")
+
+        self.tracemalloc_checkbox = QCheckBox("Trace Python allocations (tracemalloc, slower)")
+        self.tracemalloc_checkbox.setStyleSheet("color: #c9d1d9;")
+        self.tracemalloc_checkbox.setChecked(memory_budget.is_tracing())
+        self.tracemalloc_checkbox.toggled.connect(self.toggle_tracemalloc)
+
+        buttons_layout = QHBoxLayout()
+        reset_btn = ModernButton("Reset", "#30363d")
+        reset_btn.clicked.connect(self.reset_profiling)
+        export_trace_btn = ModernButton("Export Chrome Trace", "#3a86ff")
+        export_trace_btn.clicked.connect(self.export_perf_trace)
+        snapshot_btn = ModernButton("Allocation Snapshot", "#30363d")
+        snapshot_btn.clicked.connect(self.show_allocation_growth)
+        buttons_layout.addWidget(reset_btn)
+        buttons_layout.addWidget(export_trace_btn)
+        buttons_layout.addWidget(snapshot_btn)
+        buttons_layout.addStretch()
+
+        perf_layout.addWidget(perf_title)
+        perf_layout.addWidget(perf_desc)
+        perf_layout.addWidget(self.perf_checkbox)
+        perf_layout.addWidget(self.perf_table)
+        perf_layout.addWidget(self.perf_counters_label)
+        perf_layout.addWidget(self.memory_label)
+        perf_layout.addWidget(self.tracemalloc_checkbox)
+        perf_layout.addLayout(buttons_layout)
+
+        # Panel sadece profil açıkken saniyede bir yenilenir
+        self.perf_refresh_timer = QTimer(self)
+        self.perf_refresh_timer.timeout.connect(self.refresh_performance_panel)
+        if perf_metrics.is_enabled():
+            self.perf_refresh_timer.start(1000)
+
+        return perf_frame
+
+    def toggle_profiling(self, enabled):
+        perf_metrics.enable(enabled)
+        if enabled:
+            self.stall_monitor.start()
+            self.perf_refresh_timer.start(1000)
+        else:
+            self.stall_monitor.stop()
+            self.perf_refresh_timer.stop()
+        self.refresh_performance_panel()
+
+    def reset_profiling(self):
+        perf_metrics.reset()
+        self.refresh_performance_panel()
+
+    def refresh_performance_panel(self):
+        rows = perf_metrics.summary()
+        self.perf_table.setRowCount(len(rows))
+        for i, (name, total, p50, p95, peak) in enumerate(rows):
+            self.perf_table.setItem(i, 0, QTableWidgetItem(name))
+            self.perf_table.setItem(i, 1, QTableWidgetItem(str(total)))
+            self.perf_table.setItem(i, 2, QTableWidgetItem(f"{p50:.2f}"))
+            self.perf_table.setItem(i, 3, QTableWidgetItem(f"{p95:.2f}"))
+            self.perf_table.setItem(i, 4, QTableWidgetItem(f"{peak:.2f}"))
+        counters = perf_metrics.counters()
+        self.perf_counters_label.setText("  ".join(f"{name}: {value}" for name, value in sorted(counters.items())))
+        self.refresh_memory_label()
+
+    def refresh_memory_label(self):
+        stats = self.memory_ledger.stats()
+        budgets = {"charts": self.chart_cache.budget_bytes, "pixmaps": self.pixmap_cache.budget_bytes}
+        parts = [f"{name} {value / 2**20:.1f}" + (f"/{budgets[name] / 2**20:.0f}" if name in budgets else "") + " MB"
+                 for name, value in stats["usage"].items()]
+        parts.append(f"total {stats['total_bytes'] / 2**20:.1f}/{stats['budget_bytes'] / 2**20:.0f} MB")
+        if memory_budget.is_tracing():
+            current, peak = memory_budget.traced()
+            parts.append(f"Python {current / 2**20:.1f} MB (peak {peak / 2**20:.1f})")
+        rss = memory_budget.process_rss()
+        if rss is not None:
+            parts.append(f"RSS {rss / 2**20:.0f} MB")
+        self.memory_label.setText("Memory: " + "  ·  ".join(parts))
+
+    def toggle_tracemalloc(self, enabled):
+        if enabled:
+            memory_budget.start_tracing()
+        else:
+            memory_budget.stop_tracing()
+            self.allocation_snapshot = None
+        self.refresh_memory_label()
+
+    def show_allocation_growth(self):
+        # İlk basış temel anlık görüntüyü alır; sonrakiler o andan beri büyüyen satırları gösterir
+        if not memory_budget.is_tracing():
+            self.tracemalloc_checkbox.setChecked(True)
+        snapshot = memory_budget.take_snapshot()
+        previous, self.allocation_snapshot = self.allocation_snapshot, snapshot
+        if previous is None:
+            QMessageBox.information(self, "Allocation Snapshot", "Baseline taken. Use the dashboard, then take another snapshot to see what grew.")
+            return
+        rows = memory_budget.top_growth(previous, snapshot, limit=15)
+        text = "\n".join(f"{size / 1024:+,.0f} KB  {blocks:+,} blocks  {location}" for location, size, blocks in rows)
+        QMessageBox.information(self, "Allocation Snapshot", text or "Nothing grew since the last snapshot.")
+
+    def export_perf_trace(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Chrome Trace", "spacex_trace.json", "JSON Files (*.json);;All Files (*)")
+        if file_path:
+            try:
+                event_count = perf_metrics.export_chrome_trace(file_path)
+                QMessageBox.information(self, "Success", f"{event_count} trace events exported to:\n{file_path}\n\nOpen it in chrome://tracing or ui.perfetto.dev.")
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"An error occurred while exporting the trace:\n{e}")
+
+    def toggle_live_mode(self, enabled):
+        if enabled:
+            self.live_poller = LatestLaunchPoller(self)
+            self.live_poller.launch_changed.connect(self.upsert_launch)
+            self.live_poller.status.connect(self.live_status_label.setText)
+            self.live_poller.start()
+        elif getattr(self, 'live_poller', None):
+            self.live_poller.stop()
+            self.live_poller.wait()
+            self.live_poller = None
+            self.live_status_label.setText("Live mode stopped.")
+
+    def toggle_file_watch(self, enabled):
+        if enabled:
+            self.file_watcher = QFileSystemWatcher(self)
+            self.file_watcher.fileChanged.connect(self.file_changed)
+            self.file_watcher.directoryChanged.connect(self.file_changed)
+            self.sync_watch_paths()
+            # Kapalıyken değişen dosyalar da yakalanır; imzası yüklenenle aynı olanlar atlanır
+            for target in self.file_change_tracker.all_targets():
+                self.file_change_tracker.note(target)
+            self.file_watch_timer.start(FILE_WATCH_DEBOUNCE_MS)
+            self.file_watch_status_label.setText("Watching data/ and assets/images/.")
+        elif getattr(self, 'file_watcher', None):
+            self.file_watch_timer.stop()
+            self.file_watcher.deleteLater()
+            self.file_watcher = None
+            self.file_watch_status_label.setText("")
+
+    def sync_watch_paths(self):
+        # os.replace ile değiştirilen dosyalar izleyiciden düşer; yeni roket klasörleri de eklenir
+        directories, files = self.file_targets.watch_paths()
+        watched = set(self.file_watcher.directories()) | set(self.file_watcher.files())
+        stale = [path for path in self.file_watcher.directories() if path not in directories]
+        if stale:
+            # Klasör oluştu; yerine izlenen üst klasör artık gerekmez
+            self.file_watcher.removePaths(stale)
+        missing = [path for path in directories + files if path not in watched]
+        if missing:
+            self.file_watcher.addPaths(missing)
+        # Yeni açılan klasörlere izleyici eklenmeden önce görsel kopyalanmış olabilir
+        return [target for path in missing if path in directories
+                for target in self.file_change_tracker.note_path(path)]
+
+    def file_changed(self, path):
+        # Olay patlamaları tek kontrolde toplanır: her olay zamanlayıcıyı yeniden kurar
+        noted = self.file_change_tracker.note_path(path)
+        if self.sync_watch_paths() or noted:
+            self.file_watch_timer.start(FILE_WATCH_DEBOUNCE_MS)
+
+    def check_file_changes(self):
+        if not getattr(self, 'file_watcher', None):
+            return
+        self.sync_watch_paths()
+        reloading = getattr(self, 'file_reload_thread', None) is not None and self.file_reload_thread.isRunning()
+        updating = getattr(self, 'update_thread', None) is not None and self.update_thread.isRunning()
+        if reloading or updating:
+            # Güncelleme kendi yazdığı dosyaları zaten yükler; bitince yüklenmiş sayılır
+            self.file_watch_timer.start(FILE_WATCH_DEBOUNCE_MS)
+            return
+        ready, wait = self.file_change_tracker.poll()
+        if wait is not None:
+            self.file_watch_timer.start(max(int(wait * 1000), FILE_WATCH_DEBOUNCE_MS))
+        if self.backend.name == "shared" and "launches" in ready:
+            # Fırlatmaları veri servisi yayımlar; CSV'yi de o izler
+            ready.remove("launches")
+            self.file_change_tracker.mark_loaded(["launches"])
+        if not ready:
+            return
+        self.file_reload_thread = DataReloadThread(self.backend, self.filter_state(), ready, self.file_targets,
+                                                   self.rockets_info)
+        self.file_reload_thread.ready.connect(self.file_reload_finished)
+        self.file_reload_thread.start()
+
+    def file_reload_finished(self):
+        thread = self.file_reload_thread
+        tracker = self.file_change_tracker
+        if getattr(self, 'update_thread', None) is not None and self.update_thread.isRunning():
+            # Güncelleme başladı; sonuçlar eskidi, hedefler güncelleme bitince yeniden değerlendirilir
+            for target in thread.targets:
+                tracker.note(target)
+            self.file_watch_timer.start(FILE_WATCH_DEBOUNCE_MS)
+            return
+        for target in thread.retry:
+            tracker.note(target)
+        if thread.retry:
+            self.file_watch_timer.start(FILE_WATCH_DEBOUNCE_MS)
+        tracker.mark_loaded(list(thread.signatures), thread.signatures)
+
+        results = thread.results
+        reloaded = []
+        old_rockets = self.rockets_info
+        related_changed = False
+        if "launches" in results:
+            inserted, updated, deleted = self.apply_refresh(results["launches"])
+            # build_refresh roketleri ve rampa verisini de okudu
+            tracker.mark_loaded(["rockets", "related"])
+            reloaded.append(f"launches ({len(inserted)} new, {len(updated)} updated, {len(deleted)} removed)")
+        if "rockets" in results:
+            self.rockets_info = results["rockets"]
+            self.backend.set_rockets(self.rockets_info)
+            related_changed = True
+            reloaded.append("rockets")
+        if "related" in results:
+            self.launchpad_names, self.payload_mass, self.launchpad_locations = results["related"]
+            self.load_table_data(self.filtered_df)
+            related_changed = True
+            reloaded.append("launchpads and payloads")
+        if "launch_images" in results:
+            self.launch_images = results["launch_images"]
+            reloaded.append("launch images")
+        for target in ("rockets", "related"):
+            if target in results:
+                path = self.file_targets.path(target)
+                self.loaded_hashes[path] = thread.hashes[path]
+        if self.rockets_info != old_rockets:
+            self.populate_rocket_gallery()
+        images = [target for target in results if target.startswith(file_watch.IMAGE_PREFIX)]
+        for target in images:
+            for rocket_name, image in results[target].items():
+                if rocket_name in self.gallery_image_labels:
+                    pixmap = QPixmap.fromImage(image) if image is not None else self.gallery_pixmap(None)
+                    self.show_gallery_image(self.gallery_image_labels[rocket_name], pixmap)
+        if images:
+            reloaded.append(f"images for {', '.join(target[len(file_watch.IMAGE_PREFIX):] for target in images)}")
+        if related_changed:
+            # Grafik etiketleri roket ve rampa adlarından gelir; önbellekteki görüntüler eskidi
+            self.mark_data_changed()
+            if self.figure.axes:
+                self.show_chart(self.chart_combo.currentText())
+
+        status = []
+        if reloaded:
+            status.append(f"Reloaded {'; '.join(reloaded)} at {time.strftime('%H:%M:%S')}.")
+        if thread.errors:
+            status.append(f"Waiting for complete files: {'; '.join(thread.errors)}")
+        if status:
+            self.file_watch_status_label.setText(" ".join(status))
+
+    def toggle_api_server(self, enabled):
+        if enabled:
+            try:
+                self.api_server = launch_api.LaunchApiServer(launch_api.LaunchApi(), port=launch_api.DEFAULT_PORT).start()
+            except OSError as e:
+                self.api_server = None
+                self.api_status_label.setText(f"Could not start the API: {e}")
+                return
+            self.publish_api_source()
+            self.api_status_label.setText(f"Serving {self.api_server.url}/api/launches")
+        elif getattr(self, 'api_server', None):
+            self.api_server.stop()
+            self.api_server = None
+            self.api_sql_source = None
+            self.api_status_label.setText("")
+
+    def publish_api_source(self):
+        # İstekler API iş parçacıklarında yanıtlanır; arayüz yalnızca veri değişince yeni kaynağı verir
+        if not getattr(self, 'api_server', None):
+            return
+        if self.backend.in_memory:
+            # DataFrame yerinde değiştirilmez, her değişiklikte yenisi atanır; anlık görüntü paylaşılabilir
+            source = launch_backends.PandasBackend()
+            source.df = self.df
+        else:
+            if getattr(self, 'api_sql_source', None) is None:
+                self.api_sql_source = type(self.backend)(self.backend.path)
+                self.api_sql_source.conn = self.backend.sibling_connection()
+            source = self.api_sql_source
+        self.api_server.api.publish(source, self.dataset_version)
+
+    def upsert_launch(self, launch):
+        # Tek satırlık güncelleme: tabloyu ve kartları baştan kurmadan değişen fırlatmayı uygula
+        with perf_metrics.timer("live.upsert"):
+            row_df = prepare_launch_frame(pd.DataFrame([launch_to_row(launch)]))
+            if row_df.empty:
+                return
+            # Canlı satır CSV'de yok; oturum özetleri bu veriyle dosyalara bağlanamaz
+            self.data_matches_files = False
+            if not self.backend.in_memory:
+                self.backend.upsert(row_df)
+                self.mark_data_changed()
+                self.refresh_year_combo()
+                self.filter_data()
+                self.update_stat_cards()
+                return
+            reliability_current = self.reliability_version == self.dataset_version
+            old_rows = self.df[self.df['id'] == row_df['id'].iloc[0]]
+            idx = self.backend.upsert(row_df)[0]
+            self.mark_data_changed()
+            self.extend_reliability(reliability_current, old_rows, row_df)
+
+            was_visible = idx in self.filtered_df.index
+            visible = not self.apply_filters(self.df.loc[[idx]]).empty
+            if was_visible:
+                position = self.filtered_df.index.get_loc(idx)
+                if visible:
+                    self.filtered_df = pd.concat([self.filtered_df.drop(index=idx), self.df.loc[[idx]]]).sort_index()
+                    self.set_table_row(position, self.df.loc[idx])
+                else:
+                    self.filtered_df = self.filtered_df.drop(index=idx)
+                    self.table.removeRow(position)
+            elif visible:
+                position = int(self.filtered_df.index.searchsorted(idx))
+                self.filtered_df = pd.concat([self.filtered_df, self.df.loc[[idx]]]).sort_index()
+                self.table.insertRow(position)
+                self.set_table_row(position, self.df.loc[idx])
+
+            year = str(self.df.loc[idx, 'year'])
+            if self.year_combo.findText(year) == -1:
+                years = [self.year_combo.itemText(i) for i in range(1, self.year_combo.count())]
+                self.year_combo.insertItem(1 + sum(1 for y in years if int(y) < int(year)), year)
+
+            self.update_stat_cards()
+
+    def closeEvent(self, event):
+        if getattr(self, 'live_poller', None):
+            self.live_poller.stop()
+            self.live_poller.wait()
+        if getattr(self, 'update_thread', None) and self.update_thread.isRunning():
+            # Yarım kalan güncelleme bir sonraki açılışta devam eder
+            self.update_thread.cancel()
+            self.update_thread.wait()
+        if getattr(self, 'snapshot_thread', None):
+            self.snapshot_thread.wait()
+        self.file_watch_timer.stop()
+        if getattr(self, 'file_reload_thread', None):
+            self.file_reload_thread.wait()
+        if getattr(self, 'api_server', None):
+            self.api_server.stop()
+        if SESSION_DIR:
+            self.save_session()
+        self.backend.close()
+        super().closeEvent(event)
+
+    def create_auto_refresh_panel(self):
+        refresh_frame = QFrame()
+        refresh_frame.setObjectName("StatCard")
+        refresh_layout = QVBoxLayout(refresh_frame)
+
+        refresh_title = QLabel("Auto Refresh")
+        refresh_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #c9d1d9; margin-bottom: 10px;")
+
+        refresh_desc = QLabel("Run the update in the background on a schedule, more often when a launch is less than a day away. "
+                              "New data replaces the old in one step without dialogs; nothing runs during quiet hours unless a launch window is open.")
+        refresh_desc.setWordWrap(True)
+        refresh_desc.setStyleSheet("color: #8b949e; margin-bottom: 10px;")
+
+        settings = self.refresh_settings
+        self.auto_refresh_checkbox = QCheckBox("Enable scheduled refresh")
+        self.auto_refresh_checkbox.setStyleSheet("color: #c9d1d9; font-weight: bold;")
+        self.auto_refresh_checkbox.setChecked(settings["enabled"])
+
+        self.refresh_interval_spin = QSpinBox()
+        self.refresh_interval_spin.setRange(15, 24 * 60)
+        self.refresh_interval_spin.setSingleStep(15)
+        self.refresh_interval_spin.setSuffix(" min")
+        self.refresh_interval_spin.setValue(settings["interval_minutes"])
+        self.near_launch_spin = QSpinBox()
+        self.near_launch_spin.setRange(5, 24 * 60)
+        self.near_launch_spin.setSingleStep(5)
+        self.near_launch_spin.setSuffix(" min")
+        self.near_launch_spin.setValue(settings["near_launch_minutes"])
+        self.quiet_start_edit = QTimeEdit(QTime.fromString(settings["quiet_start"], "HH:mm"))
+        self.quiet_start_edit.setDisplayFormat("HH:mm")
+        self.quiet_end_edit = QTimeEdit(QTime.fromString(settings["quiet_end"], "HH:mm"))
+        self.quiet_end_edit.setDisplayFormat("HH:mm")
+
+        options_layout = QGridLayout()
+        for row, (text, widget) in enumerate([("Every", self.refresh_interval_spin),
+                                              ("Near a launch, every", self.near_launch_spin),
+                                              ("Quiet hours from", self.quiet_start_edit),
+                                              ("Quiet hours until", self.quiet_end_edit)]):
+            label = QLabel(text)
+            label.setStyleSheet("color: #c9d1d9;")
+            options_layout.addWidget(label, row, 0)
+            options_layout.addWidget(widget, row, 1)
+
+        self.auto_refresh_status_label = QLabel("")
+        self.auto_refresh_status_label.setStyleSheet("color: #8b949e;")
+
+        self.auto_refresh_checkbox.toggled.connect(self.save_refresh_settings)
+        self.refresh_interval_spin.valueChanged.connect(self.save_refresh_settings)
+        self.near_launch_spin.valueChanged.connect(self.save_refresh_settings)
+        self.quiet_start_edit.timeChanged.connect(self.save_refresh_settings)
+        self.quiet_end_edit.timeChanged.connect(self.save_refresh_settings)
+
+        refresh_layout.addWidget(refresh_title)
+        refresh_layout.addWidget(refresh_desc)
+        refresh_layout.addWidget(self.auto_refresh_checkbox)
+        refresh_layout.addLayout(options_layout)
+        refresh_layout.addWidget(self.auto_refresh_status_label)
+        return refresh_frame
+
+    def save_refresh_settings(self, *args):
+        self.refresh_settings.update({
+            "enabled": self.auto_refresh_checkbox.isChecked(),
+            "interval_minutes": self.refresh_interval_spin.value(),
+            "near_launch_minutes": self.near_launch_spin.value(),
+            "quiet_start": self.quiet_start_edit.time().toString("HH:mm"),
+            "quiet_end": self.quiet_end_edit.time().toString("HH:mm"),
+        })
+        refresh_schedule.save_settings(self.refresh_settings)
+        if self.refresh_settings["enabled"]:
+            self.schedule_auto_refresh()
+        else:
+            self.auto_refresh_timer.stop()
+            self.auto_refresh_status_label.setText("Scheduled refresh is off.")
+
+    def schedule_auto_refresh(self, next_launch=None, failed=False):
+        if self.backend.name == "shared":
+            # Zamanlamayı aynı ayar dosyasından veri servisi yürütür; her pencere ayrıca istek atmaz
+            self.auto_refresh_status_label.setText("Scheduled refreshes are run by the data service.")
+            return
+        if next_launch is not None:
+            self.next_launch = next_launch
+        delay = refresh_schedule.next_refresh_delay(self.refresh_settings, next_launch=self.next_launch,
+                                                    last_refresh=self.refresh_settings["last_refresh"], failed=failed)
+        # QTimer milisaniyeyi 32 bit tutar; uzun beklemeler ara uyanışlarla yeniden hesaplanır
+        self.auto_refresh_due = time.time() + delay
+        self.auto_refresh_timer.start(min(delay, 24 * 3600) * 1000)
+        self.auto_refresh_status_label.setText(f"Next refresh at {time.strftime('%a %H:%M', time.localtime(self.auto_refresh_due))}")
+
+    def run_scheduled_refresh(self):
+        if not self.refresh_settings["enabled"]:
+            return
+        if time.time() < self.auto_refresh_due - 1:
+            self.schedule_auto_refresh()
+            return
+        if not self.start_update_process(scheduled=True):
+            # Elle başlatılmış bir güncelleme sürüyor; bitince zamanlama yeniden kurulur
+            return
+        self.auto_refresh_status_label.setText(f"Refreshing in the background (started {time.strftime('%H:%M')})...")
+
+    def start_update_process(self, scheduled=False):
+        if self.backend.name == "shared":
+            # API ve görseller yalnızca veri servisinde güncellenir; yeni sürüm sayaçla gelir
+            self.backend.request_refresh()
+            self.update_status_label.setText(f"Update requested from the data service at {time.strftime('%H:%M')}.")
+            return True
+        if getattr(self, 'update_thread', None) and self.update_thread.isRunning():
+            return False
+        if getattr(self, 'file_reload_thread', None):
+            # Aynı hazırlık tablosunu iki iş parçacığı kurmasın; sonucu file_reload_finished atar
+            self.file_reload_thread.wait()
         self.update_btn.setEnabled(False)
+        self.cancel_update_btn.setEnabled(True)
+        self.cancel_update_btn.setVisible(True)
         self.progress_bar.setVisible(True)
         self.progress_label.setVisible(True)
         
-        self.update_thread = UpdateThread()
+        self.update_thread = UpdateThread(self.backend, self.filter_state(), scheduled=scheduled)
         self.update_thread.progress.connect(self.update_progress)
         self.update_thread.finished.connect(self.update_finished)
         self.update_thread.start()
+        return True
+
+    def check_shared_version(self):
+        if self.snapshot_thread is not None and self.snapshot_thread.isRunning():
+            return
+        latest = self.backend.latest_version()
+        if latest is None or latest == self.backend.version:
+            return
+        self.snapshot_thread = SnapshotThread(self.backend, self.filter_state())
+        self.snapshot_thread.ready.connect(self.shared_snapshot_ready)
+        self.snapshot_thread.start()
+
+    def shared_snapshot_ready(self):
+        thread = self.snapshot_thread
+        if thread.refresh is None:
+            # Yayın sırasında eski sürüm silinmiş olabilir; bir sonraki turda yeniden denenir
+            self.update_status_label.setText(f"Could not open the shared dataset: {thread.error}")
+            return
+        inserted, updated, deleted = self.apply_refresh(thread.refresh)
+        self.update_status_label.setText(
+            f"Data service version {self.backend.version} at {time.strftime('%H:%M')}: "
+            f"{len(inserted)} new, {len(updated)} updated, {len(deleted)} removed launches.")
+
+    def cancel_update_process(self):
+        # Çalışan adım sonlandırılır; tamamlanan adımlar günlükte kalır
+        self.cancel_update_btn.setEnabled(False)
+        self.progress_label.setText("Cancelling update...")
+        self.update_thread.cancel()
 
     def update_progress(self, value, message):
         self.progress_bar.setValue(value)
@@ -686,58 +1760,156 @@ class SpaceXGUI(QMainWindow):
     def update_finished(self, success, message):
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
+        self.cancel_update_btn.setVisible(False)
         self.update_btn.setEnabled(True)
+        thread = self.update_thread
         
         if success:
-            QMessageBox.information(self, "Success", message)
-            self.reload_data()
+            inserted, updated, deleted = self.apply_refresh(thread.refresh)
+            # Güncellemenin yazdığı veri dosyaları yüklendi; izleyici bunları tekrar okumaz.
+            # İndirilen roket görselleri ise izleyici üzerinden galeriye yansır
+            self.file_change_tracker.mark_loaded(list(file_watch.DATASETS.values()))
+            self.refresh_settings["last_refresh"] = time.time()
+            refresh_schedule.save_settings(self.refresh_settings)
+            self.update_status_label.setText(
+                f"{message} Last update {time.strftime('%H:%M')}: "
+                f"{len(inserted)} new, {len(updated)} updated, {len(deleted)} removed launches.")
+        elif thread.scheduled:
+            # Duvar ekranı modunda modal pencere yok; hata durum satırında gösterilir
+            self.update_status_label.setText(f"Scheduled update failed at {time.strftime('%H:%M')}: {message}")
         else:
             QMessageBox.critical(self, "Error", message)
+        if thread.scheduled or self.refresh_settings["enabled"]:
+            self.schedule_auto_refresh(next_launch=thread.next_launch, failed=not success)
 
+    @perf_metrics.timed("reload_data")
     def reload_data(self):
-        # Veriyi yeniden yükle
-        self.df = pd.read_csv('data/spacex_launches.csv')
-        self.df['date_utc'] = pd.to_datetime(self.df['date_utc'], errors='coerce')
-        self.df = self.df.dropna(subset=['date_utc'])
-        self.df['year'] = self.df['date_utc'].dt.year
-        self.load_rocket_info()
+        # Veriyi yeniden yükle; yalnızca değişen fırlatmalar tabloya, kartlara ve grafiğe yansıtılır
+        return self.apply_refresh(build_refresh(self.backend, self.filter_state()))
+
+    def apply_refresh(self, refresh):
+        """Swap a dataset prepared by build_refresh into the UI; returns (inserted, updated, deleted) ids."""
+        # Tek olay döngüsü adımında takas: ara durum hiç çizilmez
+        with perf_metrics.timer("refresh.swap"):
+            self.table.setUpdatesEnabled(False)
+            try:
+                return self._apply_refresh(refresh)
+            finally:
+                self.table.setUpdatesEnabled(True)
+
+    def _apply_refresh(self, refresh):
+        old_df = self.df
+        reliability_current = self.reliability_version == self.dataset_version
+        # Filtreler hazırlık sırasında değiştiyse önceden süzülmüş kare kullanılamaz
+        filtered_df = refresh["filtered_df"] if refresh["filters"] == self.filter_state() else None
+        if self.backend.in_memory:
+            self.df = refresh["df"]
+            if "shared_version" in refresh:
+                self.backend.version = refresh["shared_version"]
+            diff = refresh["diff"]
+            if refresh["base_df"] is not old_df and old_df['id'].is_unique and self.df['id'].is_unique:
+                # Hazırlık sırasında canlı mod bir satır ekledi; farkı güncel veriye göre yeniden çıkar
+                diff = diff_launches(old_df, self.df)
+                filtered_df = None
+        else:
+            self.backend.commit_reload(LAUNCHES_CSV)
+            self.mark_data_changed()
+            diff = refresh["diff"]
+        self.loaded_hashes = refresh["hashes"]
+        self.data_matches_files = True
+        old_related = (self.launchpad_names, self.payload_mass, self.launchpad_locations)
+        self.rockets_info = refresh["rockets_info"]
+        self.backend.set_rockets(self.rockets_info)
+        self.launchpad_names = refresh["launchpad_names"]
+        self.payload_mass = refresh["payload_mass"]
+        self.launchpad_locations = refresh["launchpad_locations"]
         self.load_launch_images_db() # Fırlatma resim veritabanını yükle
-        self.filtered_df = self.df.copy() # Filtrelenmiş DataFrame için
-        
-        # Tabloyu yenile
-        self.load_table_data()
-        
-        # İstatistik kartlarını yenile
-        # (Bu kısım için kartları silip yeniden oluşturmak en temiz yol)
-        for i in reversed(range(self.stats_layout.count())): 
-            self.stats_layout.itemAt(i).widget().setParent(None)
-        self.create_stat_cards(self.stats_layout)
-        
-        # Filtreleri sıfırla
-        self.search_box.clear()
-        self.year_combo.setCurrentIndex(0)
-        self.success_combo.setCurrentIndex(0)
 
-        QMessageBox.information(self, "Reloaded", "Application data has been reloaded.")
+        if not self.backend.in_memory:
+            # Fark SQL tarafında hesaplandı; görünen sayfa da hazırlık sırasında sorgulandı
+            inserted, updated, deleted = diff
+            self.refresh_year_combo()
+            if filtered_df is None:
+                self.filter_data()
+            else:
+                self.filtered_df = filtered_df
+                self.load_table_data(self.filtered_df)
+        elif diff is not None:
+            inserted, updated, deleted = diff
+            self.apply_launch_diff(old_df, updated, filtered_df)
+            if not deleted:
+                self.extend_reliability(reliability_current, old_df[old_df['id'].isin(updated)],
+                                        self.df[self.df['id'].isin(inserted + updated)])
+        else:
+            # Yinelenen kimliklerle anahtarlı fark çıkarılamaz; tam yenileme
+            inserted, updated, deleted = list(self.df['id']), [], list(old_df['id'])
+            self.refresh_year_combo()
+            self.filter_data()
+
+        if old_related != (self.launchpad_names, self.payload_mass, self.launchpad_locations):
+            # Rampa adları, konumları veya yük kütleleri değişti; görünen satırları yeniden yaz
+            self.load_table_data(self.filtered_df)
+            if not (inserted or updated or deleted):
+                # Grafik etiketleri ve harita konumları değişti; önbellekteki görüntüler eskidi
+                self.mark_data_changed()
+                if self.figure.axes:
+                    self.show_chart(self.chart_combo.currentText())
+
+        if inserted or updated or deleted:
+            self.update_stat_cards()
+            if self.figure.axes:
+                self.show_chart(self.chart_combo.currentText())
+        self.memory_ledger.enforce()
+        return inserted, updated, deleted
+
+    def apply_launch_diff(self, old_df, updated, filtered_df=None):
+        scroll_value = self.table.verticalScrollBar().value()
+        old_visible = list(self.filtered_df['id'])
+
+        self.refresh_year_combo()
+        self.filtered_df = self.apply_filters(self.df) if filtered_df is None else filtered_df
+        new_visible = list(self.filtered_df['id'])
+
+        new_set = set(new_visible)
+        old_set = set(old_visible)
+        kept_old_order = [launch_id for launch_id in old_visible if launch_id in new_set]
+        kept_new_order = [launch_id for launch_id in new_visible if launch_id in old_set]
+        changed_rows = len(old_set - new_set) + len(new_set - old_set)
+
+        # Sıra değiştiyse ya da değişiklik çoksa satır satır uğraşmak yerine tabloyu yeniden kur
+        if kept_old_order != kept_new_order or changed_rows > max(100, len(new_visible) // 2):
+            self.load_table_data(self.filtered_df)
+        else:
+            for position in reversed([i for i, launch_id in enumerate(old_visible) if launch_id not in new_set]):
+                self.table.removeRow(position)
+            rows_by_id = self.filtered_df.set_index('id', drop=False)
+            for position, launch_id in enumerate(new_visible):
+                if launch_id not in old_set:
+                    self.table.insertRow(position)
+                    self.set_table_row(position, rows_by_id.loc[launch_id])
+            positions = {launch_id: i for i, launch_id in enumerate(new_visible)}
+            for launch_id in updated:
+                if launch_id in positions:
+                    self.set_table_row(positions[launch_id], rows_by_id.loc[launch_id])
+
+        self.table.verticalScrollBar().setValue(scroll_value)
+
+    def refresh_year_combo(self):
+        # Seçili yılı koruyarak yıl listesini güncelle
+        current = self.year_combo.currentText()
+        years = [str(year) for year in self.backend.years()]
+        if current != "All" and current not in years:
+            years.append(current)
+            years.sort()
+        self.year_combo.blockSignals(True)
+        self.year_combo.clear()
+        self.year_combo.addItem("All")
+        self.year_combo.addItems(years)
+        self.year_combo.setCurrentIndex(self.year_combo.findText(current))
+        self.year_combo.blockSignals(False)
 
     def get_rocket_image_path(self, rocket_name):
-        rocket_folder = f"assets/images/{rocket_name.replace(' ', '_')}"
-        if os.path.exists(rocket_folder):
-            # Özel dosya isimleri için kontrol
-            if rocket_name == "Falcon 1":
-                specific_file = os.path.join(rocket_folder, "UserView-1.jpg")
-                if os.path.exists(specific_file):
-                    return specific_file
-            elif rocket_name == "Falcon 9":
-                specific_file = os.path.join(rocket_folder, "image_6.jpg")
-                if os.path.exists(specific_file):
-                    return specific_file
-            
-            # Genel dosya arama (fallback)
-            for file in os.listdir(rocket_folder):
-                if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    return os.path.join(rocket_folder, file)
-        return None
+        return find_rocket_image(rocket_name)
 
     def on_pick(self, event):
         artist = event.artist
@@ -771,82 +1943,221 @@ class SpaceXGUI(QMainWindow):
                 if index != -1:
                     self.success_combo.setCurrentIndex(index)
                     QMessageBox.information(self, "Filter Applied", f"Table filtered for {status} launches.")
-        
+
+        # Fırlatma takvimi: hücre (yılın günü, yıl) -> o günün fırlatmaları
+        elif artist.get_gid() == 'calendar_heatmap':
+            mouse = event.mouseevent
+            if mouse.xdata is None or mouse.ydata is None:
+                return
+            year = int(round(mouse.ydata))
+            date = datetime.date(year, 1, 1) + datetime.timedelta(days=int(round(mouse.xdata)) - 1)
+            if date.year != year:
+                return
+            self.tabs.setCurrentIndex(0)
+            self.set_date_filter(date.isoformat())
+            QMessageBox.information(self, "Filter Applied", f"Table filtered for launches on {date.isoformat()} (UTC).")
+
+        # Rampa haritası: kümedeki rampalar tabloya filtre olarak uygulanır
+        elif artist.get_gid() == 'launchpad_map':
+            view = self.chart_pick_data
+            if not isinstance(view, launch_map.MapView) or not len(event.ind):
+                return
+            launchpads = view.pads_at(event.ind[:1])
+            self.tabs.setCurrentIndex(0)
+            self.set_launchpad_filter(launchpads)
+            names = ", ".join(str(self.launchpad_names.get(pad, pad)) for pad in launchpads)
+            QMessageBox.information(self, "Filter Applied", f"Table filtered for launches from {names}.")
+
+        # Dönüş süresi grafikleri: hücre bilgisi grafiğin altında gösterilir
+        elif str(artist.get_gid()).startswith('turnaround_'):
+            mouse = event.mouseevent
+            data = self.chart_pick_data
+            if mouse.xdata is None or mouse.ydata is None or not data:
+                return
+            column, row = int(mouse.xdata), int(round(mouse.ydata))
+            if 0 <= row < len(data['group_ids']) and 0 <= column < len(data['edges']) - 1:
+                upper = "∞" if column == len(data['edges']) - 2 else f"{data['edges'][column + 1]:g}"
+                self.chart_info_label.setText(
+                    f"{data['row_labels'][row]}: {int(data['counts'][row, column])} turnarounds of "
+                    f"{data['edges'][column]:g}–{upper} days")
+
+    @perf_metrics.timed("show_chart")
     def show_chart(self, chart_type):
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        ax.set_facecolor('#161b22')
-        [t.set_color('#8b949e') for t in ax.get_xticklabels()]
-        [t.set_color('#8b949e') for t in ax.get_yticklabels()]
-        ax.xaxis.label.set_color('#8b949e')
-        ax.yaxis.label.set_color('#8b949e')
-        ax.title.set_color('#c9d1d9')
+        self.chart_generation += 1
+        key = self.chart_cache_key(chart_type)
+        region = self.chart_cache.get(key)
+        if region is not None:
+            # Önbellekteki görüntü hemen gösterilir; tıklanabilir öğeler bir sonraki turda yeniden kurulur.
+            # Yeniden kurulum (toplamlar ve öğeler) GUI iş parçacığında çalışır, yalnızca tuval çizimi atlanır
+            self.canvas.restore_region(region)
+            self.canvas.update()
+            generation = self.chart_generation
+            QTimer.singleShot(0, lambda: self.rebuild_chart_artists(chart_type, generation))
+            return
 
+        # Grafik tanımları launch_charts modülünde; rapor oluşturucu da aynı tanımları kullanır
+        self.draw_chart_artists(chart_type)
+        self.canvas.draw()
+        width, height = self.canvas.get_width_height(physical=True)
+        self.chart_cache.put(key, self.canvas.copy_from_bbox(self.figure.bbox), width * height * 4)
+        self.memory_ledger.enforce()
+
+    def draw_chart_artists(self, chart_type):
+        data = launch_charts.draw_chart(self.figure, chart_type, self.chart_source, self.chart_labels())
+        self.chart_pick_data = data
+        self.chart_info_label.setText("")
+        if isinstance(data, launch_map.MapView):
+            self.chart_info_label.setText("Scroll to zoom, drag to pan, click a cluster to filter the table by its launchpads.")
         if chart_type == "Launches per Year":
-            self.launch_counts_for_chart = self.df['year'].value_counts().sort_index()
-            bars = self.launch_counts_for_chart.plot(kind='bar', ax=ax, color='#3a86ff')
-            
-            # Her bir bar'ı tıklanabilir yap
-            for bar in bars.patches:
-                bar.set_picker(True)
+            self.launch_counts_for_chart = data
 
-            ax.set_title('Launches per Year', pad=20, fontsize=16, color="#c9d1d9")
-            ax.set_xlabel('Year', labelpad=15, color="#8b949e")
-            ax.set_ylabel('Number of Launches', labelpad=15, color="#8b949e")
-            
-        elif chart_type == "Success/Failure Distribution":
-            success_counts = self.df['success'].value_counts()
-            labels = ['Successful' if success_counts.index[i] else 'Failed' for i in range(len(success_counts))]
-            colors = ['#1d914b' if 'Success' in l else '#c93c37' for l in labels]
-            wedges, texts, autotexts = ax.pie(success_counts, labels=labels, autopct='%1.1f%%', startangle=140, colors=colors, 
-                   wedgeprops=dict(width=0.4, edgecolor='w'))
-            
-            # Tıklama için ID ata
-            for i, wedge in enumerate(wedges):
-                wedge.set_picker(True)
-                if 'Success' in labels[i]:
-                    wedge.set_gid('success_wedge')
-                else:
-                    wedge.set_gid('failure_wedge')
+    def reliability_stats(self):
+        """The reliability engine for the current dataset (rebuilt only when it could not be extended)."""
+        if self.reliability_version != self.dataset_version:
+            with perf_metrics.timer("reliability.rebuild"):
+                self.reliability_engine.rebuild(self.backend.launch_columns())
+            self.reliability_version = self.dataset_version
+        return self.reliability_engine
 
-            ax.set_title('Success vs. Failure Distribution', pad=20, fontsize=16, color="#c9d1d9")
-            ax.axis('equal')
+    def launch_timelines(self):
+        """The timeline store next to the launch CSV, reloaded only when the file changed."""
+        path = launch_timeline.path_for(LAUNCHES_CSV)
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+        if self.timeline_store is None or signature != self.timeline_signature:
+            with perf_metrics.timer("timelines.load"):
+                self.timeline_store = launch_timeline.load(path)
+            self.timeline_signature = signature
+        return self.timeline_store
 
-        elif chart_type == "Success Rate by Year":
-            yearly_success = self.df.groupby('year')['success'].mean() * 100
-            yearly_success.plot(kind='line', marker='o', color='#3a86ff', ax=ax)
-            ax.set_title('Success Rate by Year (%)', pad=20, fontsize=16, color="#c9d1d9")
-            ax.set_xlabel('Year', labelpad=15, color="#8b949e")
-            ax.set_ylabel('Success Rate (%)', labelpad=15, color="#8b949e")
-            ax.set_ylim(0, 100)
+    def extend_reliability(self, was_current, old_rows, new_rows):
+        # Yeni sonuçlar motora eklenir; bilinen bir sonuç değiştiyse bir sonraki kullanımda yeniden kurulur
+        if not was_current:
+            return
+        fields = ['date_utc', 'success', 'rocket', 'launchpad']
+        old = old_rows.drop_duplicates('id').set_index('id')[fields]
+        new = new_rows.drop_duplicates('id').set_index('id')[fields]
+        common = new.index.intersection(old.index)
+        same = ((old.loc[common] == new.loc[common]) | (old.loc[common].isna() & new.loc[common].isna())).all(axis=1)
+        changed = new.drop(index=common[same.to_numpy()])
+        if old.loc[changed.index.intersection(old.index), 'success'].notna().any():
+            return
+        with perf_metrics.timer("reliability.append"):
+            columns = launch_backends.launch_columns_frame(changed['date_utc'], changed['success'],
+                                                           changed['rocket'], changed['launchpad'])
+            if self.reliability_engine.append(columns):
+                self.reliability_version = self.dataset_version
 
-        ax.grid(True, linestyle='--', alpha=0.2)
-        self.figure.tight_layout()
-        self.canvas.draw()
+    def launch_reliability(self, launch_data):
+        engine = self.reliability_stats()
+        return {"rocket": engine.summary("rocket", launch_data['rocket']),
+                "launchpad": engine.summary("launchpad", launch_data['launchpad'])}
+
+    def chart_labels(self):
+        return {"launchpad": self.launchpad_names, "launchpad_location": self.launchpad_locations,
+                "rocket": {rocket['id']: rocket.get('name', rocket['id']) for rocket in self.rockets_info}}
+
+    def rebuild_chart_artists(self, chart_type, generation):
+        # Arada başka bir grafik seçildiyse bu yeniden kurulum geçersiz
+        if generation != self.chart_generation:
+            return
+        with perf_metrics.timer("show_chart.rebuild"):
+            self.draw_chart_artists(chart_type)
+        if self.drawn_generation == generation:
+            # Görüntü gösterildikten sonra tuval eski öğelerle yeniden çizildi (ör. boyut değişimi)
+            self.canvas.draw_idle()
+
+    def map_view(self, event):
+        view = self.chart_pick_data
+        if isinstance(view, launch_map.MapView) and event.inaxes is view.ax:
+            return view
+        return None
 
+    def on_map_scroll(self, event):
+        view = self.map_view(event)
+        if view is None:
+            return
+        with perf_metrics.timer("map.redraw"):
+            view.zoom(event.xdata, event.ydata, MAP_ZOOM_STEP if event.button == 'up' else 1 / MAP_ZOOM_STEP)
+        self.canvas.draw_idle()
+
+    def on_map_press(self, event):
+        view = self.map_view(event)
+        # Kümeye tıklama filtre uygular (on_pick); kaydırma yalnızca boş alanda başlar
+        if view is None or event.button != 1 or view.scatter.contains(event)[0]:
+            return
+        self.map_drag = (event.x, event.y)
+
+    def on_map_drag(self, event):
+        view = self.chart_pick_data
+        if self.map_drag is None or not isinstance(view, launch_map.MapView):
+            return
+        # Piksel farkı veri koordinatlarına çevrilir; ekseni terk eden fare de kaydırmaya devam eder
+        inverse = view.ax.transData.inverted()
+        (x0, y0), (x1, y1) = inverse.transform([self.map_drag, (event.x, event.y)])
+        self.map_drag = (event.x, event.y)
+        with perf_metrics.timer("map.redraw"):
+            view.pan(x1 - x0, y1 - y0)
+        self.canvas.draw_idle()
+
+    def on_map_release(self, event):
+        self.map_drag = None
+
+    def on_chart_drawn(self, event):
+        self.drawn_generation = self.chart_generation
+
+    def chart_cache_key(self, chart_type):
+        # Grafikler tablo filtrelerinden bağımsız, tüm veri kümesini gösterir
+        width, height = self.canvas.get_width_height(physical=True)
+        if self.data_matches_files:
+            # Aynı içerikli dosyalar yeniden yüklendiğinde önbellekteki görüntüler yine eşleşir
+            dataset = ("files", tuple(sorted(self.loaded_hashes.items())))
+        else:
+            # Canlı satırlar dosyalarda yok; oturum içi sürüm sayacı kullanılır
+            dataset = ("version", self.dataset_version)
+        return (self.backend.name, dataset, chart_type, launch_charts.THEME, width, height, self.figure.dpi)
+
+    @perf_metrics.timed("load_table_data")
     def load_table_data(self, filtered_df=None):
         if filtered_df is None:
             filtered_df = self.df
         
-        columns = ['name', 'date_utc', 'flight_number', 'success', 'rocket', 'launchpad']
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(['Mission Name', 'Date', 'Flight No', 'Success', 'Rocket ID', 'Launchpad ID'])
-        
+        self.setup_table_columns()
         self.table.setRowCount(len(filtered_df))
         for i, (idx, row) in enumerate(filtered_df.iterrows()):
-            self.table.setItem(i, 0, QTableWidgetItem(str(row['name'])))
-            self.table.setItem(i, 1, QTableWidgetItem(str(row['date_utc'].date())))
-            self.table.setItem(i, 2, QTableWidgetItem(str(row['flight_number'])))
-            
-            success_item = QTableWidgetItem("✅" if row['success'] else "❌")
-            success_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(i, 3, success_item)
-            
-            self.table.setItem(i, 4, QTableWidgetItem(str(row['rocket'])))
-            self.table.setItem(i, 5, QTableWidgetItem(str(row['launchpad'])))
+            self.set_table_row(i, row)
         
         self.table.resizeColumnsToContents()
+
+    def setup_table_columns(self):
+        self.table.setColumnCount(len(TABLE_HEADERS))
+        self.table.setHorizontalHeaderLabels(TABLE_HEADERS)
+
+    def set_table_row(self, i, row):
+        self.set_table_texts(i, self.row_texts(row))
+
+    def row_texts(self, row):
+        mass = self.payload_mass.get(row['id'])
+        return [
+            str(row['name']),
+            str(row['date_utc'].date()),
+            str(row['flight_number']),
+            # Bilinmeyen sonuç (yaklaşan fırlatma) NaN; doğruluk değeriyle bakılırsa ✅ görünürdü
+            SUCCESS_LABELS.get(row['success'], "–"),
+            str(row['rocket']),
+            str(self.launchpad_names.get(row['launchpad'], row['launchpad'])),
+            f"{mass:,.0f}" if mass is not None else "",
+        ]
+
+    def set_table_texts(self, i, texts):
+        for column, text in enumerate(texts):
+            item = QTableWidgetItem(text)
+            if column in TABLE_ALIGNMENTS:
+                item.setTextAlignment(TABLE_ALIGNMENTS[column])
+            self.table.setItem(i, column, item)
         
     def show_launch_details(self, item):
         row = item.row()
@@ -854,12 +2165,14 @@ class SpaceXGUI(QMainWindow):
         if row < len(self.filtered_df):
             launch_data = self.filtered_df.iloc[row]
             launch_id = launch_data['id']
-            rocket_id = launch_data['rocket']
             
-            rocket_info = next((r for r in self.rockets_info if r['id'] == rocket_id), None)
+            rocket_info = self.backend.rocket_for_launch(launch_id)
             
             if rocket_info:
-                dialog = RocketDetailDialog(launch_id, rocket_info, self)
+                details = enrich_launches.launch_details(launch_id, launch_data['launchpad'])
+                dialog = RocketDetailDialog(launch_id, rocket_info, self, details, self.launch_reliability(launch_data))
+                # Kapanınca Qt nesnesi ve resimleri hemen bırakılır; ana pencerenin çocuğu olarak kalmaz
+                dialog.setAttribute(Qt.WA_DeleteOnClose)
                 dialog.exec_()
             else:
                 QMessageBox.information(self, "Info", "Rocket information not available for this launch.")
@@ -867,25 +2180,121 @@ class SpaceXGUI(QMainWindow):
             QMessageBox.critical(self, "Error", "Could not retrieve data for the selected row. Please try again.")
         
     def filter_data(self):
-        self.filtered_df = self.df.copy()
+        # Qt slotlarında dekoratör yerine blok zamanlayıcı (sinyal argümanları sarmalayıcıya geçmesin)
+        with perf_metrics.timer("filter_data"):
+            limit = None if self.backend.in_memory else launch_backends.SQL_PAGE_ROWS
+            self.filtered_df = self.backend.query(**self.filter_state(), limit=limit)
+            self.load_table_data(self.filtered_df)
 
-        # Arama filtresi
-        search_term = self.search_box.text().lower()
-        if search_term:
-            self.filtered_df = self.filtered_df[self.filtered_df['name'].str.lower().str.contains(search_term)]
-        
-        # Yıl filtresi
-        if self.year_combo.currentText() != "All":
-            year = int(self.year_combo.currentText())
-            self.filtered_df = self.filtered_df[self.filtered_df['year'] == year]
-        
-        # Başarı filtresi
-        if self.success_combo.currentText() == "Successful":
-            self.filtered_df = self.filtered_df[self.filtered_df['success'] == True]
-        elif self.success_combo.currentText() == "Failed":
-            self.filtered_df = self.filtered_df[self.filtered_df['success'] == False]
-            
-        self.load_table_data(self.filtered_df)
+    def filter_state(self):
+        year = self.year_combo.currentText()
+        success = {"Successful": True, "Failed": False}.get(self.success_combo.currentText())
+        return {
+            "search": self.search_box.text(),
+            "year": int(year) if year not in ("", "All") else None,
+            "success": success,
+            "date": self.date_filter,
+            "launchpad": self.launchpad_filter,
+        }
+
+    def restore_session_view(self):
+        """Apply the saved filters; with unchanged data paint the saved first page and fill the table lazily."""
+        session = self.session
+        if session is None:
+            self.load_table_data()
+            return
+        filters = session.filters
+        for widget in (self.search_box, self.year_combo, self.success_combo):
+            widget.blockSignals(True)
+        self.search_box.setText(filters["search"])
+        if filters["year"] is not None:
+            self.year_combo.setCurrentIndex(max(0, self.year_combo.findText(str(filters["year"]))))
+        self.success_combo.setCurrentText({True: "Successful", False: "Failed"}.get(filters["success"], "All"))
+        for widget in (self.search_box, self.year_combo, self.success_combo):
+            widget.blockSignals(False)
+        self.show_date_filter(filters["date"])
+        self.show_launchpad_filter(filters.get("launchpad"))
+        if not session.valid:
+            self.filter_data()
+            return
+
+        with perf_metrics.timer("session.restore"):
+            if session.filtered_rows is not None:
+                # Süzme indeksi: önceki görünümün satır konumları, filtre yeniden çalıştırılmaz
+                self.filtered_df = self.df.iloc[session.filtered_rows]
+            else:
+                limit = None if self.backend.in_memory else launch_backends.SQL_PAGE_ROWS
+                self.filtered_df = self.backend.query(**self.filter_state(), limit=limit)
+            self.setup_table_columns()
+            self.table.setRowCount(len(self.filtered_df))
+            for i, texts in enumerate(session.state["rows"]):
+                self.set_table_texts(i, texts)
+            self.table.resizeColumnsToContents()
+        # Tablonun geri kalanı pencere çizildikten sonra doldurulur
+        QTimer.singleShot(0, self.finish_session_restore)
+
+    def finish_session_restore(self):
+        session, self.session = self.session, None
+        if session is not None and session.valid:
+            self.load_table_data(self.filtered_df)
+
+    def tab_changed(self, index):
+        # Grafik sekme ilk açıldığında çizilir; açılışta çizim maliyeti ödenmez
+        if self.tabs.widget(index) is self.charts_widget and not self.figure.axes:
+            self.show_chart(self.chart_combo.currentText())
+
+    def save_session(self):
+        # Bellekteki veri dosyalarla aynıysa özetler, ilk sayfa ve süzme indeksi de kaydedilir
+        hashes = session_snapshot.file_hashes(dataset_files())
+        bound = self.data_matches_files and hashes == self.loaded_hashes
+        state = {"backend": self.backend.name, "filters": self.filter_state(),
+                 "tab": self.tabs.currentIndex(), "chart": self.chart_combo.currentText()}
+        frame = filtered_rows = None
+        keep_frame = False
+        if bound:
+            page = self.filtered_df.head(session_snapshot.TABLE_PAGE_ROWS)
+            state.update(stats=self.compute_stats(), years=self.backend.years(),
+                         rows=[self.row_texts(row) for _, row in page.iterrows()])
+            if self.backend.name == "pandas":
+                keep_frame = self.saved_frame_hashes == hashes
+                frame = None if keep_frame else self.df
+                if self.df.index.is_unique:
+                    filtered_rows = self.df.index.get_indexer(self.filtered_df.index)
+        try:
+            with perf_metrics.timer("session.save"):
+                session_snapshot.save(SESSION_DIR, state, hashes if bound else None, frame, keep_frame, filtered_rows)
+                session_snapshot.prune_thumbnails(SESSION_DIR, self.thumbnails_used)
+            self.saved_frame_hashes = hashes if bound and self.backend.name == "pandas" else None
+        except OSError:
+            # Pencere kapanırken gösterilecek yer yok; bir sonraki açılış soğuk olur
+            perf_metrics.count("session.save_failed")
+
+    def show_date_filter(self, date):
+        self.date_filter = date
+        self.date_filter_btn.setText(f"Date: {date}  ✕" if date else "")
+        self.date_filter_btn.setVisible(date is not None)
+
+    def set_date_filter(self, date):
+        self.show_date_filter(date)
+        if date is not None:
+            # Seçili yıl günle çelişmesin
+            self.year_combo.blockSignals(True)
+            self.year_combo.setCurrentIndex(max(0, self.year_combo.findText(date[:4])))
+            self.year_combo.blockSignals(False)
+        self.filter_data()
+
+    def show_launchpad_filter(self, launchpads):
+        self.launchpad_filter = tuple(launchpads) if launchpads else None
+        names = [str(self.launchpad_names.get(pad, pad)) for pad in self.launchpad_filter or ()]
+        self.launchpad_filter_btn.setText(f"Launchpad: {', '.join(names)}  ✕" if names else "")
+        self.launchpad_filter_btn.setVisible(bool(names))
+
+    def set_launchpad_filter(self, launchpads):
+        self.show_launchpad_filter(launchpads)
+        self.filter_data()
+
+    def apply_filters(self, df):
+        return filter_frame(df, **self.filter_state())
         
     def export_data(self):
         # Önce mevcut filtrelenmiş veriyi al
@@ -1,64 +1,66 @@
-import requests
 import csv
 import json
+import os
 from datetime import datetime
 
-# SpaceX resmi API'si
-url = "https://api.spacexdata.com/v4/launches"
+import data_paths
+import launch_schema
+import launch_sources
+import launch_timeline
+from launch_sources import LAUNCH_FIELDS
 
-try:
-    print("SpaceX API'den veri alınıyor...")
-    response = requests.get(url)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # CSV için veri 
-        rows = []
-        for launch in data:
-            
-            row = {
-                "id": launch.get("id", ""),
-                "name": launch.get("name", ""),
-                "flight_number": launch.get("flight_number", ""),
-                "date_utc": launch.get("date_utc", ""),
-                "date_local": launch.get("date_local", ""),
-                "success": launch.get("success", ""),
-                "details": launch.get("details", ""),
-                "rocket": launch.get("rocket", ""),
-                "launchpad": launch.get("launchpad", ""),
-                "upcoming": launch.get("upcoming", ""),
-                "tbd": launch.get("tbd", ""),
-                "net": launch.get("net", ""),
-                "window": launch.get("window", ""),
-                "static_fire_date_utc": launch.get("static_fire_date_utc", ""),
-                "auto_update": launch.get("auto_update", ""),
-                "launch_library_id": launch.get("launch_library_id", ""),
-                "date_precision": launch.get("date_precision", ""),
-                "date_unix": launch.get("date_unix", "")
-            }
-            rows.append(row)
-        
+
+def main():
+    try:
+        # Kaynaklar (data/sources.json; yoksa yalnızca SpaceX API) paralel yüklenip birleştirilir
+        print("Fırlatma kaynakları yükleniyor...")
+        merged, source_stats = launch_sources.ingest()
+        print(f"Birleştirme: {launch_sources.summary(source_stats)}")
+
+        # Zaman çizelgeleri CSV'ye girmez; ayrı sütunsal depoya yazılır
+        timelines = merged.pop(launch_sources.TIMELINE_FIELD)
+
+        # Şemaya uymayan kayıtlar CSV'ye girmez; nedenleriyle karantina dosyasına yazılır
+        clean, quarantined, stats = launch_schema.validate(merged)
+        stats.update(source_stats)
+        rows = merged.drop(index=quarantined.index).to_dict("records")
 
         if rows:
-            with open("../data/spacex_launches.csv", "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+            os.makedirs(data_paths.DATA_DIR, exist_ok=True)
+            launch_schema.write_report(data_paths.LAUNCHES_CSV, quarantined, stats)
+            tmp_path = data_paths.LAUNCHES_CSV + ".tmp"
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=LAUNCH_FIELDS)
                 writer.writeheader()
                 writer.writerows(rows)
-            
+            # Depo CSV'den önce yazılır; CSV değişimini gören okuyucu yeni çizelgeleri bulur
+            epoch = clean["date_utc"].dt.tz_convert(None).to_numpy(dtype="datetime64[s]").astype("int64")
+            store = launch_timeline.TimelineStore.build(clean["id"], epoch, clean["rocket"], clean["launchpad"],
+                                                        timelines.loc[clean.index])
+            store.save(launch_timeline.path_for(data_paths.LAUNCHES_CSV))
+            # Okuyucular yarım yazılmış CSV görmesin
+            os.replace(tmp_path, data_paths.LAUNCHES_CSV)
+
             print(f"spacex_launches.csv oluşturuldu: {len(rows)} fırlatma kaydedildi.")
+            print(f"Doğrulama: {launch_schema.summary(stats)}")
+            print(f"Zaman çizelgeleri: {len(store)} fırlatma, {store.event_count} olay ({len(store.events)} olay adı)")
             print(f"İlk fırlatma: {rows[0]['name']}")
             print(f"Son fırlatma: {rows[-1]['name']}")
         else:
             print("Hiç fırlatma verisi bulunamadı.")
-            
-    else:
-        print(f"API hatası: {response.status_code}")
-        print(f"Hata mesajı: {response.text}")
-        
-except requests.exceptions.RequestException as e:
-    print(f"Bağlantı hatası: {e}")
-except json.JSONDecodeError as e:
-    print(f"JSON çözümleme hatası: {e}")
-except Exception as e:
-    print(f"Beklenmeyen hata: {e}")
+
+    except json.JSONDecodeError as e:
+        # ValueError alt sınıfı; bozuk sources.json kaynak hatasından önce yakalanır
+        print(f"JSON çözümleme hatası: {e}")
+        raise SystemExit(1)
+    except (RuntimeError, ValueError) as e:
+        # Zorunlu kaynak yüklenemedi ya da sources.json hatalı; mevcut CSV korunur
+        print(f"Kaynak hatası: {e}")
+        raise SystemExit(1)
+    except Exception as e:
+        print(f"Beklenmeyen hata: {e}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,128 @@
+import argparse
+import time
+
 import requests
-import json
+
+import spacex_client
 
 # SpaceX API'den en son fırlatma verisi
-url = "https://api.spacexdata.com/v4/launches/latest"
-response = requests.get(url)
-data = response.json()
-
-# Gösterilecek bazı alanlar
-print("Mission Name:", data["name"])
-print("Launch Date:", data["date_utc"])
-print("Details:", data["details"])
-
-# Roket ID'si (ek bilgi almak için)
-print("Rocket ID:", data["rocket"])
-
-# Önce tüm veri anahtarlarını görelim
-print("\nMevcut veri anahtarları:")
-for key in data.keys():
-    print(f"- {key}")
-
-# Timeline'ı kontrol et ve görüntüle
-print("\nTimeline:")
-if "timeline" in data and data["timeline"]:
-    for key, value in data["timeline"].items():
-        print(f"{key} → {value} saniye")
-else:
-    print("Timeline verisi mevcut değil")
-
-# Payload'ları kontrol et ve görüntüle
-print("\nPayloads:")
-if "payloads" in data and data["payloads"]:
-    for payload in data["payloads"]:
-        print(f"Payload ID: {payload}")
-else:
-    print("Payload verisi mevcut değil")
+url = spacex_client.api_url("/v4/launches/latest")
+next_url = spacex_client.api_url("/v4/launches/next")
+
+# Yoklama aralıkları (saniye)
+MIN_INTERVAL = 15
+LAUNCH_WINDOW_INTERVAL = 30
+NEAR_LAUNCH_INTERVAL = 5 * 60
+IDLE_INTERVAL = 30 * 60
+FAR_INTERVAL = 60 * 60
+
+
+def fetch(endpoint, etag=None):
+    """Conditional GET: returns (data, etag); data is None when the server answered 304."""
+    headers = {"If-None-Match": etag} if etag else {}
+    response = spacex_client.get(endpoint, headers=headers)
+    if response.status_code == 304:
+        return None, etag
+    response.raise_for_status()
+    return response.json(), response.headers.get("ETag")
+
+
+def fetch_latest(etag=None):
+    return fetch(url, etag)
+
+
+def fetch_next(etag=None):
+    return fetch(next_url, etag)
+
+
+def poll_interval(next_launch, now=None):
+    """Seconds until the next poll, based on how close the next launch is."""
+    now = time.time() if now is None else now
+    if not next_launch or not next_launch.get("date_unix"):
+        return FAR_INTERVAL
+    # Saat hassasiyeti yoksa tarih henüz kesin değil, sık yoklamaya gerek yok
+    if next_launch.get("date_precision") != "hour":
+        return FAR_INTERVAL if next_launch.get("date_precision") in ("month", "quarter", "half", "year") else IDLE_INTERVAL
+
+    seconds_to_launch = next_launch["date_unix"] - now
+    if -3 * 3600 <= seconds_to_launch <= 3600:
+        interval = LAUNCH_WINDOW_INTERVAL
+    elif seconds_to_launch <= 24 * 3600:
+        interval = NEAR_LAUNCH_INTERVAL
+    else:
+        interval = IDLE_INTERVAL
+    # NET: tarih "en erken" anlamına gelir, kayma ihtimali yüksek
+    if next_launch.get("net") and interval < NEAR_LAUNCH_INTERVAL:
+        interval = NEAR_LAUNCH_INTERVAL
+    return max(MIN_INTERVAL, interval)
+
+
+def print_launch(data):
+    # Gösterilecek bazı alanlar
+    print("Mission Name:", data["name"])
+    print("Launch Date:", data["date_utc"])
+    print("Details:", data["details"])
+
+    # Roket ID'si (ek bilgi almak için)
+    print("Rocket ID:", data["rocket"])
+
+    # Önce tüm veri anahtarlarını görelim
+    print("\nMevcut veri anahtarları:")
+    for key in data.keys():
+        print(f"- {key}")
+
+    # Timeline'ı kontrol et ve görüntüle
+    print("\nTimeline:")
+    if "timeline" in data and data["timeline"]:
+        for key, value in data["timeline"].items():
+            print(f"{key} → {value} saniye")
+    else:
+        print("Timeline verisi mevcut değil")
+
+    # Payload'ları kontrol et ve görüntüle
+    print("\nPayloads:")
+    if "payloads" in data and data["payloads"]:
+        for payload in data["payloads"]:
+            print(f"Payload ID: {payload}")
+    else:
+        print("Payload verisi mevcut değil")
+
+
+def live():
+    latest_etag = next_etag = None
+    next_launch = None
+    while True:
+        try:
+            latest, latest_etag = fetch_latest(latest_etag)
+            upcoming, next_etag = fetch_next(next_etag)
+            if upcoming is not None:
+                next_launch = upcoming
+            if latest is not None:
+                print(f"[{time.strftime('%H:%M:%S')}] Latest: {latest['name']} ({latest['date_utc']}) success={latest.get('success')}")
+            if upcoming is not None:
+                print(f"[{time.strftime('%H:%M:%S')}] Next: {upcoming['name']} ({upcoming['date_utc']}, {upcoming.get('date_precision')})")
+        except requests.exceptions.RequestException as e:
+            print(f"Bağlantı hatası: {e}")
+        interval = poll_interval(next_launch)
+        print(f"  next poll in {interval}s")
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the latest SpaceX launch.")
+    parser.add_argument("--live", action="store_true", help="Keep polling with conditional requests")
+    args = parser.parse_args()
+
+    if args.live:
+        try:
+            live()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    data, _ = fetch_latest()
+    print_launch(data)
+
+
+if __name__ == "__main__":
+    main()
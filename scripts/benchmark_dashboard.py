@@ -0,0 +1,209 @@
+"""Headless benchmarks for the dashboard hot paths on synthetic datasets.
+
+Runs with the offscreen Qt platform and the Agg backend, so it works on CI
+machines without a display:
+
+    python scripts/benchmark_dashboard.py --sizes 1k,100k,1m
+    python scripts/benchmark_dashboard.py --sizes 1k,100k --save-baseline
+
+Every run is appended to data/benchmarks/history.jsonl. Medians slower than the
+stored baseline by more than --threshold are reported as regressions.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import matplotlib
+matplotlib.use("Agg")
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from PyQt5.QtWidgets import QApplication
+
+import generate_launches
+import launch_charts
+
+BENCH_DIR = os.path.join(ROOT_DIR, "data", "benchmarks")
+HISTORY_PATH = os.path.join(BENCH_DIR, "history.jsonl")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+DATASET_DIR = os.path.join(BENCH_DIR, "datasets")
+
+
+def dataset_path(rows, distribution, seed):
+    # Aynı boyut/dağılım/tohum için üretilen veri yeniden kullanılır
+    path = os.path.join(DATASET_DIR, f"launches_{rows}_{distribution}_{seed}.csv")
+    if not os.path.exists(path):
+        print(f"  generating {rows} rows ({distribution}, seed={seed})...")
+        generate_launches.generate(path, rows, distribution, seed)
+    return path
+
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return {"median_ms": statistics.median(timings), "min_ms": min(timings), "runs": repeat}
+
+
+def run_size(window, csv_path, rows, repeat, table_limit):
+    import main
+
+    results = {}
+    main.LAUNCHES_CSV = csv_path
+
+    results["load"] = measure(window.load_launch_data, repeat)
+    window.filtered_df = window.df
+
+    def filter_only():
+        # Sinyalleri kapatıp filtreyi doğrudan çağır; tablo doldurma ayrı ölçülür
+        df = window.df
+        df = df[df["name"].str.lower().str.contains("7")]
+        df = df[df["year"] == df["year"].max()]
+        return df[df["success"] == True]
+
+    results["filter"] = measure(filter_only, repeat)
+    results["sort"] = measure(lambda: window.df.sort_values("date_utc", ascending=False), repeat)
+
+    if rows <= table_limit:
+        results["table_populate"] = measure(lambda: window.load_table_data(window.df), repeat)
+        for widget in (window.search_box, window.year_combo, window.success_combo):
+            widget.blockSignals(True)
+        window.search_box.setText("7")
+        results["filter_and_table"] = measure(window.filter_data, repeat)
+        window.search_box.clear()
+        for widget in (window.search_box, window.year_combo, window.success_combo):
+            widget.blockSignals(False)
+    else:
+        results["table_populate"] = {"skipped": f"rows > table limit ({table_limit})"}
+        results["filter_and_table"] = {"skipped": f"rows > table limit ({table_limit})"}
+
+    for chart_type in launch_charts.CHART_TYPES:
+        key = "chart." + chart_type.lower().replace("/", "_").replace(" ", "_")
+        # Görüntü önbelleği boşaltılır; ölçülen tam çizim süresidir
+        results[key] = measure(lambda: (window.chart_cache.clear(), window.show_chart(chart_type)), repeat)
+    for chart_type in launch_charts.CHART_TYPES:
+        window.show_chart(chart_type)
+    results["chart.cached_switch"] = measure(lambda: [window.show_chart(chart_type) for chart_type in launch_charts.CHART_TYPES], repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export_path = os.path.join(tmp, "export.csv")
+        results["export"] = measure(lambda: window.df.to_csv(export_path, index=False, encoding="utf-8"), repeat)
+
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                       text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def find_regressions(record, baseline, threshold):
+    regressions = []
+    for size, results in record["results"].items():
+        base_results = baseline.get("results", {}).get(size, {})
+        for name, value in results.items():
+            base = base_results.get(name)
+            if "median_ms" not in value or not base or "median_ms" not in base:
+                continue
+            ratio = value["median_ms"] / base["median_ms"] if base["median_ms"] else 1.0
+            if ratio > 1 + threshold:
+                regressions.append((size, name, base["median_ms"], value["median_ms"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless dashboard benchmarks.")
+    parser.add_argument("--sizes", default="1k,10k,100k", help="Comma separated row counts, e.g. 1k,100k,1m,10m")
+    parser.add_argument("--distribution", choices=generate_launches.DISTRIBUTIONS, default="growth")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--table-limit", type=int, default=200000,
+                        help="Skip QTableWidget benchmarks above this many rows")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Relative slowdown against the baseline reported as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    sizes = [generate_launches.parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    os.makedirs(BENCH_DIR, exist_ok=True)
+
+    # Pencere küçük bir veriyle açılır; büyük veri setleri ölçüm sırasında yüklenir
+    app = QApplication.instance() or QApplication(sys.argv)
+    import main as dashboard
+    dashboard.LAUNCHES_CSV = dataset_path(1000, args.distribution, args.seed)
+    # Oturum kaydı ölçümleri etkilemesin ve kullanıcının kaydının üzerine yazılmasın
+    dashboard.SESSION_DIR = None
+    cwd = os.getcwd()
+    os.chdir(ROOT_DIR)
+    try:
+        window = dashboard.SpaceXGUI()
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "distribution": args.distribution,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": {},
+        }
+        for rows in sizes:
+            print(f"Benchmarking {rows} rows...")
+            csv_path = dataset_path(rows, args.distribution, args.seed)
+            record["results"][str(rows)] = run_size(window, csv_path, rows, args.repeat, args.table_limit)
+        window.close()
+    finally:
+        os.chdir(cwd)
+
+    with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+    print(f"\n{'rows':>10}  {'benchmark':<40} {'median ms':>12} {'min ms':>12}")
+    for size, results in record["results"].items():
+        for name, value in results.items():
+            if "median_ms" in value:
+                print(f"{size:>10}  {name:<40} {value['median_ms']:>12.2f} {value['min_ms']:>12.2f}")
+            else:
+                print(f"{size:>10}  {name:<40} {'skipped':>12}")
+
+    exit_code = 0
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+    elif os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(record, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} regression(s) against baseline {baseline.get('revision')}:")
+            for size, name, before, after, ratio in regressions:
+                print(f"  {size:>10} {name:<40} {before:.2f} ms -> {after:.2f} ms ({ratio:.2f}x)")
+            if args.fail_on_regression:
+                exit_code = 1
+        else:
+            print("\nNo regressions against baseline.")
+    print(f"History appended to {HISTORY_PATH}")
+    app.quit()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""LRU cache of rendered chart bitmaps under a memory budget.
+
+Entries are whatever the canvas can blit back (matplotlib BufferRegion from
+copy_from_bbox) together with their size in bytes. Keys are built by the
+caller from everything that changes the pixels: dataset version, chart
+type, theme and canvas pixel size.
+
+The budget defaults to SPACEX_CHART_CACHE_MB (64 MB). The dashboard also
+keeps its scaled rocket and launch images in one of these caches (metric
+"pixmap_cache"), and memory_budget.MemoryLedger shrinks both when the session
+goes over its total budget.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import perf_metrics
+
+DEFAULT_BUDGET_MB = float(os.environ.get("SPACEX_CHART_CACHE_MB", "64"))
+
+
+class ChartBitmapCache:
+    def __init__(self, budget_bytes=None, metric="chart_cache"):
+        self.budget_bytes = int(DEFAULT_BUDGET_MB * 1024 * 1024) if budget_bytes is None else budget_bytes
+        self.metric = metric
+        self.entries = OrderedDict()   # key -> (bitmap, nbytes)
+        self.used_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                perf_metrics.count(self.metric + ".miss")
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            perf_metrics.count(self.metric + ".hit")
+            return entry[0]
+
+    def put(self, key, bitmap, nbytes):
+        with self._lock:
+            if nbytes > self.budget_bytes:
+                return
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.used_bytes -= old[1]
+            self.entries[key] = (bitmap, nbytes)
+            self.used_bytes += nbytes
+            self._evict_to(self.budget_bytes)
+
+    def shrink(self, target_bytes):
+        """Evict least recently used entries until at most target_bytes are held."""
+        with self._lock:
+            self._evict_to(target_bytes)
+
+    def _evict_to(self, target_bytes):
+        # En uzun süredir kullanılmayan görüntüler hedefe sığana kadar atılır
+        while self.used_bytes > target_bytes and self.entries:
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.used_bytes -= evicted_bytes
+            self.evictions += 1
+            perf_metrics.count(self.metric + ".evict")
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.used_bytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        return {"entries": len(self.entries), "used_bytes": self.used_bytes, "budget_bytes": self.budget_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
@@ -0,0 +1,149 @@
+"""Check that every data backend returns the same results as the pandas backend.
+
+    python scripts/check_backend_parity.py --csv data/spacex_launches.csv
+    python scripts/check_backend_parity.py --rows 50000   # synthetic dataset
+
+Exits with status 1 when any filter, aggregate, launch column, rocket lookup or live
+upsert differs.
+"""
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+import launch_backends
+
+
+def normalise(df):
+    # Sütun tipleri arka uca göre değişebilir; değerleri karşılaştırılabilir hale getir
+    df = df.reset_index(drop=True).copy()
+    for column in df.columns:
+        if column == 'date_utc':
+            df[column] = pd.to_datetime(df[column], utc=True).dt.strftime("%Y-%m-%dT%H:%M:%S")
+        else:
+            df[column] = df[column].map(lambda v: None if pd.isna(v) else str(v))
+    return df
+
+
+def compare(label, expected, actual, failures):
+    try:
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(normalise(expected), normalise(actual), check_dtype=False)
+        elif isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(expected.sort_index().astype(float), actual.sort_index().astype(float),
+                                           check_dtype=False, check_names=False, check_index_type=False)
+        else:
+            assert expected == actual, f"{expected!r} != {actual!r}"
+    except AssertionError as e:
+        failures.append(f"{label}: {e}")
+
+
+def check(csv_path, rockets_info, backend_names):
+    reference = launch_backends.PandasBackend()
+    reference.load(csv_path)
+    reference.set_rockets(rockets_info)
+
+    years = reference.years()
+    names = reference.df['name'].astype(str).tolist()
+    searches = ["", names[0][:3].lower() if names else "a", "zzz-no-match"]
+    year_options = [None] + years[:1] + years[-1:]
+    success_options = [None, True, False]
+    launch_ids = reference.df['id'].head(5).tolist()
+
+    failures = {}
+    for name in backend_names:
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = launch_backends.BACKENDS[name](os.path.join(tmp, "launches" + launch_backends.BACKENDS[name].extension))
+            backend.load(csv_path)
+            backend.set_rockets(rockets_info)
+            errors = failures.setdefault(name, [])
+
+            compare("years", years, backend.years(), errors)
+            for search, year, success in itertools.product(searches, year_options, success_options):
+                label = f"query(search={search!r}, year={year}, success={success})"
+                expected = reference.query(search, year, success)[launch_backends.LAUNCH_FIELDS + ['year']]
+                compare(label, expected, backend.query(search, year, success), errors)
+                compare(label.replace("query", "count"), len(expected), backend.count(search, year, success), errors)
+
+            expected_stats = reference.stats()
+            expected_stats['first_year'] = int(expected_stats['first_year'])
+            compare("stats", expected_stats, backend.stats(), errors)
+            compare("launches_per_year", reference.launches_per_year(), backend.launches_per_year(), errors)
+            compare("success_counts", reference.success_counts(), backend.success_counts(), errors)
+            compare("success_rate_by_year", reference.success_rate_by_year(), backend.success_rate_by_year(), errors)
+            compare("launch_columns", reference.launch_columns(), backend.launch_columns(), errors)
+            compare("query(offset=3, limit=5)", reference.query(limit=5, offset=3)[launch_backends.LAUNCH_FIELDS + ['year']],
+                    backend.query(limit=5, offset=3), errors)
+            first_day = reference.df['date_utc'].min().strftime("%Y-%m-%d")
+            compare(f"query(date={first_day})", reference.query(date=first_day)[launch_backends.LAUNCH_FIELDS + ['year']],
+                    backend.query(date=first_day), errors)
+            pads = tuple(reference.df['launchpad'].dropna().unique()[:2])
+            compare(f"query(launchpad={pads})", reference.query(launchpad=pads)[launch_backends.LAUNCH_FIELDS + ['year']],
+                    backend.query(launchpad=pads), errors)
+            compare(f"count(launchpad={pads})", reference.count(launchpad=pads), backend.count(launchpad=pads), errors)
+            for launch_id in launch_ids:
+                compare(f"rocket_for_launch({launch_id})", reference.rocket_for_launch(launch_id),
+                        backend.rocket_for_launch(launch_id), errors)
+
+            # Canlı güncelleme: var olan fırlatma yerinde kalır, yenisi sona eklenir
+            expected = launch_backends.PandasBackend()
+            expected.df = reference.df.copy()
+            changed = reference.df.iloc[[1]].assign(name="Parity Upsert")
+            added = reference.df.iloc[[2]].assign(id="parity-upsert-new", name="Parity Insert")
+            for rows in (changed, added):
+                expected.upsert(rows)
+                backend.upsert(rows)
+            compare("upsert: query()", expected.query()[launch_backends.LAUNCH_FIELDS + ['year']], backend.query(), errors)
+            compare("upsert: launch_columns", expected.launch_columns(), backend.launch_columns(), errors)
+            backend.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare data backends against the pandas backend.")
+    parser.add_argument("--csv", help="Launch CSV to check (defaults to a synthetic dataset)")
+    parser.add_argument("--rockets", default="data/rockets_info.json")
+    parser.add_argument("--rows", type=int, default=5000, help="Synthetic rows when --csv is not given")
+    parser.add_argument("--backends", default="sqlite,duckdb")
+    args = parser.parse_args()
+
+    rockets_info = []
+    if os.path.exists(args.rockets):
+        import json
+        with open(args.rockets, "r", encoding="utf-8") as f:
+            rockets_info = json.load(f)
+
+    backend_names = [name.strip() for name in args.backends.split(",") if name.strip()]
+    if "duckdb" in backend_names:
+        try:
+            import duckdb  # noqa: F401
+        except ImportError:
+            print("duckdb is not installed, skipping the duckdb backend.")
+            backend_names.remove("duckdb")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = args.csv
+        if not csv_path:
+            import generate_launches
+            csv_path = generate_launches.generate(os.path.join(tmp, "launches.csv"), args.rows)
+            if not rockets_info:
+                rockets_info = [{"id": rocket_id, "name": f"Rocket {i}"} for i, rocket_id in enumerate(generate_launches.ROCKETS)]
+        failures = check(csv_path, rockets_info, backend_names)
+
+    exit_code = 0
+    for name, errors in failures.items():
+        if errors:
+            exit_code = 1
+            print(f"❌ {name}: {len(errors)} mismatch(es)")
+            for error in errors[:20]:
+                print(f"   {error.splitlines()[0]}")
+        else:
+            print(f"✅ {name}: identical to pandas")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
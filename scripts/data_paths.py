@@ -0,0 +1,17 @@
+"""Data and asset locations shared by the scripts.
+
+Paths are resolved from the repository root instead of the working directory,
+and the update pipeline redirects them to a staging directory through
+SPACEX_DATA_DIR / SPACEX_ASSETS_DIR.
+"""
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.environ.get("SPACEX_DATA_DIR", os.path.join(ROOT_DIR, "data"))
+ASSETS_DIR = os.environ.get("SPACEX_ASSETS_DIR", os.path.join(ROOT_DIR, "assets"))
+
+LAUNCHES_CSV = os.path.join(DATA_DIR, "spacex_launches.csv")
+ROCKETS_JSON = os.path.join(DATA_DIR, "rockets_info.json")
+IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
+# Kaynak listesi kullanıcı ayarıdır; güncelleme sırasında staging'e değil canlı dosyaya bakılır
+SOURCES_JSON = os.environ.get("SPACEX_SOURCES_FILE", os.path.join(DATA_DIR, "sources.json"))
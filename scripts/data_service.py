@@ -0,0 +1,332 @@
+"""Local data service shared by several dashboard windows on one host.
+
+    python scripts/data_service.py             # run the service
+    python scripts/data_service.py --once      # publish the current CSV and exit
+    SPACEX_BACKEND=shared python main.py       # dashboards attach to it
+
+The service owns the launch dataset, the update pipeline (API sync and rocket
+images) and the refresh schedule in data/refresh_settings.json. Each dataset
+version is published as a snapshot directory under data/shared/: numeric and
+date columns as .npy arrays, text columns dictionary-encoded (integer codes plus
+an offsets/bytes dictionary, the Arrow string layout). Dashboards open the
+arrays memory-mapped and read-only, so the pages are shared through the OS
+page cache instead of every window parsing and holding its own copy; text
+columns are categoricals over the mapped codes, only the dictionary is decoded.
+
+data/shared/version is an 8-byte memory-mapped counter bumped after each
+publish; current.json names the snapshot and the launch ids that changed since
+the previous version, so dashboards swap a refresh in without refetching or
+diffing it themselves.
+"""
+import argparse
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import data_paths
+import launch_backends
+import refresh_schedule
+
+SHARED_DIR = os.environ.get("SPACEX_SHARED_DIR", os.path.join(data_paths.DATA_DIR, "shared"))
+VERSION_FILE = "version"
+CURRENT_FILE = "current.json"
+REQUEST_FILE = "refresh_request"
+SNAPSHOT_FORMAT = 1
+KEEP_SNAPSHOTS = 3  # Eski sürümleri açık tutan pencereler için
+POLL_SECONDS = 2
+
+
+class VersionCounter:
+    """int64 counter in a memory-mapped file; the service writes it, dashboards only read it."""
+
+    def __init__(self, path, writable=False):
+        if writable and not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(b"\0" * 8)
+        self.file = open(path, "r+b" if writable else "rb")
+        self.map = mmap.mmap(self.file.fileno(), 8, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+    @property
+    def value(self):
+        return struct.unpack_from("<q", self.map, 0)[0]
+
+    def set(self, value):
+        struct.pack_into("<q", self.map, 0, value)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+
+def _column_kind(series):
+    if pd.api.types.is_bool_dtype(series):
+        return "bool"
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return "datetime"
+    if pd.api.types.is_numeric_dtype(series):
+        return "numeric"
+    values = series.dropna()
+    if len(values) and values.isin([True, False]).all():
+        return "nullable_bool"
+    return "string"
+
+
+def write_snapshot(df, directory):
+    """Write df as column files into directory (which must not exist yet)."""
+    tmp = directory + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    columns = []
+    for name in df.columns:
+        series = df[name]
+        kind = _column_kind(series)
+        path = os.path.join(tmp, name)
+        if kind == "bool":
+            np.save(path + ".npy", series.to_numpy(dtype=bool))
+        elif kind == "numeric":
+            np.save(path + ".npy", series.to_numpy())
+        elif kind == "datetime":
+            # Sütunun kendi çözünürlüğüyle yazılır; okunan çerçeve CSV'den yüklenenle aynı tipte olur
+            values = series.dt.tz_convert(None).to_numpy()
+            unit = np.datetime_data(values.dtype)[0]
+            np.save(path + ".npy", values.view("int64"))
+        elif kind == "nullable_bool":
+            # 1 / 0 / -1 (boş)
+            np.save(path + ".npy", series.map({True: 1, False: 0}).fillna(-1).to_numpy(dtype=np.int8))
+        else:
+            codes, uniques = pd.factorize(series)
+            encoded = [str(value).encode("utf-8") for value in uniques]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(value) for value in encoded], out=offsets[1:])
+            np.save(path + ".npy", codes.astype(_codes_dtype(len(uniques))))
+            np.save(path + ".offsets.npy", offsets)
+            np.save(path + ".data.npy", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        columns.append({"name": name, "kind": kind, **({"unit": unit} if kind == "datetime" else {})})
+    with open(os.path.join(tmp, "schema.json"), "w", encoding="utf-8") as f:
+        json.dump({"format": SNAPSHOT_FORMAT, "rows": len(df), "columns": columns}, f)
+    os.replace(tmp, directory)
+
+
+def _codes_dtype(categories):
+    # pandas kategorik kodlarını bu genişlikte tutar; aynı tipte yazılan kodlar okunurken kopyalanmaz
+    for dtype in (np.int8, np.int16, np.int32):
+        if categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _read_dictionary(path, mmap_mode="r"):
+    offsets = np.load(path + ".offsets.npy")
+    data = np.load(path + ".data.npy", mmap_mode=mmap_mode)
+    raw = data.tobytes()
+    # Sözlük girdisi başına bir kez çözülür; satırlar kodlarla kalır
+    return [raw[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def read_snapshot(directory, mmap_mode="r"):
+    """DataFrame over a snapshot; numeric, boolean and date columns and text codes stay memory-mapped read-only.
+
+    With mmap_mode=None the columns are read into memory and the files can be replaced afterwards.
+    """
+    with open(os.path.join(directory, "schema.json"), "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    if schema.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported snapshot format in {directory}")
+    columns = {}
+    for column in schema["columns"]:
+        name, kind = column["name"], column["kind"]
+        path = os.path.join(directory, name)
+        values = np.load(path + ".npy", mmap_mode=mmap_mode)
+        if kind in ("bool", "numeric"):
+            columns[name] = values
+        elif kind == "datetime":
+            unit = column.get("unit", "ns")
+            # int64 UTC epoch değerleri doğrudan tz'li tarih dizisi olur; eşlenmiş sayfalar kopyalanmaz
+            columns[name] = pd.array(values, dtype=pd.DatetimeTZDtype(unit, "UTC"), copy=False)
+        elif kind == "nullable_bool":
+            # CSV okumasıyla aynı biçim: True / False / NaN nesneleri
+            decoded = np.empty(len(values), dtype=object)
+            decoded[:] = values == 1
+            decoded[values < 0] = np.nan
+            columns[name] = decoded
+        else:
+            # Metin sütunları eşlenmiş kodlar üzerinde kategoriktir; -1 kodu boş değerdir
+            columns[name] = pd.Categorical.from_codes(values, _read_dictionary(path, mmap_mode), validate=False)
+    return pd.DataFrame(columns, copy=False)
+
+
+def read_current(shared_dir=SHARED_DIR):
+    try:
+        with open(os.path.join(shared_dir, CURRENT_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def open_latest(shared_dir=SHARED_DIR, since_version=None):
+    """(version, df, diff) of the published dataset, or None when nothing is published.
+
+    diff is the service's (inserted, updated, deleted) when it was computed
+    against since_version, otherwise None.
+    """
+    current = read_current(shared_dir)
+    if current is None:
+        return None
+    df = read_snapshot(os.path.join(shared_dir, current["directory"]))
+    diff = None
+    if since_version is not None and current.get("diff_from") == since_version and current.get("diff") is not None:
+        diff = tuple(current["diff"])
+    return current["version"], df, diff
+
+
+def request_refresh(shared_dir=SHARED_DIR):
+    # Servis bir sonraki turda güncellemeyi başlatır
+    os.makedirs(shared_dir, exist_ok=True)
+    with open(os.path.join(shared_dir, REQUEST_FILE), "w", encoding="utf-8") as f:
+        f.write(str(time.time()))
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class DataService:
+    """Publishes dataset versions and runs the update pipeline for every attached dashboard."""
+
+    def __init__(self, shared_dir=SHARED_DIR, csv_path=data_paths.LAUNCHES_CSV, log=print):
+        self.shared_dir = shared_dir
+        self.csv_path = csv_path
+        self.log = log
+        self.counter = VersionCounter(os.path.join(shared_dir, VERSION_FILE), writable=True)
+        self.next_launch = None
+        self.failed = False
+
+    def _csv_signature(self):
+        stat = os.stat(self.csv_path)
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def publish(self, force=False):
+        """Publish the CSV as a new version unless it is already current; returns the new version or None."""
+        if not os.path.exists(self.csv_path):
+            return None
+        signature = self._csv_signature()
+        current = read_current(self.shared_dir)
+        if current and current.get("signature") == signature and not force:
+            return None
+
+        df = launch_backends.prepare_launch_frame(pd.read_csv(self.csv_path))
+        diff = None
+        if current:
+            try:
+                previous = read_snapshot(os.path.join(self.shared_dir, current["directory"]))
+                if previous['id'].is_unique and df['id'].is_unique:
+                    diff = launch_backends.diff_launches(previous, df)
+            except (OSError, ValueError, KeyError):
+                diff = None
+
+        version = max(self.counter.value, current["version"] if current else 0) + 1
+        directory = f"v{version}"
+        write_snapshot(df, os.path.join(self.shared_dir, directory))
+        meta = {"version": version, "directory": directory, "rows": len(df), "signature": signature,
+                "published": time.time(), "diff_from": current["version"] if current else None, "diff": diff}
+        path = os.path.join(self.shared_dir, CURRENT_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(path + ".tmp", path)
+        # Sayaç en son artar: okuyan pencere current.json'u her zaman tam görür
+        self.counter.set(version)
+        self.prune(version)
+        changes = f", {len(diff[0])} new, {len(diff[1])} updated, {len(diff[2])} removed" if diff else ""
+        self.log(f"Published version {version} ({len(df)} launches{changes})")
+        return version
+
+    def prune(self, version):
+        for name in os.listdir(self.shared_dir):
+            if name.startswith("v") and name[1:].isdigit() and int(name[1:]) <= version - KEEP_SNAPSHOTS:
+                # Windows'ta hâlâ eşlenmiş dosyalar silinemez; bir sonraki yayında yeniden denenir
+                shutil.rmtree(os.path.join(self.shared_dir, name), ignore_errors=True)
+
+    def refresh(self):
+        """Run the update pipeline and publish the result; returns (ok, message)."""
+        import update_pipeline
+        import DataRetrieval
+        success, message = update_pipeline.UpdatePipeline().run(
+            progress=lambda value, text: self.log(f"[{value:3d}%] {text}"))
+        self.failed = not success
+        if success:
+            self.publish()
+            settings = refresh_schedule.load_settings()
+            settings["last_refresh"] = time.time()
+            refresh_schedule.save_settings(settings)
+            try:
+                self.next_launch = DataRetrieval.fetch_next()[0]
+            except Exception:
+                self.next_launch = None
+        self.log(message)
+        return success, message
+
+    def next_due(self, now):
+        """Unix time of the next scheduled refresh, or None when scheduled refresh is off."""
+        settings = refresh_schedule.load_settings()
+        if not settings["enabled"]:
+            return None
+        return now + refresh_schedule.next_refresh_delay(settings, now=now, next_launch=self.next_launch,
+                                                         last_refresh=settings["last_refresh"], failed=self.failed)
+
+    def run(self):
+        self.publish()
+        self.log(f"Serving {self.shared_dir} (Ctrl+C to stop)")
+        request = os.path.join(self.shared_dir, REQUEST_FILE)
+        due = stamp = None
+        while True:
+            # Ayarlar bir pencereden değiştirildiğinde zamanlama yeniden hesaplanır
+            settings_stamp = _mtime(refresh_schedule.SETTINGS_PATH)
+            if settings_stamp != stamp:
+                due, stamp = self.next_due(time.time()), settings_stamp
+            if os.path.exists(request) or (due is not None and time.time() >= due):
+                if os.path.exists(request):
+                    os.remove(request)
+                self.refresh()
+                stamp = None
+            else:
+                # CSV başka bir yoldan (ör. elle CsvConvert) değiştiyse de yayımlanır
+                self.publish()
+            time.sleep(POLL_SECONDS)
+
+    def close(self):
+        self.counter.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Share the launch dataset with several dashboard windows.")
+    parser.add_argument("--csv", default=data_paths.LAUNCHES_CSV)
+    parser.add_argument("--once", action="store_true", help="Publish the current CSV and exit")
+    parser.add_argument("--force", action="store_true", help="Publish even if the CSV is unchanged")
+    args = parser.parse_args()
+
+    service = DataService(csv_path=args.csv)
+    try:
+        if args.once:
+            service.publish(force=args.force)
+        else:
+            service.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,25 @@
 import json
-import requests
 import os
 from urllib.parse import urlparse
 
+import data_paths
+import spacex_client
+import update_pipeline
+
+STAGE = "download_rocket_images"
+
 # Images klasörünü oluştur
-assets_folder = '../assets'
+assets_folder = data_paths.ASSETS_DIR
 if not os.path.exists(assets_folder):
     os.makedirs(assets_folder)
 
 # Roket bilgilerini oku
-with open('../data/rockets_info.json', 'r', encoding='utf-8') as f:
+with open(data_paths.ROCKETS_JSON, 'r', encoding='utf-8') as f:
     rockets_info = json.load(f)
 
+# Yarıda kalmış bir güncellemede indirilmiş görseller atlanır
+downloaded = update_pipeline.completed_items(STAGE)
+
 print("🚀 Roket görselleri indiriliyor...")
 
 for rocket in rockets_info:
@@ -21,14 +29,17 @@ for rocket in rockets_info:
     print(f"\n📸 {rocket_name} için {len(images)} görsel indiriliyor...")
     
     # Her roket için klasör oluştur
-    rocket_folder = f"../assets/images/{rocket_name.replace(' ', '_')}"
+    rocket_folder = os.path.join(data_paths.IMAGES_DIR, rocket_name.replace(' ', '_'))
     if not os.path.exists(rocket_folder):
         os.makedirs(rocket_folder)
     
     # Görselleri indir
     for i, image_url in enumerate(images):
+        if image_url in downloaded and os.path.exists(downloaded[image_url]):
+            print(f"  ⏭️  {downloaded[image_url]} zaten indirildi")
+            continue
         try:
-            response = requests.get(image_url, timeout=10)
+            response = spacex_client.get(image_url, timeout=10, max_retries=2)
             if response.status_code == 200:
                 # Dosya uzantısını belirle
                 parsed_url = urlparse(image_url)
@@ -39,9 +50,11 @@ for rocket in rockets_info:
                 # Dosya adını oluştur
                 filename = f"{rocket_folder}/image_{i+1}{file_extension}"
                 
-                # Görseli kaydet
-                with open(filename, 'wb') as f:
+                # Görseli kaydet; yarım dosya kalmasın diye önce geçici dosyaya
+                with open(filename + '.tmp', 'wb') as f:
                     f.write(response.content)
+                os.replace(filename + '.tmp', filename)
+                update_pipeline.mark_item_done(STAGE, image_url, filename)
                 
                 print(f"  ✅ {filename} indirildi")
             else:
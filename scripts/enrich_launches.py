@@ -0,0 +1,195 @@
+"""Fetch launchpads, payloads, cores and crew for every launch in a few round-trips.
+
+Uses /v4/launches/query with `populate`, page by page, and normalises the
+related documents into indexed tables in data/spacex_related.sqlite (plus one
+/v4/launchpads request, so pads without launches get coordinates for the map):
+
+    launchpads(id, name, full_name, locality, region, latitude, longitude)
+    payloads(id, launch_id, name, type, mass_kg, orbit, customers)
+    cores(launch_id, core_id, serial, flight, reused, landing_success, landing_type)
+    crew(launch_id, crew_id, name, agency)
+"""
+import json
+import os
+import sqlite3
+from contextlib import closing
+
+import requests
+
+import data_paths
+import spacex_client
+
+DATA_DIR = data_paths.DATA_DIR
+RELATED_DB = os.path.join(DATA_DIR, "spacex_related.sqlite")
+PAGE_SIZE = 200
+
+QUERY_OPTIONS = {
+    "pagination": True,
+    "limit": PAGE_SIZE,
+    "select": {"id": 1, "launchpad": 1, "payloads": 1, "cores": 1, "crew": 1},
+    "populate": [
+        {"path": "launchpad", "select": {"name": 1, "full_name": 1, "locality": 1, "region": 1, "latitude": 1, "longitude": 1}},
+        {"path": "payloads", "select": {"name": 1, "type": 1, "mass_kg": 1, "orbit": 1, "customers": 1}},
+        {"path": "cores.core", "select": {"serial": 1}},
+        {"path": "crew.crew", "select": {"name": 1, "agency": 1}},
+    ],
+}
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS launchpads (
+        id TEXT PRIMARY KEY, name TEXT, full_name TEXT, locality TEXT, region TEXT,
+        latitude REAL, longitude REAL)""",
+    """CREATE TABLE IF NOT EXISTS payloads (
+        id TEXT, launch_id TEXT, name TEXT, type TEXT, mass_kg REAL, orbit TEXT, customers TEXT)""",
+    """CREATE TABLE IF NOT EXISTS cores (
+        launch_id TEXT, core_id TEXT, serial TEXT, flight INTEGER, reused INTEGER,
+        landing_success INTEGER, landing_type TEXT)""",
+    """CREATE TABLE IF NOT EXISTS crew (launch_id TEXT, crew_id TEXT, name TEXT, agency TEXT)""",
+    "CREATE INDEX IF NOT EXISTS idx_payloads_launch ON payloads (launch_id)",
+    "CREATE INDEX IF NOT EXISTS idx_cores_launch ON cores (launch_id)",
+    "CREATE INDEX IF NOT EXISTS idx_crew_launch ON crew (launch_id)",
+]
+
+
+def fetch_pages():
+    # Her sayfa ilişkili belgeleriyle birlikte gelir: N istek yerine sayfa sayısı kadar istek
+    page = 1
+    while True:
+        response = spacex_client.post("/v4/launches/query", json={"query": {}, "options": dict(QUERY_OPTIONS, page=page)})
+        response.raise_for_status()
+        result = response.json()
+        yield result.get("docs", [])
+        print(f"  sayfa {result.get('page', page)}/{result.get('totalPages', '?')}")
+        if not result.get("hasNextPage"):
+            break
+        page = result.get("nextPage") or page + 1
+
+
+def fetch_launchpads():
+    response = spacex_client.get("/v4/launchpads")
+    if response.status_code == 404:
+        # Kayıtları eksik bir sunucu (ör. sentetik mock); rampalar fırlatmalardan gelenlerle sınırlı kalır
+        return []
+    response.raise_for_status()
+    return response.json()
+
+
+def _as_bool_int(value):
+    return None if value is None else int(bool(value))
+
+
+def normalise(launches):
+    """Split populated launch documents into rows for the related tables."""
+    launchpads, payloads, cores, crew = {}, [], [], []
+    for launch in launches:
+        launch_id = launch.get("id")
+        pad = launch.get("launchpad")
+        if isinstance(pad, dict) and pad.get("id"):
+            launchpads[pad["id"]] = (pad["id"], pad.get("name"), pad.get("full_name"), pad.get("locality"),
+                                     pad.get("region"), pad.get("latitude"), pad.get("longitude"))
+        for payload in launch.get("payloads") or []:
+            if isinstance(payload, dict):
+                payloads.append((payload.get("id"), launch_id, payload.get("name"), payload.get("type"),
+                                 payload.get("mass_kg"), payload.get("orbit"),
+                                 ", ".join(payload.get("customers") or [])))
+        for core in launch.get("cores") or []:
+            core_doc = core.get("core")
+            core_id = core_doc.get("id") if isinstance(core_doc, dict) else core_doc
+            serial = core_doc.get("serial") if isinstance(core_doc, dict) else None
+            cores.append((launch_id, core_id, serial, core.get("flight"), _as_bool_int(core.get("reused")),
+                          _as_bool_int(core.get("landing_success")), core.get("landing_type")))
+        for member in launch.get("crew") or []:
+            if isinstance(member, dict):
+                # v4 ekip listesi ya doğrudan belge ya da {crew, role} çiftidir
+                person = member.get("crew") if isinstance(member.get("crew"), dict) else member
+                crew.append((launch_id, person.get("id"), person.get("name"), person.get("agency")))
+    return list(launchpads.values()), payloads, cores, crew
+
+
+def save(db_path, launchpads, payloads, cores, crew):
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    for statement in SCHEMA:
+        conn.execute(statement)
+    conn.executemany("INSERT OR REPLACE INTO launchpads VALUES (?, ?, ?, ?, ?, ?, ?)", launchpads)
+    conn.executemany("INSERT INTO payloads VALUES (?, ?, ?, ?, ?, ?, ?)", payloads)
+    conn.executemany("INSERT INTO cores VALUES (?, ?, ?, ?, ?, ?, ?)", cores)
+    conn.executemany("INSERT INTO crew VALUES (?, ?, ?, ?)", crew)
+    conn.commit()
+    conn.close()
+    # Okuyucular yarım yazılmış veritabanı görmesin
+    os.replace(tmp_path, db_path)
+
+
+def load_launchpad_names(db_path=None):
+    db_path = db_path or RELATED_DB
+    if not os.path.exists(db_path):
+        return {}
+    with closing(sqlite3.connect(db_path)) as conn:
+        return dict(conn.execute("SELECT id, name FROM launchpads").fetchall())
+
+
+def load_launchpad_locations(db_path=None):
+    """(latitude, longitude) per launchpad id, for pads with known coordinates."""
+    db_path = db_path or RELATED_DB
+    if not os.path.exists(db_path):
+        return {}
+    with closing(sqlite3.connect(db_path)) as conn:
+        rows = conn.execute("SELECT id, latitude, longitude FROM launchpads "
+                            "WHERE latitude IS NOT NULL AND longitude IS NOT NULL")
+        return {pad_id: (latitude, longitude) for pad_id, latitude, longitude in rows.fetchall()}
+
+
+def load_payload_mass(db_path=None):
+    """Total payload mass per launch id (kg)."""
+    db_path = db_path or RELATED_DB
+    if not os.path.exists(db_path):
+        return {}
+    with closing(sqlite3.connect(db_path)) as conn:
+        rows = conn.execute("SELECT launch_id, SUM(mass_kg) FROM payloads WHERE mass_kg IS NOT NULL GROUP BY launch_id")
+        return dict(rows.fetchall())
+
+
+def launch_details(launch_id, launchpad_id=None, db_path=None):
+    """Launchpad, payload, core and crew rows for one launch (indexed lookups)."""
+    db_path = db_path or RELATED_DB
+    details = {"launchpad": None, "payloads": [], "cores": [], "crew": []}
+    if not os.path.exists(db_path):
+        return details
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.row_factory = sqlite3.Row
+        if launchpad_id:
+            row = conn.execute("SELECT * FROM launchpads WHERE id = ?", (launchpad_id,)).fetchone()
+            details["launchpad"] = dict(row) if row else None
+        details["payloads"] = [dict(r) for r in conn.execute("SELECT * FROM payloads WHERE launch_id = ?", (launch_id,))]
+        details["cores"] = [dict(r) for r in conn.execute("SELECT * FROM cores WHERE launch_id = ?", (launch_id,))]
+        details["crew"] = [dict(r) for r in conn.execute("SELECT * FROM crew WHERE launch_id = ?", (launch_id,))]
+    return details
+
+
+def main():
+    try:
+        print("Fırlatmalara ait fırlatma rampaları, yükler ve çekirdekler alınıyor...")
+        launches = []
+        for docs in fetch_pages():
+            launches.extend(docs)
+        launch_count = len(launches)
+        # Rampa belgeleri fırlatmalarla birlikte geliyor; fırlatması olmayanlar ayrıca alınır
+        launches.extend({"launchpad": pad} for pad in fetch_launchpads())
+        launchpads, payloads, cores, crew = normalise(launches)
+        os.makedirs(DATA_DIR, exist_ok=True)
+        save(RELATED_DB, launchpads, payloads, cores, crew)
+        print(f"{launch_count} fırlatma: {len(launchpads)} rampa, {len(payloads)} yük, "
+              f"{len(cores)} çekirdek, {len(crew)} mürettebat kaydedildi.")
+    except requests.exceptions.RequestException as e:
+        print(f"Bağlantı hatası: {e}")
+        raise SystemExit(1)
+    except json.JSONDecodeError as e:
+        print(f"JSON çözümleme hatası: {e}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Classify changes under data/ and assets/images/ for the dashboard's hot reload.
+
+Each watched file or image folder is a target: "launches", "rockets",
+"related", "launch_images" or "images:<Rocket_Folder>". A target is reloaded
+only once its signature (size and mtime of the file, or of every image in the
+folder) has stayed the same for SETTLE_SECONDS and differs from what was last
+loaded, so bursts of events collapse into one reload and files that are still
+being written are not read. Staging and temporary files are ignored.
+"""
+import os
+import time
+
+SETTLE_SECONDS = 1.0
+DATASETS = {
+    "spacex_launches.csv": "launches",
+    "rockets_info.json": "rockets",
+    "spacex_related.sqlite": "related",
+    "launch_images.json": "launch_images",
+}
+IMAGE_PREFIX = "images:"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+# Güncelleme hattının, veri servisinin, raporların ve oturum kaydının kendi klasörleri izlenmez
+IGNORED_DIRS = {".update", "shared", "reports", "benchmarks", ".dataset", "session"}
+IGNORED_SUFFIXES = (".tmp", ".part", ".partial", ".crdownload", ".swp", "~", "-journal", "-wal", "-shm")
+
+
+class FileTargets:
+    """Maps filesystem paths under the data and image directories to reload targets."""
+
+    def __init__(self, data_dir, images_dir):
+        self.data_dir = os.path.normpath(data_dir)
+        self.images_dir = os.path.normpath(images_dir)
+
+    def path(self, target):
+        if target.startswith(IMAGE_PREFIX):
+            return os.path.join(self.images_dir, target[len(IMAGE_PREFIX):])
+        for filename, name in DATASETS.items():
+            if name == target:
+                return os.path.join(self.data_dir, filename)
+        raise KeyError(target)
+
+    def classify(self, path):
+        """Target for a changed path, or None when the path does not matter to the dashboard."""
+        path = os.path.normpath(path)
+        if _contains(path, self.images_dir):
+            return "images"                      # Klasör eklendi ya da silindi; alt klasörler yeniden taranır
+        if _contains(path, self.data_dir):
+            return "data"
+        name = os.path.basename(path)
+        if name.startswith(".") or name.endswith(IGNORED_SUFFIXES):
+            return None
+        parent = os.path.dirname(path)
+        if parent == self.images_dir:
+            return IMAGE_PREFIX + name if os.path.isdir(path) or not os.path.exists(path) else None
+        if os.path.dirname(parent) == self.images_dir:
+            return IMAGE_PREFIX + os.path.basename(parent) if name.lower().endswith(IMAGE_EXTENSIONS) else None
+        if parent == self.data_dir:
+            return DATASETS.get(name)
+        return None
+
+    def expand(self, target):
+        """Concrete targets for a directory-level change."""
+        if target == "data":
+            return [name for filename, name in DATASETS.items() if os.path.exists(os.path.join(self.data_dir, filename))]
+        if target == "images":
+            return [IMAGE_PREFIX + name for name in self.image_folders()]
+        return [target]
+
+    def image_folders(self):
+        try:
+            return sorted(entry.name for entry in os.scandir(self.images_dir)
+                          if entry.is_dir() and entry.name not in IGNORED_DIRS and not entry.name.startswith("."))
+        except FileNotFoundError:
+            return []
+
+    def watch_paths(self):
+        """Directories and files to hand to the filesystem watcher."""
+        # Henüz oluşturulmamış klasörlerin yerine var olan en yakın üst klasör izlenir
+        directories = list(dict.fromkeys(_existing_ancestor(path) for path in (self.data_dir, self.images_dir)))
+        directories += [os.path.join(self.images_dir, name) for name in self.image_folders()]
+        files = [path for path in (os.path.join(self.data_dir, filename) for filename in DATASETS) if os.path.exists(path)]
+        return directories, files
+
+    def signature(self, target):
+        """Size/mtime of the target's file, or of every image in the folder; None when it is missing."""
+        path = self.path(target)
+        try:
+            if not target.startswith(IMAGE_PREFIX):
+                stat = os.stat(path)
+                return stat.st_size, stat.st_mtime_ns
+            return tuple(sorted((entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                                for entry in os.scandir(path)
+                                if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)))
+        except FileNotFoundError:
+            return None
+
+
+def _existing_ancestor(path):
+    while not os.path.isdir(path):
+        path = os.path.dirname(path) or "."
+    return path
+
+
+def _contains(directory, path):
+    """True when path is directory itself or lies below it."""
+    if directory == path:
+        return True
+    if directory == ".":
+        return not os.path.isabs(path)
+    return path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+class ChangeTracker:
+    """Coalesces change notifications into targets that have settled and differ from what was loaded."""
+
+    def __init__(self, targets, settle_seconds=SETTLE_SECONDS):
+        self.targets = targets
+        self.settle_seconds = settle_seconds
+        self.loaded = {}      # hedef -> son yüklenen imza
+        self.pending = {}     # hedef -> (gözlenen imza, o imzanın ilk görüldüğü an)
+
+    def mark_loaded(self, targets=None, signatures=None):
+        """Remember the current (or given) signatures as loaded, e.g. after the app itself reloaded."""
+        signatures = signatures or {}
+        for target in targets if targets is not None else self.all_targets():
+            self.loaded[target] = signatures.get(target, self.targets.signature(target))
+            self.pending.pop(target, None)
+
+    def all_targets(self):
+        return list(DATASETS.values()) + [IMAGE_PREFIX + name for name in self.targets.image_folders()]
+
+    def note_path(self, path, now=None):
+        target = self.targets.classify(path)
+        if target is None:
+            return []
+        targets = self.targets.expand(target)
+        for target in targets:
+            self.note(target, now)
+        return targets
+
+    def note(self, target, now=None):
+        now = time.monotonic() if now is None else now
+        # Yeni olay sayacı sıfırlar: dosya hâlâ yazılıyor olabilir
+        self.pending[target] = (self.targets.signature(target), now)
+
+    def poll(self, now=None):
+        """(settled targets to reload, seconds until the next check or None)."""
+        now = time.monotonic() if now is None else now
+        ready, wait = [], None
+        for target, (seen, since) in list(self.pending.items()):
+            current = self.targets.signature(target)
+            if current != seen:
+                self.pending[target] = (current, now)
+                since = now
+            remaining = self.settle_seconds - (now - since)
+            if remaining > 0:
+                wait = remaining if wait is None else min(wait, remaining)
+                continue
+            del self.pending[target]
+            if current != self.loaded.get(target):
+                ready.append(target)
+        return ready, wait
+
+
+def csv_complete(path):
+    """False while a CSV is empty or its last row has not been terminated yet."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except OSError:
+        return False
@@ -0,0 +1,216 @@
+"""Synthetic launch dataset generator.
+
+Writes launches with the same columns CsvConvert.py produces, so the dashboard
+and the benchmarks can be exercised far beyond the ~200 real launches. The
+json/jsonl (API) formats also carry a per-rocket event timeline for launches
+that have flown.
+
+    python scripts/generate_launches.py --rows 1000000 --distribution growth \
+        --out data/synthetic/launches_1m.csv
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from launch_sources import LAUNCH_FIELDS
+
+# Gerçek API kimlikleri: rockets_info.json ve resimler sentetik veriyle de eşleşsin
+ROCKETS = {
+    "5e9d0d95eda69955f709d1eb": 0.02,  # Falcon 1
+    "5e9d0d95eda69973a809d1ec": 0.90,  # Falcon 9
+    "5e9d0d95eda69974db09d1ed": 0.05,  # Falcon Heavy
+    "5e9d0d96eda699382d09d1ee": 0.03,  # Starship
+}
+LAUNCHPADS = {
+    "5e9e4501f509094ba4566f84": 0.45,  # CCSFS SLC 40
+    "5e9e4502f509094188566f88": 0.30,  # KSC LC 39A
+    "5e9e4502f509092b78566f87": 0.20,  # VAFB SLC 4E
+    "5e9e4502f5090995de566f86": 0.05,  # Kwajalein Atoll
+}
+# Roket başına olay -> (ortalama, sapma) saniye; iniş olayları yalnızca kurtarılan uçuşlarda
+_F9_TIMELINE = [
+    ("go_for_prop_loading", -2280, 60), ("stage1_lox_loading", -2100, 60), ("stage2_lox_loading", -960, 30),
+    ("engine_chill", -420, 5), ("prelaunch_checks", -60, 1), ("go_for_launch", -45, 1), ("ignition", -3, 0.2),
+    ("liftoff", 0, 0), ("maxq", 72, 6), ("meco", 150, 12), ("stage_sep", 153, 12), ("second_stage_ignition", 161, 12),
+    ("fairing_deploy", 210, 15), ("first_stage_entry_burn", 390, 40), ("first_stage_landing", 500, 40),
+    ("seco-1", 520, 25), ("payload_deploy", 3200, 900),
+]
+TIMELINES = {
+    "5e9d0d95eda69955f709d1eb": [("liftoff", 0, 0), ("meco", 169, 5), ("stage_sep", 175, 5),
+                                 ("second_stage_ignition", 178, 5), ("seco-1", 560, 15)],
+    "5e9d0d95eda69973a809d1ec": _F9_TIMELINE,
+    "5e9d0d95eda69974db09d1ed": _F9_TIMELINE[:9] + [("beco", 154, 5), ("side_core_sep", 158, 5),
+                                                    ("side_core_landing", 480, 20)] + _F9_TIMELINE[9:],
+    "5e9d0d96eda699382d09d1ee": [("liftoff", 0, 0), ("maxq", 62, 5), ("meco", 164, 8), ("hot_staging", 166, 8),
+                                 ("booster_boostback", 175, 8), ("booster_landing", 420, 30), ("seco", 525, 20)],
+}
+LANDING_EVENTS = {"first_stage_entry_burn", "first_stage_landing", "side_core_landing", "booster_landing"}
+RECOVERY_RATE = 0.85
+DATE_PRECISIONS = np.array(["hour", "day", "month", "quarter", "half", "year"])
+DISTRIBUTIONS = ("uniform", "growth", "bursty")
+
+START = pd.Timestamp("2006-03-24", tz="UTC")
+END = pd.Timestamp("2026-12-31", tz="UTC")
+CHUNK_ROWS = 500000
+
+
+def parse_size(text):
+    # "1k", "250k", "10m" gibi kısaltmaları kabul et
+    text = str(text).strip().lower()
+    multiplier = {"k": 1000, "m": 1000000}.get(text[-1:], 1)
+    if multiplier != 1:
+        text = text[:-1]
+    return int(float(text) * multiplier)
+
+
+def sample_unix_times(rng, rows, distribution):
+    start, end = START.timestamp(), END.timestamp()
+    span = end - start
+    if distribution == "uniform":
+        fractions = rng.random(rows)
+    elif distribution == "growth":
+        # Yıllar ilerledikçe fırlatma sıklığı artar (üstel yoğunluk)
+        rate = 3.0
+        u = rng.random(rows)
+        fractions = np.log1p(u * np.expm1(rate)) / rate
+    elif distribution == "bursty":
+        # Fırlatmalar kısa pencerelerde kümelenir
+        centers = rng.random(max(1, rows // 50))
+        picks = centers[rng.integers(0, len(centers), rows)]
+        fractions = np.clip(picks + rng.normal(0, 0.002, rows), 0, 1)
+    else:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    return np.sort(start + fractions * span).astype(np.int64)
+
+
+def _weighted_choice(rng, weights, rows):
+    keys = np.array(list(weights.keys()))
+    probs = np.array(list(weights.values()), dtype=float)
+    return keys[rng.choice(len(keys), size=rows, p=probs / probs.sum())]
+
+
+def generate_chunk(rng, unix_times, first_index, success_rate, upcoming_after, seed):
+    rows = len(unix_times)
+    index = np.arange(first_index, first_index + rows)
+    # strftime satır başına çalışır; numpy ile toplu biçimlendirme çok daha hızlı
+    iso = np.datetime_as_string(unix_times.astype("datetime64[s]"), unit="s").astype(object)
+    upcoming = unix_times > upcoming_after
+
+    success = np.where(rng.random(rows) < success_rate, "True", "False").astype(object)
+    success[upcoming] = ""
+
+    chunk = pd.DataFrame({
+        "id": [f"{seed:08x}{i:016x}" for i in index],
+        "name": [f"Synthetic Mission {i + 1}" for i in index],
+        "flight_number": index + 1,
+        "date_utc": iso + ".000Z",
+        "date_local": iso + "+00:00",
+        "success": success,
+        "details": "",
+        "rocket": _weighted_choice(rng, ROCKETS, rows),
+        "launchpad": _weighted_choice(rng, LAUNCHPADS, rows),
+        "upcoming": upcoming,
+        "tbd": False,
+        "net": False,
+        "window": rng.choice([0, 0, 0, 3600, 7200], size=rows),
+        "static_fire_date_utc": "",
+        "auto_update": True,
+        "launch_library_id": "",
+        "date_precision": np.where(upcoming, DATE_PRECISIONS[rng.integers(0, 3, rows)], "hour"),
+        "date_unix": unix_times,
+    })
+    return chunk[LAUNCH_FIELDS]
+
+
+def sample_timelines(rng, rockets, flown):
+    """Event timelines ({event: seconds}, or None for launches that have not flown) per launch."""
+    timelines = [None] * len(rockets)
+    recovered = rng.random(len(rockets)) < RECOVERY_RATE
+    for rocket_id, template in TIMELINES.items():
+        rows = np.flatnonzero((rockets == rocket_id) & flown)
+        if not len(rows):
+            continue
+        means = np.array([mean for _, mean, _ in template], dtype=float)
+        spreads = np.array([spread for _, _, spread in template], dtype=float)
+        # Olay sırası korunsun diye sapmalar fırlatma başına ortak bir ölçekle çarpılır
+        scale = rng.normal(0, 1, (len(rows), 1))
+        seconds = np.rint(means + scale * spreads + rng.normal(0, 0.1, (len(rows), len(template))) * spreads)
+        landing = np.array([event in LANDING_EVENTS for event, _, _ in template])
+        for i, row in enumerate(rows):
+            keep = ~landing | recovered[row]
+            timelines[row] = {event: int(value) for (event, _, _), value, k in zip(template, seconds[i], keep) if k}
+    return timelines
+
+
+def _to_api_records(chunk, rng):
+    # API yanıtındaki tiplerle aynı JSON: success bool/null, flight_number int
+    records = chunk.to_dict(orient="records")
+    timelines = sample_timelines(rng, chunk["rocket"].to_numpy(), ~chunk["upcoming"].to_numpy(dtype=bool))
+    for record, timeline in zip(records, timelines):
+        record["timeline"] = timeline
+        record["success"] = {"True": True, "False": False}.get(record["success"])
+        record["details"] = None
+        record["static_fire_date_utc"] = None
+        record["launch_library_id"] = None
+        record["flight_number"] = int(record["flight_number"])
+        record["date_unix"] = int(record["date_unix"])
+        record["window"] = int(record["window"])
+        record["upcoming"] = bool(record["upcoming"])
+    return records
+
+
+def generate(out_path, rows, distribution="growth", seed=42, success_rate=0.95,
+             upcoming_fraction=0.02, fmt=None):
+    """Write `rows` synthetic launches to `out_path` (csv, json or jsonl) in chunks."""
+    fmt = fmt or os.path.splitext(out_path)[1].lstrip(".") or "csv"
+    rng = np.random.default_rng(seed)
+    # Ayrı üreteç: csv ve json çıktıları aynı tohumla aynı fırlatmaları içersin
+    timeline_rng = np.random.default_rng([seed, 1])
+    unix_times = sample_unix_times(rng, rows, distribution)
+    upcoming_after = unix_times[max(0, int(rows * (1 - upcoming_fraction)) - 1)] if rows else 0
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        if fmt == "json":
+            f.write("[")
+        for first in range(0, rows, CHUNK_ROWS):
+            chunk = generate_chunk(rng, unix_times[first:first + CHUNK_ROWS], first,
+                                   success_rate, upcoming_after, seed)
+            if fmt == "csv":
+                chunk.to_csv(f, header=(first == 0), index=False)
+            elif fmt == "jsonl":
+                for record in _to_api_records(chunk, timeline_rng):
+                    f.write(json.dumps(record) + "\n")
+            elif fmt == "json":
+                body = ",".join(json.dumps(record) for record in _to_api_records(chunk, timeline_rng))
+                f.write(("," if first else "") + body)
+            else:
+                raise ValueError(f"Unknown format: {fmt}")
+        if fmt == "json":
+            f.write("]")
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic SpaceX launch dataset.")
+    parser.add_argument("--rows", default="1k", help="Number of launches, e.g. 1000, 250k, 10m")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="growth")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--success-rate", type=float, default=0.95)
+    parser.add_argument("--upcoming-fraction", type=float, default=0.02)
+    parser.add_argument("--format", choices=("csv", "json", "jsonl"), default=None,
+                        help="Output format (defaults to the --out extension)")
+    parser.add_argument("--out", default="data/synthetic/spacex_launches.csv")
+    args = parser.parse_args()
+
+    rows = parse_size(args.rows)
+    generate(args.out, rows, args.distribution, args.seed, args.success_rate,
+             args.upcoming_fraction, args.format)
+    print(f"{rows} sentetik fırlatma yazıldı: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
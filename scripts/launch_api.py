@@ -0,0 +1,336 @@
+"""Read-only local HTTP/JSON API over the launch data the dashboard shows.
+
+    python scripts/launch_api.py --port 8765      # standalone, own backend (SPACEX_BACKEND)
+    Settings tab -> "Serve local API"             # inside the dashboard, same dataset as the window
+
+Endpoints (GET):
+
+    /api/launches?search=&year=&success=true|false&date=YYYY-MM-DD&launchpad=id[,id]&offset=0&limit=100
+    /api/stats                               the stat cards
+    /api/years
+    /api/charts/launches_per_year            chart series as {"index": [...], "values": [...]}
+    /api/charts/success_counts
+    /api/charts/success_rate_by_year
+    /api/reliability?group=rocket|launchpad  rolling reliability summaries
+    /api/version
+
+Responses carry a weak ETag hashed from the encoded body, so a restarted
+server never reuses a tag for different data, answer If-None-Match with 304,
+and are gzip-compressed for clients that accept it. Encoded bodies are kept
+in an LRU response cache per dataset version, so repeated requests skip the
+query and the encoding. Requests are served by a thread pool of the stdlib
+HTTP server and never touch the GUI thread; the dashboard only hands over a
+new data source when its dataset changes.
+"""
+import argparse
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import data_paths
+import launch_backends
+import perf_metrics
+import reliability
+
+DEFAULT_PORT = int(os.environ.get("SPACEX_API_PORT", "8765"))
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+CACHE_ENTRIES = 1024
+GZIP_MIN_BYTES = 512  # Küçük yanıtlar sıkıştırılmaz
+CHART_SERIES = ("launches_per_year", "success_counts", "success_rate_by_year")
+WATCH_SECONDS = 5
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _bool_param(value):
+    if value in (None, ""):
+        return None
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise ApiError(400, f"success must be true or false, not {value!r}")
+
+
+def _int_param(params, name, default=None, minimum=0, maximum=None):
+    value = params.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer")
+    if number < minimum or (maximum is not None and number > maximum):
+        raise ApiError(400, f"{name} must be between {minimum} and {maximum if maximum is not None else 'any'}")
+    return number
+
+
+def _date_param(value):
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ApiError(400, f"date must be YYYY-MM-DD, not {value!r}")
+
+
+def _series(series):
+    return {"index": [value.item() if hasattr(value, "item") else value for value in series.index],
+            "values": [None if value != value else float(value) for value in series.to_numpy(dtype=float)]}
+
+
+class LaunchApi:
+    """Routes, response cache and the current data source; independent of the HTTP server."""
+
+    def __init__(self, cache_entries=CACHE_ENTRIES):
+        self.lock = threading.Lock()
+        self.source = None
+        self.version = None
+        self.source_lock = None
+        self.reliability_engine = None
+        self.cache = OrderedDict()   # (sürüm, yol, sorgu) -> (etag, gövde, gzip gövde)
+        self.cache_entries = cache_entries
+        self.requests = self.hits = 0
+
+    def publish(self, source, version):
+        """Swap in a backend-like data source for a new dataset version."""
+        # SQL bağlantıları iş parçacıkları arasında paylaşılırken sorgular sıraya alınır
+        source_lock = None if getattr(source, "in_memory", True) else threading.Lock()
+        with self.lock:
+            self.source, self.version, self.source_lock = source, version, source_lock
+            self.reliability_engine = None
+            self.cache.clear()
+
+    def _call(self, source, source_lock, method, *args, **kwargs):
+        if source_lock is None:
+            return getattr(source, method)(*args, **kwargs)
+        with source_lock:
+            return getattr(source, method)(*args, **kwargs)
+
+    def handle(self, path, query, accept_gzip=False, if_none_match=None):
+        """Returns (status, headers, body)."""
+        with self.lock:
+            self.requests += 1
+            source, version, source_lock = self.source, self.version, self.source_lock
+        if source is None:
+            return self._error(503, "No dataset loaded yet")
+
+        params = {key: values[-1] for key, values in parse_qs(query, keep_blank_values=True).items()}
+        key = (version, path, tuple(sorted(params.items())))
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            try:
+                with perf_metrics.timer("api.render"):
+                    payload = self.route(source, source_lock, version, path, params)
+            except ApiError as e:
+                return self._error(e.status, str(e))
+            body = payload.encode("utf-8") if isinstance(payload, str) else json.dumps(payload).encode("utf-8")
+            # Etiket gövdeden türetilir; sürüm sayacı her süreçte baştan başlar, farklı veriye aynı etiket verilmemeli
+            etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+            entry = [etag, body, None]
+            with self.lock:
+                self.cache[key] = entry
+                while len(self.cache) > self.cache_entries:
+                    self.cache.popitem(last=False)
+
+        etag, body, compressed = entry
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding",
+                   "Content-Type": "application/json; charset=utf-8"}
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return 304, headers, b""
+        if accept_gzip and len(body) >= GZIP_MIN_BYTES:
+            if compressed is None:
+                # Sıkıştırılmış gövde de önbellekte tutulur
+                compressed = entry[2] = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+            body = compressed
+        return 200, headers, body
+
+    def _error(self, status, message):
+        return status, {"Content-Type": "application/json; charset=utf-8"}, json.dumps({"error": message}).encode()
+
+    def route(self, source, source_lock, version, path, params):
+        call = lambda method, *args, **kwargs: self._call(source, source_lock, method, *args, **kwargs)
+        if path == "/api/version":
+            return {"version": version}
+        if path == "/api/launches":
+            filters = {"search": params.get("search", ""),
+                       "year": _int_param(params, "year", minimum=1900, maximum=3000),
+                       "success": _bool_param(params.get("success")),
+                       "date": _date_param(params.get("date")),
+                       "launchpad": tuple(pad for pad in params.get("launchpad", "").split(",") if pad) or None}
+            offset = _int_param(params, "offset", 0)
+            limit = _int_param(params, "limit", DEFAULT_LIMIT, minimum=1, maximum=MAX_LIMIT)
+            total = call("count", **filters)
+            page = call("query", **filters, limit=limit, offset=offset)
+            rows = page[launch_backends.LAUNCH_FIELDS + ['year']].to_json(orient="records", date_format="iso")
+            # Sayfa pandas ile JSON'a çevrilir; satır satır Python sözlüğü kurulmaz
+            return (f'{{"version": {json.dumps(version)}, "total": {total}, "offset": {offset}, '
+                    f'"limit": {limit}, "launches": {rows}}}')
+        if path == "/api/stats":
+            stats = call("stats")
+            total = stats["total"]
+            first_year = stats["first_year"]
+            return {"version": version, "total": total, "successful": stats["successful"],
+                    "success_rate": stats["successful"] / total * 100 if total else 0.0,
+                    "first_year": int(first_year) if first_year is not None else None,
+                    "latest_name": stats["latest_name"]}
+        if path == "/api/years":
+            return {"version": version, "years": call("years")}
+        if path.startswith("/api/charts/"):
+            name = path[len("/api/charts/"):]
+            if name not in CHART_SERIES:
+                raise ApiError(404, f"Unknown chart {name!r}; choose from {', '.join(CHART_SERIES)}")
+            return {"version": version, "chart": name, **_series(call(name))}
+        if path == "/api/reliability":
+            group = params.get("group", "rocket")
+            if group not in reliability.GROUPS:
+                raise ApiError(400, f"group must be one of {', '.join(reliability.GROUPS)}")
+            engine = self._reliability(call, version)
+            summaries = engine.summaries(group).reset_index()
+            return (f'{{"version": {json.dumps(version)}, "group": "{group}", "window": {engine.window}, '
+                    f'"summaries": {summaries.to_json(orient="records")}}}')
+        raise ApiError(404, f"Unknown endpoint {path}")
+
+    def _reliability(self, call, version):
+        with self.lock:
+            engine = self.reliability_engine
+        if engine is None or engine[0] != version:
+            engine = (version, reliability.ReliabilityEngine.from_columns(call("launch_columns")))
+            with self.lock:
+                if self.version == version:
+                    self.reliability_engine = engine
+        return engine[1]
+
+    def stats(self):
+        with self.lock:
+            return {"requests": self.requests, "cache_hits": self.hits, "cache_entries": len(self.cache),
+                    "version": self.version}
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # Bağlantılar açık kalır; yük altında yeniden bağlanma maliyeti yok
+    server_version = "SpaceXLaunchAPI/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        started = time.perf_counter()
+        status, headers, body = self.server.api.handle(
+            url.path.rstrip("/") or "/", url.query,
+            accept_gzip="gzip" in self.headers.get("Accept-Encoding", ""),
+            if_none_match=self.headers.get("If-None-Match"))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        perf_metrics.record("api.request", (time.perf_counter() - started) * 1000)
+
+    def log_message(self, format, *args):
+        # Her istek için satır yazılmaz; yük testinde konsol darboğaz olur
+        pass
+
+
+class LaunchApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512   # Yüzlerce eşzamanlı yerel istemci için bekleme kuyruğu
+
+    def __init__(self, api, host="127.0.0.1", port=DEFAULT_PORT):
+        super().__init__((host, port), ApiRequestHandler)
+        self.api = api
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve on a background thread."""
+        self.thread = threading.Thread(target=self.serve_forever, name="launch-api", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+
+def _data_signature(backend, csv_path):
+    if backend.name == "shared":
+        return backend.latest_version()
+    try:
+        stat = os.stat(csv_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def watch_dataset(api, csv_path, stop_event, backend_name=None):
+    """Standalone mode: load a backend and publish a new one whenever the data changes."""
+    version = 0
+    signature = object()
+    probe = launch_backends.create_backend(backend_name)
+    while not stop_event.is_set():
+        current = _data_signature(probe, csv_path)
+        if current != signature:
+            backend = launch_backends.create_backend(backend_name)
+            try:
+                backend.load(csv_path)
+            except (OSError, ValueError) as e:
+                print(f"Could not load {csv_path}: {e}")
+            else:
+                version += 1
+                signature = current
+                # Eski kaynağı kullanan istekler kendi başvurularıyla bitirir
+                api.publish(backend, version)
+                print(f"Serving dataset version {version} ({backend.count()} launches)")
+        stop_event.wait(WATCH_SECONDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve launch filters and aggregates as a read-only JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--csv", default=data_paths.LAUNCHES_CSV)
+    parser.add_argument("--backend", help="pandas, sqlite, duckdb or shared (default: SPACEX_BACKEND)")
+    args = parser.parse_args()
+
+    api = LaunchApi()
+    server = LaunchApiServer(api, args.host, args.port)
+    stop_event = threading.Event()
+    watcher = threading.Thread(target=watch_dataset, args=(api, args.csv, stop_event, args.backend), daemon=True)
+    watcher.start()
+    print(f"Launch API on {server.url}/api/launches (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
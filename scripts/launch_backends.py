@@ -0,0 +1,504 @@
+"""Data backends for the launch dataset.
+
+"pandas" keeps the whole CSV in a DataFrame (the original behaviour). "sqlite"
+and "duckdb" import the CSV in chunks into an embedded database next to it and
+push filters, aggregates and rocket lookups down as indexed SQL queries, so
+memory stays bounded by the page of rows the table shows.
+
+"shared" attaches read-only to the memory-mapped dataset published by
+scripts/data_service.py, so several dashboard windows share one copy.
+
+Select one with SPACEX_BACKEND=pandas|sqlite|duckdb|shared.
+"""
+import json
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+import launch_schema
+import perf_metrics
+from launch_sources import LAUNCH_FIELDS
+
+BOOL_COLUMNS = ["success", "upcoming", "tbd", "net", "auto_update"]
+IMPORT_CHUNK_ROWS = 100000
+SQL_PAGE_ROWS = 50000   # SQL modunda tabloya getirilen en fazla satır
+
+
+def prepare_launch_frame(df):
+    # Şemaya uymayan satırlar dışarıda kalır; CsvConvert bunları karantina dosyasına yazar
+    return launch_schema.validate(df)[0]
+
+
+def filter_frame(df, search="", year=None, success=None, date=None, launchpad=None):
+    # Arama filtresi
+    if search:
+        df = df[df['name'].str.lower().str.contains(search.lower(), regex=False)]
+
+    # Yıl filtresi
+    if year is not None:
+        df = df[df['year'] == year]
+
+    # Başarı filtresi
+    if success is True:
+        df = df[df['success'] == True]
+    elif success is False:
+        df = df[df['success'] == False]
+
+    # Gün filtresi (UTC, "YYYY-MM-DD")
+    if date is not None:
+        df = df[df['date_utc'].dt.floor('D') == pd.Timestamp(date, tz='UTC')]
+
+    # Rampa filtresi (harita kümesindeki rampa kimlikleri)
+    if launchpad:
+        df = df[df['launchpad'].isin(launchpad)]
+    return df
+
+
+def diff_launches(old_df, new_df):
+    """Keyed diff on launch id: returns (inserted, updated, deleted) id lists."""
+    old = old_df.set_index('id')
+    new = new_df.set_index('id')
+    # Paylaşılan anlık görüntülerde metin sütunları kategoriktir; sürümlerin kategorileri farklı olabilir
+    old.index, new.index = old.index.astype(object), new.index.astype(object)
+    inserted = new.index.difference(old.index)
+    deleted = old.index.difference(new.index)
+    common = new.index.intersection(old.index)
+
+    columns = [c for c in new.columns if c in old.columns]
+    old_common = old.loc[common, columns]
+    new_common = new.loc[common, columns]
+    # Sütun bazında karşılaştırma; iki tarafta da boş olan değerler eşit sayılır
+    changed = pd.Series(False, index=common)
+    for column in columns:
+        a = old_common[column]
+        b = new_common[column]
+        if isinstance(a.dtype, pd.CategoricalDtype) or isinstance(b.dtype, pd.CategoricalDtype):
+            a, b = a.astype(object), b.astype(object)
+        changed |= ~((a == b) | (a.isna() & b.isna()))
+    updated = common[changed.to_numpy()]
+    return list(inserted), list(updated), list(deleted)
+
+
+def launch_columns_frame(date_utc, success, rocket, launchpad):
+    """Per-launch columns for the cadence and reliability analytics.
+
+    epoch is UTC seconds (int64), success is 1.0 / 0.0 / NaN.
+    """
+    epoch = date_utc.dt.tz_convert(None).to_numpy(dtype="datetime64[s]").astype("int64")
+    # Doğrulanmış True/False/NaN ya da SQL'deki 1/0/NULL (pandas 3'te 1.0, True anahtarıyla eşleşmez)
+    if pd.api.types.is_numeric_dtype(success) and not pd.api.types.is_bool_dtype(success):
+        success = success.astype(float)
+    else:
+        success = success.map({True: 1.0, False: 0.0}).astype(float)
+    return pd.DataFrame({"epoch": epoch, "success": success.to_numpy(),
+                         "rocket": rocket.to_numpy(dtype=object), "launchpad": launchpad.to_numpy(dtype=object)})
+
+
+def _to_bool_code(values):
+    # True -> 1, False -> 0, boş -> NULL
+    return values.map({True: 1, False: 0}).astype("Int64")
+
+
+class PandasBackend:
+    name = "pandas"
+    in_memory = True
+
+    def __init__(self):
+        self.df = pd.DataFrame(columns=LAUNCH_FIELDS + ['year'])
+        self.rockets_info = []
+
+    def load(self, csv_path):
+        self.df = prepare_launch_frame(pd.read_csv(csv_path))
+
+    def upsert(self, row_df):
+        """Replace launches with the same id or append them; returns their index labels."""
+        labels = []
+        for i in range(len(row_df)):
+            row = row_df.iloc[[i]]
+            matches = self.df.index[self.df['id'] == row['id'].iloc[0]]
+            if len(matches):
+                # Satır yerinde değişir; sıra ve tablo konumu korunur
+                label = matches[0]
+                self.df = pd.concat([self.df.drop(index=label), row.set_axis([label])]).sort_index()
+            else:
+                label = self.df.index.max() + 1 if len(self.df) else 0
+                self.df = pd.concat([self.df, row.set_axis([label])])
+            labels.append(label)
+        return labels
+
+    def set_rockets(self, rockets_info):
+        self.rockets_info = rockets_info
+
+    def years(self):
+        return sorted(int(year) for year in self.df['year'].unique())
+
+    def query(self, search="", year=None, success=None, limit=None, date=None, offset=0, launchpad=None):
+        result = filter_frame(self.df, search, year, success, date, launchpad)
+        if offset:
+            result = result.iloc[offset:]
+        return result.head(limit) if limit else result
+
+    def count(self, search="", year=None, success=None, date=None, launchpad=None):
+        return len(filter_frame(self.df, search, year, success, date, launchpad))
+
+    def stats(self):
+        total = len(self.df)
+        successful = int((self.df['success'] == True).sum())
+        past = self.df[self.df['upcoming'] != True] if 'upcoming' in self.df else self.df
+        latest = past.loc[past['date_utc'].idxmax(), 'name'] if not past.empty else None
+        first_year = self.df['year'].min() if total else None
+        return {"total": total, "successful": successful, "first_year": first_year, "latest_name": latest}
+
+    def launches_per_year(self):
+        return self.df['year'].value_counts().sort_index()
+
+    def success_counts(self):
+        return self.df['success'].value_counts()
+
+    def success_rate_by_year(self):
+        return self.df.groupby('year')['success'].mean() * 100
+
+    def launch_columns(self):
+        return launch_columns_frame(self.df['date_utc'], self.df['success'], self.df['rocket'], self.df['launchpad'])
+
+    def rocket_for_launch(self, launch_id):
+        rows = self.df.loc[self.df['id'] == launch_id, 'rocket']
+        if rows.empty:
+            return None
+        rocket_id = rows.iloc[0]
+        return next((r for r in self.rockets_info if r['id'] == rocket_id), None)
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    name = "sqlite"
+    in_memory = False
+    extension = ".sqlite"
+    index_before_swap = True
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path
+        self.path = db_path
+        self.conn = None
+        self.staged_page = None
+        self.df = pd.DataFrame(columns=LAUNCH_FIELDS + ['year'])   # Yalnızca geçerli sayfa
+
+    def connect(self, path):
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def execute(self, sql, params=()):
+        return self.conn.execute(sql, params)
+
+    def read_sql(self, sql, params=()):
+        cursor = self.conn.execute(sql, params)
+        columns = [d[0] for d in cursor.description]
+        return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+    def load(self, csv_path):
+        if self.conn is None:
+            self.path = self.db_path or os.path.splitext(csv_path)[0] + self.extension
+            self.conn = self.connect(self.path)
+        self.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        signature = self._csv_signature(csv_path)
+        row = self.execute("SELECT value FROM meta WHERE key = 'csv_signature'").fetchone()
+        if row is None or row[0] != signature or not self._has_table("launches"):
+            self._import_csv(csv_path, "launches")
+            self._create_indexes("launches")
+            self._set_signature(signature)
+        self.df = self.query(limit=SQL_PAGE_ROWS)
+
+    def reload(self, csv_path):
+        """Re-import the CSV into a staging table and swap it in; returns (inserted, updated, deleted) ids."""
+        diff = self.prepare_reload(csv_path)
+        self.commit_reload(csv_path)
+        return diff
+
+    def prepare_reload(self, csv_path, page_filters=None):
+        """Import the CSV into an indexed staging table on a second connection; returns the diff.
+
+        Only reads the live table, so it can run off the GUI thread while queries continue.
+        With page_filters, the first page of the new data is queried too (staged_page).
+        """
+        staging = type(self)(self.db_path)
+        staging.conn = self.sibling_connection()
+        try:
+            staging._import_csv(csv_path, "launches_new")
+            if self.index_before_swap:
+                # İndeks adları her seferinde farklı; tablo yeniden adlandırılınca eski adlarla çakışmaz
+                staging._create_indexes("launches_new", prefix=f"launches_{time.time_ns():x}")
+            columns = ", ".join(f'"{field}"' for field in LAUNCH_FIELDS)
+            inserted = [r[0] for r in staging.execute(
+                "SELECT id FROM launches_new EXCEPT SELECT id FROM launches").fetchall()]
+            deleted = [r[0] for r in staging.execute(
+                "SELECT id FROM launches EXCEPT SELECT id FROM launches_new").fetchall()]
+            changed = [r[0] for r in staging.execute(
+                f"SELECT id FROM (SELECT {columns} FROM launches_new EXCEPT SELECT {columns} FROM launches)").fetchall()]
+            if page_filters is not None:
+                self.staged_page = staging.query(**page_filters, limit=SQL_PAGE_ROWS, table="launches_new")
+        finally:
+            staging.conn.close()
+        inserted_set = set(inserted)
+        updated = [launch_id for launch_id in changed if launch_id not in inserted_set]
+        return inserted, updated, deleted
+
+    def commit_reload(self, csv_path):
+        """Swap the staging table prepared by prepare_reload in (a rename, no re-import)."""
+        self.execute("DROP TABLE launches")
+        self.execute("ALTER TABLE launches_new RENAME TO launches")
+        if not self.index_before_swap:
+            self._create_indexes("launches")
+        self._set_signature(self._csv_signature(csv_path))
+
+    def sibling_connection(self):
+        return self.connect(self.path)
+
+    def _csv_signature(self, csv_path):
+        stat = os.stat(csv_path)
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _set_signature(self, signature):
+        self.execute("DELETE FROM meta WHERE key = 'csv_signature'")
+        self.execute("INSERT INTO meta (key, value) VALUES ('csv_signature', ?)", (signature,))
+        self.conn.commit()
+
+    def _has_table(self, table):
+        return self.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+    def _create_table(self, table):
+        column_types = {field: "TEXT" for field in LAUNCH_FIELDS}
+        column_types.update({"flight_number": "INTEGER", "date_unix": "INTEGER", "window": "INTEGER"})
+        column_types.update({field: "INTEGER" for field in BOOL_COLUMNS})
+        columns = ", ".join(f'"{field}" {column_types[field]}' for field in LAUNCH_FIELDS)
+        self.execute(f"DROP TABLE IF EXISTS {table}")
+        self.execute(f"CREATE TABLE {table} ({columns}, year INTEGER, name_lower TEXT)")
+
+    def _normalise_chunk(self, chunk):
+        chunk = prepare_launch_frame(chunk)
+        for column in BOOL_COLUMNS:
+            if column in chunk:
+                chunk[column] = _to_bool_code(chunk[column])
+        chunk['date_utc'] = chunk['date_utc'].dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        chunk['name_lower'] = chunk['name'].astype(str).str.lower()
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        return chunk[LAUNCH_FIELDS + ['year', 'name_lower']]
+
+    def _import_csv(self, csv_path, table):
+        # Parça parça içe aktarım: bellek kullanımı parça boyutuyla sınırlı
+        self._create_table(table)
+        placeholders = ", ".join("?" for _ in range(len(LAUNCH_FIELDS) + 2))
+        for chunk in pd.read_csv(csv_path, chunksize=IMPORT_CHUNK_ROWS):
+            chunk = self._normalise_chunk(chunk)
+            self.conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})",
+                                  chunk.itertuples(index=False, name=None))
+        self.conn.commit()
+
+    def _create_indexes(self, table, prefix=None):
+        prefix = prefix or table
+        for name, columns in [("id", "id"), ("year", "year, success"), ("success", "success"),
+                              ("date", "date_utc"), ("rocket", "rocket"), ("launchpad", "launchpad")]:
+            unique = "UNIQUE " if name == "id" else ""
+            self.execute(f"DROP INDEX IF EXISTS idx_{prefix}_{name}")
+            self.execute(f"CREATE {unique}INDEX IF NOT EXISTS idx_{prefix}_{name} ON {table} ({columns})")
+        self.conn.commit()
+
+    def upsert(self, row_df):
+        chunk = self._normalise_chunk(row_df.copy())
+        placeholders = ", ".join("?" for _ in range(len(LAUNCH_FIELDS) + 2))
+        # Var olan satır yerinde güncellenir; rowid ve dolayısıyla tablo sırası pandas arka ucundaki gibi korunur
+        assignments = ", ".join(f'"{column}" = ?' for column in chunk.columns[1:])
+        for row in chunk.itertuples(index=False, name=None):
+            # DuckDB UPDATE için rowcount bildirmez; varlık indeksli id ile sorgulanır
+            if self.execute("SELECT 1 FROM launches WHERE id = ?", (row[0],)).fetchone():
+                self.execute(f"UPDATE launches SET {assignments} WHERE id = ?", row[1:] + row[:1])
+            else:
+                self.execute(f"INSERT INTO launches VALUES ({placeholders})", row)
+        self.conn.commit()
+
+    def set_rockets(self, rockets_info):
+        self.execute("CREATE TABLE IF NOT EXISTS rockets (id TEXT PRIMARY KEY, name TEXT, document TEXT)")
+        self.execute("DELETE FROM rockets")
+        self.conn.executemany("INSERT INTO rockets (id, name, document) VALUES (?, ?, ?)",
+                              [(r['id'], r.get('name'), json.dumps(r)) for r in rockets_info])
+        self.conn.commit()
+
+    def _frame(self, df):
+        # SQL satırlarını pandas arka ucunun ürettiği tiplere çevir
+        if df.empty:
+            return pd.DataFrame(columns=LAUNCH_FIELDS + ['year'])
+        df['date_utc'] = pd.to_datetime(df['date_utc'], utc=True)
+        for column in BOOL_COLUMNS:
+            df[column] = df[column].map({1: True, 0: False}).astype(object)
+        df['year'] = df['year'].astype(int)
+        # Şemada window ondalıklı saniye; SQL tam sayı olarak döndürebilir
+        df['window'] = df['window'].astype(float)
+        return df
+
+    def where_clause(self, search="", year=None, success=None, date=None, launchpad=None):
+        clauses, params = [], []
+        if search:
+            clauses.append("instr(name_lower, ?) > 0")
+            params.append(search.lower())
+        if year is not None:
+            clauses.append("year = ?")
+            params.append(int(year))
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(1 if success else 0)
+        if date is not None:
+            # date_utc ISO metin olarak saklanır; ilk 10 karakter UTC günüdür
+            clauses.append("substr(date_utc, 1, 10) = ?")
+            params.append(str(date))
+        if launchpad:
+            clauses.append(f"launchpad IN ({', '.join('?' for _ in launchpad)})")
+            params.extend(launchpad)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, search="", year=None, success=None, limit=None, table="launches", date=None, offset=0,
+              launchpad=None):
+        where, params = self.where_clause(search, year, success, date, launchpad)
+        columns = ", ".join(f'"{field}"' for field in LAUNCH_FIELDS)
+        sql = f"SELECT {columns}, year FROM {table}{where} ORDER BY rowid"
+        if limit or offset:
+            # SQLite OFFSET'i yalnızca LIMIT ile kabul eder
+            sql += f" LIMIT {int(limit) if limit else 2 ** 63 - 1}"
+        if offset:
+            sql += f" OFFSET {int(offset)}"
+        return self._frame(self.read_sql(sql, params))
+
+    def count(self, search="", year=None, success=None, date=None, launchpad=None):
+        where, params = self.where_clause(search, year, success, date, launchpad)
+        return int(self.execute(f"SELECT COUNT(*) FROM launches{where}", params).fetchone()[0])
+
+    def years(self):
+        return [int(r[0]) for r in self.execute("SELECT DISTINCT year FROM launches ORDER BY year").fetchall()]
+
+    def stats(self):
+        total, successful, first_year = self.execute(
+            "SELECT COUNT(*), COALESCE(SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END), 0), MIN(year) FROM launches").fetchone()
+        latest = self.execute(
+            "SELECT name FROM launches WHERE upcoming IS NULL OR upcoming <> 1 ORDER BY date_utc DESC LIMIT 1").fetchone()
+        return {"total": int(total), "successful": int(successful),
+                "first_year": first_year, "latest_name": latest[0] if latest else None}
+
+    def launches_per_year(self):
+        rows = self.execute("SELECT year, COUNT(*) FROM launches GROUP BY year ORDER BY year").fetchall()
+        return pd.Series([r[1] for r in rows], index=pd.Index([r[0] for r in rows], name='year'), name='count')
+
+    def success_counts(self):
+        rows = self.execute("SELECT success, COUNT(*) AS n FROM launches WHERE success IS NOT NULL "
+                            "GROUP BY success ORDER BY n DESC").fetchall()
+        return pd.Series([r[1] for r in rows], index=pd.Index([bool(r[0]) for r in rows], name='success'), name='count')
+
+    def success_rate_by_year(self):
+        rows = self.execute("SELECT year, AVG(success) * 100 FROM launches GROUP BY year ORDER BY year").fetchall()
+        return pd.Series([r[1] for r in rows], index=pd.Index([r[0] for r in rows], name='year'),
+                         name='success', dtype=float)
+
+    def launch_columns(self):
+        df = self.read_sql("SELECT date_utc, success, rocket, launchpad FROM launches ORDER BY rowid")
+        date_utc = pd.to_datetime(df['date_utc'], format="%Y-%m-%dT%H:%M:%S.%fZ", utc=True)
+        return launch_columns_frame(date_utc, df['success'], df['rocket'], df['launchpad'])
+
+    def rocket_for_launch(self, launch_id):
+        row = self.execute("SELECT r.document FROM launches l JOIN rockets r ON r.id = l.rocket "
+                           "WHERE l.id = ? LIMIT 1", (launch_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class DuckDBBackend(SQLiteBackend):
+    name = "duckdb"
+    extension = ".duckdb"
+    index_before_swap = False   # İndeksli tablo yeniden adlandırılamaz
+
+    def connect(self, path):
+        import duckdb
+        return duckdb.connect(path)
+
+    def _has_table(self, table):
+        return self.execute("SELECT 1 FROM information_schema.tables WHERE table_name = ?", (table,)).fetchone() is not None
+
+    def _import_csv(self, csv_path, table):
+        self._create_table(table)
+        for chunk in pd.read_csv(csv_path, chunksize=IMPORT_CHUNK_ROWS):
+            chunk = self._normalise_chunk(chunk)
+            self.conn.register("launch_chunk", chunk)
+            self.execute(f"INSERT INTO {table} SELECT * FROM launch_chunk")
+            self.conn.unregister("launch_chunk")
+        self.conn.commit()
+
+    def sibling_connection(self):
+        # Aynı veritabanına ikinci bağlantı; başka bir iş parçacığında güvenle kullanılabilir
+        return self.conn.cursor()
+
+    def _create_indexes(self, table, prefix=None):
+        # DuckDB sütun tabanlı; min/max bölge haritaları filtreler için yeterli, yalnızca id indekslenir
+        prefix = prefix or table
+        self.execute(f"DROP INDEX IF EXISTS idx_{prefix}_id")
+        self.execute(f"CREATE UNIQUE INDEX idx_{prefix}_id ON {table} (id)")
+
+
+class SharedBackend(PandasBackend):
+    """Pandas backend over the snapshot published by the data service.
+
+    Falls back to reading the CSV when no service has published a dataset yet.
+    """
+    name = "shared"
+
+    def __init__(self):
+        super().__init__()
+        self.version = None
+        self.counter = None
+
+    def load(self, csv_path):
+        import data_service
+        latest = data_service.open_latest()
+        if latest is None:
+            # Servis henüz yayın yapmadı; CSV doğrudan okunur
+            perf_metrics.count("shared.csv_fallback")
+            super().load(csv_path)
+            return
+        self.version, self.df, _ = latest
+
+    def latest_version(self):
+        """Version most recently published by the service (a read from the shared counter)."""
+        import data_service
+        if self.counter is None:
+            path = os.path.join(data_service.SHARED_DIR, data_service.VERSION_FILE)
+            if not os.path.exists(path):
+                return None
+            self.counter = data_service.VersionCounter(path)
+        return self.counter.value
+
+    def open_latest(self):
+        import data_service
+        return data_service.open_latest(since_version=self.version)
+
+    def request_refresh(self):
+        import data_service
+        data_service.request_refresh()
+
+    def close(self):
+        if self.counter is not None:
+            self.counter.close()
+            self.counter = None
+
+
+BACKENDS = {"pandas": PandasBackend, "sqlite": SQLiteBackend, "duckdb": DuckDBBackend, "shared": SharedBackend}
+
+
+def create_backend(name=None):
+    name = (name or os.environ.get("SPACEX_BACKEND", "pandas")).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown data backend: {name} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
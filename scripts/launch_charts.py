@@ -0,0 +1,288 @@
+"""Chart definitions shared by the dashboard's Charts tab and the report renderer.
+
+Each chart draws onto a matplotlib Figure from a data source with the
+backend aggregate methods (launches_per_year, success_counts,
+success_rate_by_year, launch_columns), so the same code serves the Qt canvas
+and headless Agg/SVG/PDF output. `labels` maps rocket and launchpad ids to
+display names.
+
+The launchpad map takes coordinates from labels["launchpad_location"]
+({id: (latitude, longitude)}) and returns its launch_map.MapView, which the
+dashboard uses to zoom, pan and pick clusters.
+
+The event timing chart reads launch timelines from the source's
+launch_timeline store (timelines() when the source keeps one, otherwise
+data/launch_timelines.npz) and draws precomputed per-event, per-rocket
+quantiles as a few bar and line collections instead of raw samples.
+
+The rolling reliability chart takes its engine from the source when it keeps
+one (the dashboard updates it incrementally), otherwise builds it from the
+launch columns. The cadence charts are computed with NumPy over the whole
+dataset and drawn as a single image/mesh artist, so they stay responsive with
+millions of launches.
+"""
+import numpy as np
+import pandas as pd
+
+import launch_map
+import launch_timeline
+import reliability
+
+THEME = "space-blue"  # Renkler değişirse adı da değişmeli; önbellek anahtarının parçası
+FIGURE_FACECOLOR = '#161b22'
+AXES_FACECOLOR = '#161b22'
+TITLE_COLOR = '#c9d1d9'
+LABEL_COLOR = '#8b949e'
+
+
+def style_axes(ax):
+    ax.set_facecolor(AXES_FACECOLOR)
+    [t.set_color(LABEL_COLOR) for t in ax.get_xticklabels()]
+    [t.set_color(LABEL_COLOR) for t in ax.get_yticklabels()]
+    ax.xaxis.label.set_color(LABEL_COLOR)
+    ax.yaxis.label.set_color(LABEL_COLOR)
+    ax.title.set_color(TITLE_COLOR)
+
+
+def launches_per_year(ax, source, labels):
+    launch_counts = source.launches_per_year()
+    bars = launch_counts.plot(kind='bar', ax=ax, color='#3a86ff')
+
+    # Her bir bar'ı tıklanabilir yap
+    for bar in bars.patches:
+        bar.set_picker(True)
+
+    ax.set_title('Launches per Year', pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.set_xlabel('Year', labelpad=15, color=LABEL_COLOR)
+    ax.set_ylabel('Number of Launches', labelpad=15, color=LABEL_COLOR)
+    return launch_counts
+
+
+def success_failure_distribution(ax, source, labels):
+    success_counts = source.success_counts()
+    labels = ['Successful' if success_counts.index[i] else 'Failed' for i in range(len(success_counts))]
+    colors = ['#1d914b' if 'Success' in l else '#c93c37' for l in labels]
+    wedges, texts, autotexts = ax.pie(success_counts, labels=labels, autopct='%1.1f%%', startangle=140, colors=colors,
+                                      wedgeprops=dict(width=0.4, edgecolor='w'))
+
+    # Tıklama için ID ata
+    for i, wedge in enumerate(wedges):
+        wedge.set_picker(True)
+        if 'Success' in labels[i]:
+            wedge.set_gid('success_wedge')
+        else:
+            wedge.set_gid('failure_wedge')
+
+    ax.set_title('Success vs. Failure Distribution', pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.axis('equal')
+    return success_counts
+
+
+def success_rate_by_year(ax, source, labels):
+    yearly_success = source.success_rate_by_year()
+    yearly_success.plot(kind='line', marker='o', color='#3a86ff', ax=ax)
+    ax.set_title('Success Rate by Year (%)', pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.set_xlabel('Year', labelpad=15, color=LABEL_COLOR)
+    ax.set_ylabel('Success Rate (%)', labelpad=15, color=LABEL_COLOR)
+    ax.set_ylim(0, 100)
+    return yearly_success
+
+
+MONTH_STARTS = [1, 32, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335]
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+# Ardışık iki fırlatma arasındaki süre dilimleri (gün)
+TURNAROUND_EDGES = [0, 1, 3, 7, 14, 30, 60, 90, 180, 365, 730, 36500]
+GROUP_COLORS = ['#3a86ff', '#1d914b', '#f4a261', '#c93c37', '#9d4edd', '#8b949e']
+
+
+def _no_data(ax, title, message="No launch data"):
+    ax.text(0.5, 0.5, message, ha='center', va='center', color=LABEL_COLOR, transform=ax.transAxes)
+    ax.set_title(title, pad=20, fontsize=16, color=TITLE_COLOR)
+    return None
+
+
+def calendar_counts(epoch):
+    """Launch counts per (year, day of year) as a 2D array; returns (counts, first_year)."""
+    dates = np.asarray(epoch, dtype="int64").astype("datetime64[s]")
+    years = dates.astype("datetime64[Y]")
+    day_of_year = (dates.astype("datetime64[D]") - years).astype("int64") + 1
+    years = years.astype("int64") + 1970
+    first_year, last_year = int(years.min()), int(years.max())
+    counts, _, _ = np.histogram2d(years, day_of_year, bins=[last_year - first_year + 1, 366],
+                                  range=[[first_year - 0.5, last_year + 0.5], [0.5, 366.5]])
+    return counts, first_year
+
+
+def launch_calendar(ax, source, labels):
+    columns = source.launch_columns()
+    if columns.empty:
+        return _no_data(ax, 'Launch Calendar')
+    counts, first_year = calendar_counts(columns['epoch'].to_numpy())
+    last_year = first_year + counts.shape[0] - 1
+    # Tek bir görüntü öğesi: milyonlarca fırlatmada da çizim maliyeti sabit
+    image = ax.imshow(np.ma.masked_equal(counts, 0), aspect='auto', origin='lower', interpolation='nearest',
+                      extent=(0.5, 366.5, first_year - 0.5, last_year + 0.5), cmap='plasma', picker=True)
+    image.set_gid('calendar_heatmap')
+    colorbar = ax.figure.colorbar(image, ax=ax, pad=0.01)
+    colorbar.set_label('Launches per day', color=LABEL_COLOR)
+    colorbar.ax.tick_params(colors=LABEL_COLOR)
+    ax.set_xticks(MONTH_STARTS, MONTH_NAMES)
+    ax.set_yticks(range(first_year, last_year + 1, max(1, (last_year - first_year) // 20 + 1)))
+    ax.tick_params(colors=LABEL_COLOR)
+    ax.set_title('Launch Calendar (day of year × year, UTC)', pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.set_xlabel('Day of Year', labelpad=15, color=LABEL_COLOR)
+    ax.set_ylabel('Year', labelpad=15, color=LABEL_COLOR)
+    return {"first_year": first_year, "last_year": last_year}
+
+
+def turnaround_gaps(epoch, groups):
+    """Days between consecutive launches of the same group; returns (gaps, group codes, group ids)."""
+    codes, uniques = pd.factorize(pd.Series(groups).fillna("unknown"))
+    epoch = np.asarray(epoch, dtype="int64")
+    order = np.lexsort((epoch, codes))
+    codes_sorted = codes[order]
+    same_group = codes_sorted[1:] == codes_sorted[:-1]
+    gaps = np.diff(epoch[order]) / 86400.0
+    return gaps[same_group], codes_sorted[1:][same_group], list(uniques)
+
+
+def _turnaround(ax, source, labels, group, title):
+    columns = source.launch_columns()
+    if columns.empty:
+        return _no_data(ax, title)
+    gaps, gap_groups, group_ids = turnaround_gaps(columns['epoch'].to_numpy(), columns[group])
+    edges = np.asarray(TURNAROUND_EDGES, dtype=float)
+    counts, _, _ = np.histogram2d(gap_groups, np.clip(gaps, 0, edges[-1] - 1),
+                                  bins=[np.arange(len(group_ids) + 1) - 0.5, edges])
+    medians = pd.Series(gaps).groupby(gap_groups).median()
+    names = (labels or {}).get(group, {})
+    row_labels = [f"{names.get(group_id, group_id)}  (median {medians[i]:.1f} d)" if i in medians.index
+                  else str(names.get(group_id, group_id)) for i, group_id in enumerate(group_ids)]
+
+    # Dilimler eşit aralıklı çizilir; tek QuadMesh öğesi
+    mesh = ax.pcolormesh(np.arange(len(edges)), np.arange(len(group_ids) + 1) - 0.5,
+                         np.ma.masked_equal(counts, 0), cmap='viridis', picker=True)
+    mesh.set_gid(f'turnaround_{group}')
+    colorbar = ax.figure.colorbar(mesh, ax=ax, pad=0.01)
+    colorbar.set_label('Turnarounds', color=LABEL_COLOR)
+    colorbar.ax.tick_params(colors=LABEL_COLOR)
+    ax.set_xticks(np.arange(len(edges)), [f"{int(e)}" for e in edges[:-1]] + ["∞"])
+    ax.set_yticks(np.arange(len(group_ids)), row_labels)
+    ax.tick_params(colors=LABEL_COLOR)
+    ax.set_title(title, pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.set_xlabel('Days since previous launch', labelpad=15, color=LABEL_COLOR)
+    return {"group": group, "group_ids": group_ids, "row_labels": row_labels, "edges": list(edges), "counts": counts}
+
+
+def turnaround_by_launchpad(ax, source, labels):
+    return _turnaround(ax, source, labels, 'launchpad', 'Turnaround Time by Launchpad')
+
+
+def turnaround_by_rocket(ax, source, labels):
+    return _turnaround(ax, source, labels, 'rocket', 'Turnaround Time by Rocket')
+
+
+def rolling_success_by_rocket(ax, source, labels):
+    engine = reliability.engine_for(source)
+    title = f'Rolling Success Rate by Rocket (last {engine.window} launches, 95% CI)'
+    if not len(engine):
+        return _no_data(ax, title)
+    summaries = engine.summaries('rocket')
+    names = (labels or {}).get('rocket', {})
+    for rocket_id, summary in summaries.sort_values('launches', ascending=False).iterrows():
+        series = engine.series('rocket', rocket_id)
+        dates = pd.to_datetime(series['epoch'], unit='s')
+        streak = f"{summary['current_streak']} {'success' if summary['current_streak_success'] else 'failure'}"
+        line, = ax.plot(dates, series['rate'] * 100, drawstyle='steps-post', linewidth=1.5,
+                        label=f"{names.get(rocket_id, rocket_id)} – {summary['rate'] * 100:.1f}%, streak {streak}")
+        ax.fill_between(dates, series['low'] * 100, series['high'] * 100, step='post',
+                        color=line.get_color(), alpha=0.15, linewidth=0)
+    ax.legend(loc='lower right', facecolor=AXES_FACECOLOR, edgecolor=LABEL_COLOR, labelcolor=TITLE_COLOR)
+    ax.set_ylim(0, 105)
+    ax.set_title(title, pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.set_xlabel('Date', labelpad=15, color=LABEL_COLOR)
+    ax.set_ylabel('Success Rate (%)', labelpad=15, color=LABEL_COLOR)
+    return summaries
+
+
+def launchpad_map(ax, source, labels):
+    title = 'Launches by Launchpad'
+    columns = source.launch_columns()
+    locations = (labels or {}).get('launchpad_location') or {}
+    index = launch_map.PadClusterIndex.from_columns(columns['launchpad'], columns['success'], locations)
+    if not len(index):
+        return _no_data(ax, title, "No launchpad coordinates (run scripts/enrich_launches.py)"
+                        if len(columns) else "No launch data")
+    # Rampalar ızgara hücrelerinde kümelenir; görünüm değiştikçe yalnızca görünen hücreler çizilir
+    view = launch_map.MapView(ax, index, (labels or {}).get('launchpad'))
+    colorbar = ax.figure.colorbar(view.scatter, ax=ax, pad=0.01)
+    colorbar.set_label('Success rate', color=LABEL_COLOR)
+    colorbar.ax.tick_params(colors=LABEL_COLOR)
+    ax.tick_params(colors=LABEL_COLOR)
+    ax.set_title(title, pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.set_xlabel('Longitude (°)', labelpad=15, color=LABEL_COLOR)
+    ax.set_ylabel('Latitude (°)', labelpad=15, color=LABEL_COLOR)
+    return view
+
+
+def event_timing_by_rocket(ax, source, labels):
+    title = 'Event Timing by Rocket (T+ seconds)'
+    store = launch_timeline.store_for(source)
+    if not store.event_count:
+        return _no_data(ax, title, "No launch timelines")
+    stats = store.distributions('rocket')
+    events = list(dict.fromkeys(stats['event']))
+    launches = pd.Series(np.bincount(store.rocket, minlength=len(store.rockets)), index=store.rockets)
+    rockets = list(launches[launches > 0].sort_values(ascending=False, kind='stable').index)
+    names = (labels or {}).get('rocket', {})
+    # Olay başına bir satır; roketler satır içinde yan yana kutular
+    height = 0.8 / len(rockets)
+    row = stats['event'].map({event: i for i, event in enumerate(events)}).to_numpy()
+    slot = stats['rocket'].map({rocket: i for i, rocket in enumerate(rockets)}).to_numpy()
+    y = row - 0.4 + (slot + 0.5) * height
+    for i, rocket in enumerate(rockets):
+        part = (slot == i)
+        color = GROUP_COLORS[i % len(GROUP_COLORS)]
+        rows = stats[part]
+        ax.hlines(y[part], rows['p05'], rows['p95'], color=color, linewidth=1, alpha=0.8)
+        ax.barh(y[part], rows['p75'] - rows['p25'], height * 0.8, left=rows['p25'], color=color, alpha=0.6,
+                label=f"{names.get(rocket, rocket)} ({launches[rocket]} launches)")
+        ax.vlines(rows['median'], y[part] - height * 0.4, y[part] + height * 0.4, color=TITLE_COLOR, linewidth=1)
+    ax.axvline(0, color=LABEL_COLOR, linewidth=0.8, linestyle=':')
+    # Geri sayım (dakikalar) ve uçuş (saniyeler) aynı eksende okunabilsin
+    ax.set_xscale('symlog', linthresh=10)
+    # Çubukların kenar yapışması kapatılır; ilk ve son olaylar eksenin kenarına dayanmasın
+    ax.use_sticky_edges = False
+    ax.margins(x=0.03)
+    ax.set_yticks(range(len(events)), events)
+    ax.set_ylim(len(events) - 0.5, -0.5)
+    ax.tick_params(colors=LABEL_COLOR)
+    ax.legend(loc='upper right', facecolor=AXES_FACECOLOR, edgecolor=LABEL_COLOR, labelcolor=TITLE_COLOR)
+    ax.set_title(title, pad=20, fontsize=16, color=TITLE_COLOR)
+    ax.set_xlabel('Seconds from liftoff (box: p25–p75, line: p5–p95, tick: median)', labelpad=15, color=LABEL_COLOR)
+    return stats
+
+
+CHARTS = {
+    "Launches per Year": launches_per_year,
+    "Success/Failure Distribution": success_failure_distribution,
+    "Success Rate by Year": success_rate_by_year,
+    "Launch Calendar": launch_calendar,
+    "Turnaround by Launchpad": turnaround_by_launchpad,
+    "Turnaround by Rocket": turnaround_by_rocket,
+    "Rolling Reliability by Rocket": rolling_success_by_rocket,
+    "Launchpad Map": launchpad_map,
+    "Event Timing by Rocket": event_timing_by_rocket,
+}
+CHART_TYPES = list(CHARTS)
+
+
+def draw_chart(figure, chart_type, source, labels=None):
+    """Clear `figure` and draw `chart_type`; returns the aggregate the chart was drawn from."""
+    figure.clear()
+    ax = figure.add_subplot(111)
+    style_axes(ax)
+    data = CHARTS[chart_type](ax, source, labels)
+    ax.grid(True, linestyle='--', alpha=0.2)
+    figure.tight_layout()
+    return data
@@ -0,0 +1,185 @@
+"""Launchpad map: a quadtree grid spatial index with level-of-detail clustering.
+
+Launches are first reduced to one weighted point per launchpad (coordinates
+cached in data/spacex_related.sqlite by enrich_launches.py, with launch and
+success counts). PadClusterIndex then buckets those points into square
+longitude/latitude cells at every level of a quadtree (cell size
+360° / 2**level) and keeps, per occupied cell, the launch-weighted centroid,
+the counts and the pads in it.
+
+MapView picks the level at which about TARGET_CELLS cells span the visible
+width and only visits the cells inside the viewport, so zooming and panning
+redraw a number of clusters bounded by the viewport, not by the number of
+launches or pads.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+MAX_LEVEL = 16       # ~0.005° hücre; aynı tesisteki rampalar da ayrılır
+TARGET_CELLS = 12    # Görünür genişlikte hedeflenen hücre sayısı
+MIN_SPAN = 0.05      # En yakın yakınlaştırmada görünen boylam aralığı (derece)
+HOME_MARGIN = 0.15
+WORLD = (-180.0, 180.0, -90.0, 90.0)
+
+Cluster = namedtuple("Cluster", "longitude latitude launches successes decided pads")
+
+
+class PadClusterIndex:
+    """Weighted launchpad points bucketed into quadtree cells, one dict of cells per level."""
+
+    def __init__(self, pad_ids, latitude, longitude, launches, successes, decided, max_level=MAX_LEVEL):
+        self.pad_ids = list(pad_ids)
+        self.latitude = np.asarray(latitude, dtype=float)
+        self.longitude = np.asarray(longitude, dtype=float)
+        self.launches = np.asarray(launches, dtype=float)
+        self.successes = np.asarray(successes, dtype=float)
+        self.decided = np.asarray(decided, dtype=float)
+        self.total = float(self.launches.sum())
+        self.max_level = max_level
+        self.levels = {}   # Seviye ilk sorgulandığında kurulur
+
+    @classmethod
+    def from_columns(cls, launchpad, success, locations, max_level=MAX_LEVEL):
+        """Index from per-launch launchpad ids and success (1.0/0.0/NaN); pads without coordinates are skipped."""
+        frame = pd.DataFrame({"launchpad": np.asarray(launchpad, dtype=object), "success": np.asarray(success, dtype=float)})
+        frame = frame[frame["launchpad"].isin(list(locations))]
+        # Fırlatma sayısı kadar nokta yerine rampa başına tek ağırlıklı nokta
+        counts = frame.groupby("launchpad", sort=True)["success"].agg(["size", "sum", "count"])
+        coordinates = np.array([locations[pad] for pad in counts.index], dtype=float).reshape(-1, 2)
+        return cls(counts.index, coordinates[:, 0], coordinates[:, 1], counts["size"], counts["sum"], counts["count"],
+                   max_level)
+
+    def __len__(self):
+        return len(self.pad_ids)
+
+    @staticmethod
+    def cell_size(level):
+        return 360.0 / 2 ** level
+
+    def cells(self, level):
+        """{(column, row): Cluster} for the occupied cells of a level."""
+        if level not in self.levels:
+            self.levels[level] = self._bucket(level)
+        return self.levels[level]
+
+    def _bucket(self, level):
+        if not len(self.pad_ids):
+            return {}
+        size = self.cell_size(level)
+        cells = np.stack([np.floor((self.longitude + 180.0) / size), np.floor((self.latitude + 90.0) / size)], axis=1).astype(np.int64)
+        keys, inverse = np.unique(cells, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        weight = np.bincount(inverse, self.launches, len(keys))
+        longitude = np.bincount(inverse, self.longitude * self.launches, len(keys)) / weight
+        latitude = np.bincount(inverse, self.latitude * self.launches, len(keys)) / weight
+        success_sum = np.bincount(inverse, self.successes, len(keys))
+        decided_sum = np.bincount(inverse, self.decided, len(keys))
+        order = np.argsort(inverse, kind="stable")
+        members = np.split(order, np.cumsum(np.bincount(inverse, minlength=len(keys)))[:-1])
+        return {(int(x), int(y)): Cluster(longitude[i], latitude[i], int(weight[i]), int(success_sum[i]), int(decided_sum[i]),
+                                          tuple(self.pad_ids[j] for j in members[i]))
+                for i, (x, y) in enumerate(keys)}
+
+    def level_for(self, width):
+        """Level at which about TARGET_CELLS cells span `width` degrees of longitude."""
+        level = round(math.log2(360.0 * TARGET_CELLS / max(width, 1e-9)))
+        return min(max(level, 0), self.max_level)
+
+    def query(self, x0, x1, y0, y1):
+        """Clusters whose cells intersect the lon/lat rectangle, at the level chosen for its width."""
+        level = self.level_for(x1 - x0)
+        cells = self.cells(level)
+        size = self.cell_size(level)
+        ix0, ix1 = math.floor((max(x0, WORLD[0]) + 180.0) / size), math.floor((min(x1, WORLD[1]) + 180.0) / size)
+        iy0, iy1 = math.floor((max(y0, WORLD[2]) + 90.0) / size), math.floor((min(y1, WORLD[3]) + 90.0) / size)
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > len(cells):
+            # Dolu hücre sayısı görünümdekinden azsa onlar taranır; iki yol da görünümle sınırlı
+            return [cluster for (x, y), cluster in cells.items() if ix0 <= x <= ix1 and iy0 <= y <= iy1]
+        return [cells[(x, y)] for x in range(ix0, ix1 + 1) for y in range(iy0, iy1 + 1) if (x, y) in cells]
+
+    def bounds(self):
+        """(x0, x1, y0, y1) around every pad with a margin, or the whole world when empty."""
+        if not len(self.pad_ids):
+            return WORLD
+        x0, x1 = self.longitude.min(), self.longitude.max()
+        y0, y1 = self.latitude.min(), self.latitude.max()
+        span = max(x1 - x0, 2 * (y1 - y0), 20.0) * (1 + 2 * HOME_MARGIN)
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        return _clamp(cx - span / 2, cx + span / 2, cy - span / 4, cy + span / 4)
+
+
+def _clamp(x0, x1, y0, y1):
+    # Görünüm dünya sınırları içinde kaydırılır; boyutu korunur
+    width, height = min(x1 - x0, WORLD[1] - WORLD[0]), min(y1 - y0, WORLD[3] - WORLD[2])
+    x0 = min(max(x0, WORLD[0]), WORLD[1] - width)
+    y0 = min(max(y0, WORLD[2]), WORLD[3] - height)
+    return x0, x0 + width, y0, y0 + height
+
+
+class MapView:
+    """The index's clusters on a matplotlib axes; update() redraws them for the current limits."""
+
+    def __init__(self, ax, index, names=None, cmap="RdYlGn"):
+        self.ax = ax
+        self.index = index
+        self.names = names or {}
+        self.clusters = []
+        self.labels = []
+        self.scatter = ax.scatter([], [], c=[], cmap=cmap, vmin=0.0, vmax=1.0, edgecolors="white",
+                                  linewidths=0.8, alpha=0.9, picker=True, zorder=3)
+        self.scatter.set_gid("launchpad_map")
+        ax.set_xlim(*index.bounds()[:2])
+        ax.set_ylim(*index.bounds()[2:])
+        self.update()
+
+    def cluster_label(self, cluster):
+        if len(cluster.pads) == 1:
+            name = self.names.get(cluster.pads[0], cluster.pads[0])
+        else:
+            name = f"{len(cluster.pads)} pads"
+        return f"{name}\n{cluster.launches} launches"
+
+    def update(self):
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        self.clusters = self.index.query(x0, x1, y0, y1)
+        clusters = self.clusters
+        offsets = np.array([(c.longitude, c.latitude) for c in clusters], dtype=float).reshape(-1, 2)
+        # Alan fırlatma sayısıyla orantılı; toplam üzerinden ölçeklenir, yakınlaştırmada değişmez
+        sizes = [80 + 1800 * math.sqrt(c.launches / self.index.total) for c in clusters]
+        rates = [c.successes / c.decided if c.decided else np.nan for c in clusters]
+        self.scatter.set_offsets(offsets)
+        self.scatter.set_sizes(sizes)
+        self.scatter.set_array(np.ma.masked_invalid(rates))
+        for label in self.labels:
+            label.remove()
+        self.labels = [self.ax.annotate(self.cluster_label(c), (c.longitude, c.latitude), xytext=(0, 14),
+                                        textcoords="offset points", ha="center", va="bottom", fontsize=8,
+                                        color="#c9d1d9", zorder=4, annotation_clip=True)
+                       for c in clusters]
+        return clusters
+
+    def zoom(self, x, y, factor):
+        """Zoom by factor (>1 zooms in) keeping the point (x, y) under the cursor."""
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        scale = min(max(1.0 / factor, MIN_SPAN / (x1 - x0)), (WORLD[1] - WORLD[0]) / (x1 - x0))
+        self._set_limits(x - (x - x0) * scale, x + (x1 - x) * scale, y - (y - y0) * scale, y + (y1 - y) * scale)
+
+    def pan(self, dx, dy):
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        self._set_limits(x0 - dx, x1 - dx, y0 - dy, y1 - dy)
+
+    def _set_limits(self, x0, x1, y0, y1):
+        x0, x1, y0, y1 = _clamp(x0, x1, y0, y1)
+        self.ax.set_xlim(x0, x1)
+        self.ax.set_ylim(y0, y1)
+        self.update()
+
+    def pads_at(self, indices):
+        """Launchpad ids of the clusters with the given scatter indices."""
+        return tuple(pad for i in indices if 0 <= i < len(self.clusters) for pad in self.clusters[i].pads)
@@ -0,0 +1,207 @@
+"""Typed schema and vectorised validation for the launch dataset.
+
+validate() checks and coerces whole columns at once (no per-row Python) and
+returns the clean frame, the rows that failed with their reasons, and counts.
+CsvConvert.py runs it at ingest and writes the failed rows next to the CSV
+(spacex_launches.quarantine.csv) with the counts (spacex_launches.validation.json);
+the backends run the same coercion when loading, so everything downstream can
+rely on these types:
+
+- id, name, rocket, launchpad: non-empty text; ids are unique
+- date_utc: UTC datetime, plus the derived int column year
+- flight_number, date_unix: int64 (date_unix is filled from date_utc when missing)
+- window: float seconds, NaN when unknown
+- success, upcoming, tbd, net, auto_update: True / False / NaN
+- date_precision: one of DATE_PRECISIONS, NaN when unknown
+- other text columns: NaN when empty
+
+Validate a CSV written by another ingest job in place:
+
+    python scripts/launch_schema.py data/spacex_launches.csv
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import perf_metrics
+
+SCHEMA = {
+    "id": "text",
+    "name": "text",
+    "flight_number": "int",
+    "date_utc": "datetime",
+    "date_local": "text",
+    "success": "bool",
+    "details": "text",
+    "rocket": "text",
+    "launchpad": "text",
+    "upcoming": "bool",
+    "tbd": "bool",
+    "net": "bool",
+    "window": "float",
+    "static_fire_date_utc": "text",
+    "auto_update": "bool",
+    "launch_library_id": "text",
+    "date_precision": "precision",
+    "date_unix": "int",
+}
+REQUIRED = ("id", "name", "flight_number", "date_utc", "rocket", "launchpad")
+DATE_PRECISIONS = ("half", "quarter", "year", "month", "day", "hour")
+BLANK = ["", np.nan, None]
+# CSV'de ve API'de görülen tüm yazımlar; sözlükle eşleme tek bir karma tablo araması
+BOOL_VALUES = {True: True, False: False, "True": True, "False": False, "true": True, "false": False,
+               "TRUE": True, "FALSE": False, "1": True, "0": False}
+INVALID = {
+    "datetime": "not a date",
+    "bool": "not a boolean",
+    "int": "not an integer",
+    "float": "not a number",
+    "precision": f"not one of {', '.join(DATE_PRECISIONS)}",
+}
+
+
+def _blank(values):
+    return values.isin(BLANK).to_numpy()
+
+
+def _coerce(values, kind):
+    """(coerced column, missing mask, mask of present values that failed the type check)."""
+    # Sütun zaten doğru tipteyse (read_csv'nin çıkardığı) eşleme atlanır
+    if kind == "bool" and pd.api.types.is_bool_dtype(values):
+        return values.astype(object), np.zeros(len(values), dtype=bool), np.zeros(len(values), dtype=bool)
+    if (kind == "int" and pd.api.types.is_integer_dtype(values)) or (kind == "float" and pd.api.types.is_numeric_dtype(values)):
+        parsed = values.astype(float)
+        return parsed, parsed.isna().to_numpy(), np.zeros(len(values), dtype=bool)
+    if kind == "text":
+        # Tamamen boş metin sütunları read_csv'den float NaN olarak gelir
+        missing = values.isna().to_numpy() if pd.api.types.is_numeric_dtype(values) else _blank(values)
+        return (values.where(~missing) if missing.any() else values), missing, np.zeros(len(values), dtype=bool)
+    if kind == "datetime":
+        parsed = pd.to_datetime(values, errors="coerce", utc=True)
+    elif kind == "bool":
+        parsed = values.map(BOOL_VALUES).astype(object)
+    elif kind in ("int", "float"):
+        parsed = pd.to_numeric(values, errors="coerce").astype(float)
+    else:
+        known = values.isin(DATE_PRECISIONS)
+        parsed = values.where(known)
+    failed = ~known.to_numpy() if kind == "precision" else parsed.isna().to_numpy()
+    # Boş değer denetimi yalnızca çevrilemeyen satırlarda yapılır
+    missing = np.zeros(len(values), dtype=bool)
+    if failed.any():
+        missing[failed] = _blank(values[failed])
+    invalid = failed & ~missing
+    if kind == "int":
+        invalid |= (parsed.to_numpy() % 1 != 0) & ~failed
+    return parsed, missing, invalid
+
+
+def validate(df):
+    """Check and coerce df against SCHEMA; returns (clean, quarantined, stats).
+
+    Only the columns present in df are checked. quarantined holds the original
+    values of the failed rows plus a `reason` column.
+    """
+    started = time.perf_counter()
+    clean = df.copy(deep=False)
+    checks = []
+    stats = {"missing": {}, "filled": {}}
+    for column, kind in SCHEMA.items():
+        if column not in df:
+            continue
+        clean[column], missing, invalid = _coerce(df[column], kind)
+        if column in REQUIRED:
+            checks.append((f"{column}: missing", missing))
+        elif missing.any():
+            stats["missing"][column] = int(missing.sum())
+        if kind in INVALID:
+            checks.append((f"{column}: {INVALID[kind]}", invalid))
+    if "id" in df:
+        checks.append(("id: duplicate", clean["id"].duplicated(keep="first").to_numpy()))
+
+    failed = np.column_stack([mask for _, mask in checks]) if checks else np.zeros((len(df), 0), dtype=bool)
+    bad = failed.any(axis=1)
+    reasons = np.array([reason for reason, _ in checks], dtype=object)
+    quarantined = df[bad].copy()
+    # Yalnızca geçersiz satırlar için metin birleştirilir
+    quarantined["reason"] = ["; ".join(reasons[row]) for row in failed[bad]]
+    if bad.any():
+        clean = clean[~bad].copy()
+
+    for column in ("flight_number", "date_unix"):
+        if column not in clean:
+            continue
+        if column == "date_unix" and "date_utc" in clean:
+            unknown = clean[column].isna()
+            if unknown.any():
+                epoch = clean["date_utc"].dt.tz_convert(None).to_numpy(dtype="datetime64[s]").astype(np.int64)
+                clean[column] = clean[column].where(~unknown, epoch)
+                stats["filled"][column] = int(unknown.sum())
+        if clean[column].notna().all():
+            clean[column] = clean[column].astype(np.int64)
+    if "date_utc" in clean:
+        clean["year"] = clean["date_utc"].dt.year
+
+    counts = failed.sum(axis=0)
+    stats.update(rows=len(df), valid=len(clean), quarantined=int(bad.sum()),
+                 checks={reason: int(n) for reason, n in zip(reasons, counts) if n})
+    perf_metrics.record("ingest.validate", (time.perf_counter() - started) * 1000.0)
+    if stats["quarantined"]:
+        perf_metrics.count("ingest.quarantined", stats["quarantined"])
+    return clean, quarantined, stats
+
+
+def report_paths(csv_path):
+    """(quarantine CSV, validation stats JSON) written next to csv_path."""
+    stem = os.path.splitext(csv_path)[0]
+    return stem + ".quarantine.csv", stem + ".validation.json"
+
+
+def write_report(csv_path, quarantined, stats):
+    """Write the quarantined rows and the stats next to csv_path; a stale quarantine file is removed."""
+    quarantine_path, stats_path = report_paths(csv_path)
+    if len(quarantined):
+        quarantined.to_csv(quarantine_path + ".tmp", index=False)
+        os.replace(quarantine_path + ".tmp", quarantine_path)
+    elif os.path.exists(quarantine_path):
+        os.remove(quarantine_path)
+    with open(stats_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(dict(stats, csv=os.path.basename(csv_path), validated_at=time.time()), f, indent=2)
+    os.replace(stats_path + ".tmp", stats_path)
+
+
+def validate_csv(csv_path):
+    """Validate a CSV in place: failed rows move to the quarantine file; returns the stats."""
+    # Metin olarak okunur; geçerli satırlar aynı yazımla geri yazılır
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    clean, quarantined, stats = validate(df)
+    if len(quarantined):
+        df.loc[clean.index].to_csv(csv_path + ".tmp", index=False)
+        os.replace(csv_path + ".tmp", csv_path)
+    write_report(csv_path, quarantined, stats)
+    return stats
+
+
+def summary(stats):
+    text = f"{stats['valid']} of {stats['rows']} launches valid, {stats['quarantined']} quarantined"
+    if stats["checks"]:
+        text += " (" + ", ".join(f"{reason}: {n}" for reason, n in stats["checks"].items()) + ")"
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a launch CSV against the schema and quarantine bad rows.")
+    parser.add_argument("csv", nargs="+")
+    args = parser.parse_args()
+    for csv_path in args.csv:
+        print(f"{csv_path}: {summary(validate_csv(csv_path))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+"""Launch data sources for CsvConvert.py: plugins, parallel loading and merging.
+
+data/sources.json lists the sources in precedence order (first wins):
+
+    {"sources": [
+        {"name": "spacexdata", "type": "api", "required": true},
+        {"name": "internal", "type": "api", "url": "https://feed.example/v4/launches", "timeout": 60},
+        {"name": "archive", "type": "csv", "path": "archive/"},
+        {"name": "dumps", "type": "jsonl", "path": "dumps/launches.jsonl"},
+        {"name": "mock", "type": "mock", "synthetic_rows": 500, "latency_ms": 200}
+    ]}
+
+Without the file the public API is the only source. Types:
+
+- api: GET `url` (default /v4/launches) through spacex_client
+- csv, jsonl, json, parquet: a file, or every file with that extension in a
+  directory (name order; later files are newer dumps and win). Relative paths
+  are resolved from the directory of sources.json. Parquet needs pyarrow.
+- mock: starts scripts/mock_spacex_api.py in the worker (fixtures or
+  synthetic_rows, with latency_ms/jitter_ms/error_rate faults) and reads it
+  like the API
+
+Each source loads in its own worker process and has its own `timeout`
+(seconds); a slow or failing source is reported and left out instead of
+holding up the others. A source with `"required": true` that does not load
+fails the whole ingest, so the live CSV is kept.
+
+merge() normalises every row to the CSV text form, drops rows whose content
+hash was already seen, then merges on the launch id: rows of another source
+with the same launch_library_id belong to the same launch even when their ids
+differ. For each launch the fields come from the highest-precedence source
+that has them, so a feed without details still gets them from the archive.
+
+Besides LAUNCH_FIELDS every frame has a `timeline` column: the launch's
+event -> seconds dict as compact JSON text ("" when it has none), so it
+survives the worker processes and the merge like any other field.
+CsvConvert.py turns it into the columnar store of launch_timeline.py.
+
+    python scripts/launch_sources.py              # load and merge, print stats, write nothing
+"""
+import argparse
+import glob
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import data_paths
+import perf_metrics
+
+# CSV'ye yazılan sütunlar (sıra korunur)
+LAUNCH_FIELDS = [
+    "id", "name", "flight_number", "date_utc", "date_local", "success", "details",
+    "rocket", "launchpad", "upcoming", "tbd", "net", "window", "static_fire_date_utc",
+    "auto_update", "launch_library_id", "date_precision", "date_unix"
+]
+TIMELINE_FIELD = "timeline"
+# Kaynak çerçevelerinin sütunları: CSV alanları ve CSV'ye yazılmayan zaman çizelgesi
+SOURCE_FIELDS = LAUNCH_FIELDS + [TIMELINE_FIELD]
+DEFAULT_SOURCES = [{"name": "spacexdata", "type": "api", "required": True}]
+SOURCE_TIMEOUT = 300   # Kaynak başına saniye
+POLL_SECONDS = 0.05
+
+
+def launch_to_row(launch):
+    return {field: launch.get(field, "") for field in LAUNCH_FIELDS}
+
+
+def timeline_text(launch):
+    timeline = launch.get(TIMELINE_FIELD)
+    if not isinstance(timeline, dict) or not timeline:
+        return ""
+    # Anahtar sırası korunur; aynı çizelge her kaynakta aynı metni (ve içerik karmasını) verir
+    return json.dumps(timeline, separators=(",", ":"))
+
+
+def rows_frame(rows):
+    """Launch dicts as a text frame in SOURCE_FIELDS order."""
+    # object: tamsayı sütunları boş değerlerle float olmasın (3600 -> "3600.0")
+    return normalise(pd.DataFrame([dict(launch_to_row(launch), timeline=timeline_text(launch)) for launch in rows],
+                                  columns=SOURCE_FIELDS, dtype=object))
+
+
+def normalise(df):
+    """Text frame in SOURCE_FIELDS order, with values as csv.DictWriter writes them ('' for missing)."""
+    df = df.reindex(columns=SOURCE_FIELDS)
+    # Her kaynak aynı yazıma getirilir; içerik karması kaynaktan bağımsız olur
+    return df.astype(object).where(df.notna(), "").astype(str)
+
+
+class ApiSource:
+    """Launches from a SpaceX API compatible endpoint."""
+    type = "api"
+
+    def __init__(self, config):
+        self.config = config
+        self.url = config.get("url", "/v4/launches")
+
+    def load(self):
+        import spacex_client
+        response = spacex_client.get(self.url)
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code} from {spacex_client.api_url(self.url)}")
+        return rows_frame(response.json())
+
+
+class MockSource(ApiSource):
+    """Launches from a mock API server started inside the worker."""
+    type = "mock"
+
+    def load(self):
+        import mock_spacex_api
+        import spacex_client
+        config = self.config
+        synthetic = config.get("synthetic_rows")
+        store = mock_spacex_api.FixtureStore(config.get("fixtures", mock_spacex_api.FIXTURES_DIR),
+                                             mock_spacex_api.synthetic_feed(synthetic, config.get("seed", 42)) if synthetic else None)
+        faults = mock_spacex_api.FaultConfig(config.get("latency_ms", 0), config.get("jitter_ms", 0),
+                                             error_rate=config.get("error_rate", 0.0), seed=config.get("seed"))
+        server = mock_spacex_api.start_server(port=0, store=store, faults=faults)
+        try:
+            host, port = server.server_address[:2]
+            response = spacex_client.get(f"http://{host}:{port}/{self.url.lstrip('/')}")
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code} from the mock API")
+            return rows_frame(response.json())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class FileSource:
+    """Launches from a file or a directory of files in one format."""
+    type = "csv"
+    extensions = (".csv",)
+
+    def __init__(self, config):
+        self.config = config
+        self.path = config["path"]
+
+    def files(self):
+        if os.path.isdir(self.path):
+            return sorted(path for ext in self.extensions for path in glob.glob(os.path.join(self.path, "*" + ext)))
+        return [self.path]
+
+    def read(self, path):
+        # Metin olarak okunur; değerler CSV'deki yazımıyla kalır
+        return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+    def load(self):
+        files = self.files()
+        if not files:
+            raise FileNotFoundError(f"No {'/'.join(self.extensions)} files in {self.path}")
+        # Sonraki dosyalar daha yeni dökümler; birleştirmede önce gelmeleri için ters sırada
+        return pd.concat([normalise(self.read(path)) for path in reversed(files)], ignore_index=True)
+
+
+class JsonLinesSource(FileSource):
+    type = "jsonl"
+    extensions = (".jsonl",)
+
+    def read(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return rows_frame(json.loads(line) for line in f if line.strip())
+
+
+class JsonSource(FileSource):
+    type = "json"
+    extensions = (".json",)
+
+    def read(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return rows_frame(json.load(f))
+
+
+class ParquetSource(FileSource):
+    type = "parquet"
+    extensions = (".parquet",)
+
+    def read(self, path):
+        try:
+            return pd.read_parquet(path)
+        except ImportError as e:
+            raise RuntimeError("Parquet sources need pyarrow (pip install pyarrow)") from e
+
+
+SOURCE_TYPES = {cls.type: cls for cls in (ApiSource, MockSource, FileSource, JsonLinesSource, JsonSource, ParquetSource)}
+
+
+def create_source(config):
+    if config.get("type") not in SOURCE_TYPES:
+        raise ValueError(f"Unknown source type: {config.get('type')} (choose from {', '.join(SOURCE_TYPES)})")
+    return SOURCE_TYPES[config["type"]](config)
+
+
+def load_config(path=None):
+    """Source configs in precedence order; the public API alone when there is no sources.json."""
+    path = path or data_paths.SOURCES_JSON
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            sources = json.load(f)["sources"]
+    except FileNotFoundError:
+        return [dict(source) for source in DEFAULT_SOURCES]
+    base = os.path.dirname(os.path.abspath(path))
+    names = set()
+    for i, source in enumerate(sources):
+        source.setdefault("name", f"{source.get('type')}-{i + 1}")
+        if source["name"] in names:
+            raise ValueError(f"Duplicate source name in {path}: {source['name']}")
+        names.add(source["name"])
+        if "path" in source:
+            source["path"] = os.path.join(base, source["path"])
+        create_source(source)   # Bilinmeyen tip yükleme başlamadan bildirilir
+    return sources
+
+
+_started_queue = None
+
+
+def _init_worker(started_queue):
+    global _started_queue
+    _started_queue = started_queue
+
+
+def load_source(config):
+    """Worker: (frame, seconds) for one source; reports its start to load_all first."""
+    if _started_queue is not None:
+        # Kaynağın zaman aşımı kuyrukta beklediği süreyi değil, çalıştığı süreyi kapsar
+        _started_queue.put((config["name"], time.time()))
+    started = time.perf_counter()
+    frame = create_source(config).load()
+    return frame, time.perf_counter() - started
+
+
+def load_all(sources, workers=None, log=print):
+    """Load sources in parallel; returns ({name: frame}, [per-source stats]) in precedence order.
+
+    Every source gets its own worker by default, so a slow one only costs its
+    own timeout, counted from when a worker picks it up. With fewer workers
+    than sources, queued sources are given up once every worker is held by a
+    timed-out source, or when every wave could have run out its timeout.
+    Sources that time out are terminated with the pool.
+    """
+    workers = min(workers or len(sources), len(sources))
+    frames, stats = {}, {source["name"]: {"name": source["name"], "type": source["type"]} for source in sources}
+    context = multiprocessing.get_context()
+    started_queue = context.SimpleQueue()
+    pool = context.Pool(workers, initializer=_init_worker, initargs=(started_queue,))
+    try:
+        longest = max(source.get("timeout", SOURCE_TIMEOUT) for source in sources)
+        # Zaman aşımına uğrayan kaynak işçisini bırakmaz; sırada bekleyenler için üst sınır
+        deadline = time.time() + longest * math.ceil(len(sources) / workers)
+        started, stuck = {}, 0
+        pending = {source["name"]: (source, pool.apply_async(load_source, (source,))) for source in sources}
+        while pending:
+            while not started_queue.empty():
+                name, stamp = started_queue.get()
+                started[name] = stamp
+            for name, (source, result) in list(pending.items()):
+                timeout = source.get("timeout", SOURCE_TIMEOUT)
+                if result.ready():
+                    try:
+                        frame, seconds = result.get()
+                        frames[name] = frame
+                        stats[name].update(status="ok", rows=len(frame), seconds=round(seconds, 3))
+                        log(f"  ✅ {name}: {len(frame)} launches in {seconds:.2f}s")
+                    except Exception as e:
+                        stats[name].update(status="failed", error=f"{e.__class__.__name__}: {e}")
+                        log(f"  ❌ {name}: {stats[name]['error']}")
+                elif name in started and time.time() - started[name] > timeout:
+                    stats[name].update(status="timeout", error=f"no result within {timeout}s")
+                    log(f"  ⏱️  {name}: {stats[name]['error']}, skipped")
+                    stuck += 1
+                elif name not in started and (stuck >= workers or time.time() > deadline):
+                    stats[name].update(status="timeout", error="not started, every worker was still busy")
+                    log(f"  ⏱️  {name}: {stats[name]['error']}, skipped")
+                else:
+                    continue
+                perf_metrics.count(f"ingest.source_{stats[name]['status']}")
+                del pending[name]
+            if pending:
+                next(iter(pending.values()))[1].wait(POLL_SECONDS)
+    finally:
+        # Zaman aşımına uğrayan kaynaklar hâlâ çalışıyor olabilir
+        pool.terminate()
+        pool.join()
+    # Sonuçlar bitiş sırasıyla gelir; birleştirme öncelik sırasına göre yapılır
+    return ({source["name"]: frames[source["name"]] for source in sources if source["name"] in frames},
+            [stats[source["name"]] for source in sources])
+
+
+def merge(frames):
+    """Merge text frames given in precedence order; returns (merged frame, stats)."""
+    started = time.perf_counter()
+    parts = [frame.assign(_source=name) for name, frame in frames.items()]
+    if not parts:
+        return pd.DataFrame(columns=SOURCE_FIELDS), {"rows": 0, "duplicates": 0, "overlapping": 0, "launches": 0}
+    combined = pd.concat(parts, ignore_index=True)
+    rows = len(combined)
+
+    # Aynı içerikli satırlar (kaynaktan bağımsız) bir kez tutulur
+    content = pd.util.hash_pandas_object(combined[SOURCE_FIELDS], index=False)
+    combined = combined[~content.duplicated().to_numpy()]
+
+    # Aynı launch_library_id'li satırlar, önceliği en yüksek satırın id'sinde birleşir
+    ids = combined["id"].where(combined["id"] != "")
+    library = combined["launch_library_id"]
+    linked = (library != "") & ids.notna()
+    first_id = ids[linked].groupby(library[linked], sort=False).first()
+    key = library.map(first_id).where(library != "").fillna(ids)
+
+    keyed = key.notna().to_numpy()
+    grouped = combined[keyed].replace("", np.nan).groupby(key[keyed].to_numpy(), sort=False)
+    # first() her sütunda boş olmayan ilk değeri alır: eksik alanlar alt öncelikli kaynaklardan dolar
+    merged = grouped[SOURCE_FIELDS].first()
+    merged["id"] = merged.index
+    sizes = grouped.size()
+    # Anahtarsız satırlar olduğu gibi kalır; doğrulama onları karantinaya alır
+    merged = pd.concat([merged.fillna(""), combined.loc[~keyed, SOURCE_FIELDS]], ignore_index=True)
+
+    stats = {"rows": rows, "duplicates": rows - len(combined), "overlapping": int((sizes > 1).sum()),
+             "launches": len(merged)}
+    perf_metrics.record("ingest.merge", (time.perf_counter() - started) * 1000.0)
+    return merged[SOURCE_FIELDS], stats
+
+
+def ingest(config_path=None, workers=None, log=print):
+    """Load and merge every configured source; returns (frame, stats).
+
+    Raises RuntimeError when a required source, or every source, failed.
+    """
+    sources = load_config(config_path)
+    frames, source_stats = load_all(sources, workers, log)
+    failed = [source["name"] for source in sources if source.get("required") and source["name"] not in frames]
+    if failed:
+        raise RuntimeError(f"Required source did not load: {', '.join(failed)}")
+    if not frames:
+        raise RuntimeError("No source loaded")
+    merged, merge_stats = merge(frames)
+    return merged, {"sources": source_stats, "merge": merge_stats}
+
+
+def summary(stats):
+    merge_stats = stats["merge"]
+    loaded = sum(source["status"] == "ok" for source in stats["sources"])
+    return (f"{merge_stats['launches']} launches from {loaded} of {len(stats['sources'])} sources "
+            f"({merge_stats['rows']} rows, {merge_stats['duplicates']} exact duplicates, "
+            f"{merge_stats['overlapping']} launches in several sources)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load and merge the configured launch sources without writing anything.")
+    parser.add_argument("--config", default=None, help=f"Sources file (default: {data_paths.SOURCES_JSON})")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        _, stats = ingest(args.config, args.workers)
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    print(summary(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Launch timelines (event -> seconds from liftoff) as a compact ragged columnar store.
+
+CsvConvert.py writes data/launch_timelines.npz next to the launch CSV. Only
+launches with at least one timed event are kept, as flat arrays:
+
+- launch_ids, epoch: launch id and UTC seconds per launch
+- rocket, launchpad: int32 codes into the interned rockets / launchpads names
+- offsets: int64, length launches + 1; the events of launch i are
+  codes[offsets[i]:offsets[i + 1]] and seconds[offsets[i]:offsets[i + 1]]
+- codes: uint16 codes into the interned events names (meco, stage_sep, ...)
+- seconds: float32 seconds relative to liftoff (negative before it)
+
+Queries work on whole arrays: the launch of every event is
+np.repeat(arange(launches), lengths), so per-event distributions over
+rockets or years are a single grouped quantile with no per-launch Python.
+
+    python scripts/launch_timeline.py                    # per-event distributions by rocket
+    python scripts/launch_timeline.py --by year --event meco
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+import data_paths
+
+TIMELINES_FILE = "launch_timelines.npz"   # Fırlatma CSV'siyle aynı klasörde
+TIMELINES_NPZ = os.path.join(data_paths.DATA_DIR, TIMELINES_FILE)
+GROUPS = ("rocket", "launchpad", "year")
+QUANTILES = {"p05": 0.05, "p25": 0.25, "median": 0.5, "p75": 0.75, "p95": 0.95}
+ARRAYS = ("launch_ids", "epoch", "rocket", "rockets", "launchpad", "launchpads", "offsets", "codes", "seconds", "events")
+
+
+def _parse(timeline):
+    """Timeline as a dict; accepts dicts and the JSON text launch_sources carries between processes."""
+    if isinstance(timeline, str):
+        if not timeline:
+            return {}
+        try:
+            timeline = json.loads(timeline)
+        except json.JSONDecodeError:
+            return {}
+    return timeline if isinstance(timeline, dict) else {}
+
+
+class TimelineStore:
+    """Timed events of many launches in flat offset/code/seconds arrays with interned names."""
+
+    def __init__(self, launch_ids, epoch, rocket, rockets, launchpad, launchpads, offsets, codes, seconds, events):
+        self.launch_ids = np.asarray(launch_ids, dtype=str)
+        self.epoch = np.asarray(epoch, dtype=np.int64)
+        self.rocket = np.asarray(rocket, dtype=np.int32)
+        self.rockets = np.asarray(rockets, dtype=str)
+        self.launchpad = np.asarray(launchpad, dtype=np.int32)
+        self.launchpads = np.asarray(launchpads, dtype=str)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.codes = np.asarray(codes, dtype=np.uint16)
+        self.seconds = np.asarray(seconds, dtype=np.float32)
+        self.events = np.asarray(events, dtype=str)
+
+    @classmethod
+    def build(cls, launch_ids, epoch, rockets, launchpads, timelines):
+        """Store from per-launch columns and timelines (dicts or JSON text); launches without events are left out."""
+        interned = {}
+        keep, lengths, codes, seconds = [], [], [], []
+        for row, timeline in enumerate(timelines):
+            count = 0
+            for event, value in _parse(timeline).items():
+                # Zamanı olmayan (null) ya da sayı olmayan olaylar atlanır
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or not np.isfinite(value):
+                    continue
+                codes.append(interned.setdefault(str(event), len(interned)))
+                seconds.append(value)
+                count += 1
+            if count:
+                keep.append(row)
+                lengths.append(count)
+        if len(interned) > np.iinfo(np.uint16).max:
+            raise ValueError(f"Too many distinct timeline events: {len(interned)}")
+        keep = np.asarray(keep, dtype=np.int64)
+        rocket_codes, rocket_names = pd.factorize(pd.Series(np.asarray(rockets, dtype=object)[keep]).astype(str))
+        pad_codes, pad_names = pd.factorize(pd.Series(np.asarray(launchpads, dtype=object)[keep]).astype(str))
+        return cls(np.asarray(launch_ids, dtype=object)[keep], np.asarray(epoch, dtype=np.int64)[keep],
+                   rocket_codes, list(rocket_names), pad_codes, list(pad_names),
+                   np.concatenate(([0], np.cumsum(lengths, dtype=np.int64))), codes, seconds, list(interned))
+
+    @classmethod
+    def empty(cls):
+        return cls([], [], [], [], [], [], [0], [], [], [])
+
+    def __len__(self):
+        return len(self.launch_ids)
+
+    @property
+    def event_count(self):
+        return len(self.codes)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in ARRAYS)
+
+    def save(self, path=TIMELINES_NPZ):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # np.savez dosya adına .npz ekler; dosya nesnesiyle geçici ad korunur
+        with open(path + ".tmp", "wb") as f:
+            np.savez_compressed(f, **{name: getattr(self, name) for name in ARRAYS})
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path=TIMELINES_NPZ):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(*(data[name] for name in ARRAYS))
+
+    def timeline(self, launch_id):
+        """{event: seconds} of one launch, or None when it has no timeline."""
+        rows = np.flatnonzero(self.launch_ids == launch_id)
+        if not len(rows):
+            return None
+        start, end = self.offsets[rows[0]], self.offsets[rows[0] + 1]
+        return {str(self.events[code]): float(value) for code, value in zip(self.codes[start:end], self.seconds[start:end])}
+
+    def event_launches(self):
+        """Launch position of every event."""
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.offsets))
+
+    def years(self):
+        return self.epoch.astype("datetime64[s]").astype("datetime64[Y]").astype(np.int64) + 1970
+
+    def subset(self, mask):
+        """Store with only the launches where mask is True (interned names are kept)."""
+        mask = np.asarray(mask, dtype=bool)
+        lengths = np.diff(self.offsets)[mask]
+        events = np.repeat(mask, np.diff(self.offsets))
+        return TimelineStore(self.launch_ids[mask], self.epoch[mask], self.rocket[mask], self.rockets,
+                             self.launchpad[mask], self.launchpads, np.concatenate(([0], np.cumsum(lengths))),
+                             self.codes[events], self.seconds[events], self.events)
+
+    def select(self, kind, value):
+        """Launches of one report slice: kind is "all", "rocket", "launchpad" (ids) or "year"."""
+        if kind == "all":
+            return self
+        if kind == "year":
+            return self.subset(self.years() == value)
+        names = self.rockets if kind == "rocket" else self.launchpads
+        codes = np.flatnonzero(names == value)
+        return self.subset(np.isin(getattr(self, kind), codes))
+
+    def event_values(self, event):
+        """(launch positions, seconds) of every occurrence of one event."""
+        codes = np.flatnonzero(self.events == event)
+        if not len(codes):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        hits = np.flatnonzero(self.codes == codes[0])
+        return np.searchsorted(self.offsets, hits, side="right") - 1, self.seconds[hits]
+
+    def distributions(self, by="rocket", events=None):
+        """Per-event (and per-group) count, min, quantiles and max of the event seconds.
+
+        by is one of GROUPS or None; events limits the result to those names.
+        Rows are ordered by the event's overall median, so phases come in flight order.
+        """
+        if by not in GROUPS + (None,):
+            raise ValueError(f"Unknown group: {by} (choose from {', '.join(GROUPS)})")
+        columns = {"event": self.codes.astype(np.int64), "seconds": self.seconds.astype(float)}
+        if by is not None:
+            per_launch = self.years() if by == "year" else getattr(self, by)
+            columns[by] = per_launch[self.event_launches()]
+        frame = pd.DataFrame(columns)
+        if events is not None:
+            frame = frame[frame["event"].isin(np.flatnonzero(np.isin(self.events, list(events))))]
+        keys = ["event"] + ([by] if by is not None else [])
+        grouped = frame.groupby(keys, sort=True)["seconds"]
+        result = grouped.agg(["count", "min", "max"])
+        for name, q in QUANTILES.items():
+            result[name] = grouped.quantile(q)
+        result = result[["count", "min"] + list(QUANTILES) + ["max"]].reset_index()
+
+        # Olaylar tüm fırlatmalardaki medyan zamanına göre sıralanır (uçuş sırası)
+        order = frame.groupby("event")["seconds"].median().sort_values()
+        result["_order"] = result["event"].map(pd.Series(np.arange(len(order)), index=order.index))
+        result = result.sort_values(["_order"] + keys[1:], kind="stable").drop(columns="_order")
+        result["event"] = self.events[result["event"].to_numpy()] if len(result) else result["event"].astype(str)
+        if by in ("rocket", "launchpad"):
+            names = self.rockets if by == "rocket" else self.launchpads
+            result[by] = names[result[by].to_numpy()] if len(result) else result[by].astype(str)
+        return result.reset_index(drop=True)
+
+
+def path_for(csv_path):
+    """The timeline store written next to a launch CSV."""
+    return os.path.join(os.path.dirname(csv_path), TIMELINES_FILE)
+
+
+def load(path=TIMELINES_NPZ):
+    """The saved store, or an empty one when there is none yet."""
+    try:
+        return TimelineStore.load(path)
+    except (FileNotFoundError, OSError, KeyError, ValueError):
+        return TimelineStore.empty()
+
+
+def store_for(source):
+    """The source's own store when it keeps one (dashboard, report slices), otherwise the saved one."""
+    if hasattr(source, "timelines"):
+        return source.timelines()
+    return load()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print per-event timing distributions from the timeline store.")
+    parser.add_argument("--path", default=TIMELINES_NPZ)
+    parser.add_argument("--by", choices=GROUPS + ("none",), default="rocket")
+    parser.add_argument("--event", action="append", help="Only this event (repeatable)")
+    args = parser.parse_args()
+    store = load(args.path)
+    if not len(store):
+        print(f"No timelines in {args.path} (run scripts/CsvConvert.py)")
+        return 1
+    print(f"{len(store)} launches, {store.event_count} events, {len(store.events)} event names, "
+          f"{store.nbytes / 1024:.1f} KB")
+    table = store.distributions(None if args.by == "none" else args.by, args.event)
+    with pd.option_context("display.max_rows", None, "display.width", 160):
+        print(table.to_string(index=False, float_format=lambda v: f"{v:.1f}"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Load test for the local launch API (scripts/launch_api.py).
+
+    python scripts/load_test_api.py --clients 200 --duration 15
+    python scripts/load_test_api.py --url http://127.0.0.1:8765 --no-etag --no-gzip
+
+Each client is a thread with its own keep-alive connection that cycles through
+a mix of list, filter, stats and chart requests. With ETags on (default) a
+client repeats the last ETag it saw for a URL, as a polling dashboard would.
+Prints throughput, latency percentiles, the share of 304 responses and errors;
+exits with status 1 when any request failed.
+"""
+import argparse
+import http.client
+import random
+import statistics
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+REQUEST_MIX = [
+    "/api/launches?limit=100",
+    "/api/launches?offset=100&limit=100",
+    "/api/launches?success=false&limit=50",
+    "/api/launches?search=star&limit=100",
+    "/api/stats",
+    "/api/years",
+    "/api/charts/launches_per_year",
+    "/api/charts/success_counts",
+    "/api/charts/success_rate_by_year",
+    "/api/reliability?group=rocket",
+]
+
+
+def run_client(host, port, deadline, use_etag, use_gzip, results, lock, seed):
+    rng = random.Random(seed)
+    etags = {}
+    latencies, statuses, errors = [], {}, 0
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    while time.perf_counter() < deadline:
+        path = rng.choice(REQUEST_MIX)
+        headers = {}
+        if use_gzip:
+            headers["Accept-Encoding"] = "gzip"
+        if use_etag and path in etags:
+            headers["If-None-Match"] = etags[path]
+        started = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+        if response.status >= 400:
+            errors += 1
+        if response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+    connection.close()
+    with lock:
+        results["latencies"].extend(latencies)
+        results["errors"] += errors
+        for status, n in statuses.items():
+            results["statuses"][status] = results["statuses"].get(status, 0) + n
+
+
+def load_test(url, clients, duration, use_etag=True, use_gzip=True):
+    """Run the test; returns a summary dict."""
+    parts = urlsplit(url)
+    results = {"latencies": [], "errors": 0, "statuses": {}}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + duration
+    threads = [threading.Thread(target=run_client, daemon=True,
+                                args=(parts.hostname, parts.port or 80, deadline, use_etag, use_gzip, results, lock, i))
+               for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = results["latencies"]
+    total = len(latencies)
+    cuts = statistics.quantiles(latencies, n=100) if total > 1 else latencies * 99
+    return {
+        "clients": clients,
+        "requests": total,
+        "seconds": elapsed,
+        "requests_per_second": total / elapsed if elapsed else 0.0,
+        "p50_ms": cuts[49] if total else None,
+        "p95_ms": cuts[94] if total else None,
+        "p99_ms": cuts[98] if total else None,
+        "not_modified": results["statuses"].get(304, 0) / total if total else 0.0,
+        "statuses": results["statuses"],
+        "errors": results["errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local launch API.")
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds")
+    parser.add_argument("--no-etag", action="store_true", help="Never send If-None-Match")
+    parser.add_argument("--no-gzip", action="store_true", help="Do not accept gzip")
+    args = parser.parse_args()
+
+    summary = load_test(args.url, args.clients, args.duration, not args.no_etag, not args.no_gzip)
+    if not summary["requests"]:
+        print(f"No successful requests against {args.url} ({summary['errors']} errors); is the API running?")
+        return 1
+    print(f"{summary['clients']} clients, {summary['requests']} requests in {summary['seconds']:.1f}s "
+          f"({summary['requests_per_second']:.0f} req/s)")
+    print(f"latency p50 {summary['p50_ms']:.1f} ms, p95 {summary['p95_ms']:.1f} ms, p99 {summary['p99_ms']:.1f} ms")
+    print(f"304 Not Modified: {summary['not_modified'] * 100:.0f}%  statuses: {summary['statuses']}  "
+          f"errors: {summary['errors']}")
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Memory accounting and budgets for long dashboard sessions.
+
+Subsystems register with a MemoryLedger how to measure the bytes they hold
+(DataFrames, the chart bitmap cache, the image pixmap cache, the figure
+canvas) and, for caches, how to shrink. enforce() evicts from the caches, in
+registration order, whenever the accounted total is over the session budget:
+
+    SPACEX_MEMORY_BUDGET_MB   total accounted memory (default 1024)
+    SPACEX_PIXMAP_CACHE_MB    scaled rocket/launch images (default 16)
+    SPACEX_CHART_CACHE_MB     rendered chart bitmaps (default 64, chart_cache.py)
+
+tracemalloc helpers record Python allocations between two snapshots and
+report the source lines that grew; scripts/soak_test.py uses them to check
+that memory stays flat across thousands of dialogs and reloads.
+"""
+import os
+import threading
+import tracemalloc
+
+import perf_metrics
+
+DEFAULT_BUDGET_MB = float(os.environ.get("SPACEX_MEMORY_BUDGET_MB", "1024"))
+PIXMAP_BUDGET_MB = float(os.environ.get("SPACEX_PIXMAP_CACHE_MB", "16"))
+SAMPLE_ROWS = 10000
+TRACE_FRAMES = 1
+# tracemalloc'un ve modül yükleyicisinin kendi ayırmaları rapora girmez
+TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def mb(value):
+    return int(value * 1024 * 1024)
+
+
+def frame_bytes(df):
+    """Bytes held by a DataFrame including its strings (estimated above SAMPLE_ROWS rows); 0 for None."""
+    if df is None:
+        return 0
+    if len(df) <= SAMPLE_ROWS:
+        return int(df.memory_usage(index=True, deep=True).sum())
+    # Derin ölçüm her metin nesnesini gezer (1M satırda saniyeler); eşit aralıklı örnekten ölçeklenir
+    sample = df.iloc[::len(df) // SAMPLE_ROWS]
+    objects = sample.memory_usage(index=True, deep=True).sum() - sample.memory_usage(index=True, deep=False).sum()
+    return int(df.memory_usage(index=True, deep=False).sum() + objects * len(df) / len(sample))
+
+
+class MemoryLedger:
+    """Per-subsystem byte counters with a total budget enforced by shrinking caches."""
+
+    def __init__(self, budget_bytes=None):
+        self.budget_bytes = mb(DEFAULT_BUDGET_MB) if budget_bytes is None else budget_bytes
+        self.subsystems = {}   # ad -> (ölçüm, küçültme ya da None)
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def register(self, name, measure, shrink=None):
+        """measure() returns the bytes held; shrink(target_bytes) frees down to target_bytes."""
+        self.subsystems[name] = (measure, shrink)
+
+    def usage(self):
+        return {name: int(measure()) for name, (measure, _) in self.subsystems.items()}
+
+    def enforce(self):
+        """Shrink caches until the total fits the budget; returns {subsystem: bytes freed}."""
+        with self._lock:
+            usage = self.usage()
+            excess = sum(usage.values()) - self.budget_bytes
+            freed = {}
+            for name, (measure, shrink) in self.subsystems.items():
+                if excess <= 0:
+                    break
+                if shrink is None or not usage[name]:
+                    continue
+                shrink(max(0, usage[name] - excess))
+                freed[name] = usage[name] - int(measure())
+                excess -= freed[name]
+            if freed:
+                self.evictions += 1
+                perf_metrics.count("memory.enforce")
+            return freed
+
+    def stats(self):
+        usage = self.usage()
+        return {"usage": usage, "total_bytes": sum(usage.values()), "budget_bytes": self.budget_bytes,
+                "evictions": self.evictions}
+
+
+def start_tracing(frames=TRACE_FRAMES):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def stop_tracing():
+    tracemalloc.stop()
+
+
+def is_tracing():
+    return tracemalloc.is_tracing()
+
+
+def traced():
+    """(current, peak) bytes allocated by Python since tracing started; (0, 0) when off."""
+    return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+
+def take_snapshot():
+    return tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+
+
+def top_growth(before, after, limit=10, key_type="lineno"):
+    """[(location, bytes grown, blocks grown)] for the allocation sites that grew most between snapshots."""
+    rows = []
+    for stat in after.compare_to(before, key_type)[:limit]:
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        rows.append((f"{os.path.basename(frame.filename)}:{frame.lineno}", stat.size_diff, stat.count_diff))
+    return rows
+
+
+def process_rss():
+    """Resident set size of this process in bytes, or None where /proc is not available."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
@@ -0,0 +1,356 @@
+"""Local mock of the SpaceX /v4 API with latency, rate-limit and failure injection.
+
+Record real responses once, then replay them offline:
+
+    python scripts/mock_spacex_api.py record
+    python scripts/mock_spacex_api.py serve --latency-ms 300 --rate-limit 5 --drop-rate 0.05
+
+Without recordings the server can replay a synthetic feed instead:
+
+    python scripts/mock_spacex_api.py serve --synthetic-rows 5000
+
+Point the fetch scripts (or the dashboard update) at it with
+SPACEX_API_URL=http://127.0.0.1:8765.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT_DIR, "data", "mock_api")
+
+RECORD_PATHS = ["/v4/launches", "/v4/launches/latest", "/v4/launches/next",
+                "/v4/rockets", "/v4/launchpads", "/v4/payloads", "/v4/cores", "/v4/crew"]
+
+# populate yolundaki alan adı -> koleksiyon
+POPULATE_COLLECTIONS = {"launchpad": "launchpads", "rocket": "rockets", "payloads": "payloads",
+                        "core": "cores", "crew": "crew", "capsules": "capsules", "ships": "ships"}
+
+
+class FaultConfig:
+    def __init__(self, latency_ms=0, jitter_ms=0, rate_limit=0, retry_after=1,
+                 error_rate=0.0, drop_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit      # saniyedeki istek; 0 = sınırsız
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.tokens = float(rate_limit)
+        self.last_refill = time.monotonic()
+        self.stats = {"requests": 0, "ok": 0, "not_found": 0, "rate_limited": 0, "errors": 0, "dropped": 0, "not_modified": 0}
+
+    def roll(self, probability):
+        with self.lock:
+            return self.random.random() < probability
+
+    def delay(self):
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, (self.latency_ms + jitter) / 1000.0)
+
+    def take_token(self):
+        # Token bucket: saniyede rate_limit jeton, kapasite rate_limit
+        if not self.rate_limit:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate_limit, self.tokens + (now - self.last_refill) * self.rate_limit)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+
+class FixtureStore:
+    """Resolves API paths to recorded JSON documents."""
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR, synthetic_launches=None):
+        self.fixtures_dir = fixtures_dir
+        self.synthetic_launches = synthetic_launches
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def load(self, relative):
+        with self.lock:
+            if relative in self.cache:
+                return self.cache[relative]
+        path = os.path.join(self.fixtures_dir, relative + ".json")
+        document = None
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        elif relative == "v4/launches" and self.synthetic_launches is not None:
+            document = self.synthetic_launches
+        with self.lock:
+            self.cache[relative] = document
+        return document
+
+    def resolve(self, path):
+        relative = path.strip("/")
+        document = self.load(relative)
+        if document is not None:
+            return document
+
+        collection, _, item = relative.rpartition("/")
+        documents = self.load(collection)
+        if not isinstance(documents, list):
+            return None
+        if collection == "v4/launches" and item in ("latest", "next", "past", "upcoming"):
+            past = [d for d in documents if not d.get("upcoming")]
+            upcoming = [d for d in documents if d.get("upcoming")]
+            by_date = lambda d: d.get("date_unix") or 0
+            if item == "latest":
+                return max(past, key=by_date) if past else None
+            if item == "next":
+                return min(upcoming, key=by_date) if upcoming else None
+            return past if item == "past" else upcoming
+        return next((d for d in documents if d.get("id") == item), None)
+
+
+    def lookup(self, collection, doc_id):
+        documents = self.load(f"v4/{collection}")
+        if not isinstance(documents, list):
+            return None
+        with self.lock:
+            index = self.cache.get(("index", collection))
+            if index is None:
+                index = {d.get("id"): d for d in documents}
+                self.cache[("index", collection)] = index
+        return index.get(doc_id)
+
+    def query(self, collection, body):
+        """Minimal mongoose-paginate emulation for POST /v4/<collection>/query."""
+        documents = self.load(f"v4/{collection}")
+        if not isinstance(documents, list):
+            return None
+        query = body.get("query") or {}
+        options = body.get("options") or {}
+
+        def matches(document):
+            for key, expected in query.items():
+                value = document.get(key)
+                if isinstance(expected, dict) and "$in" in expected:
+                    if value not in expected["$in"]:
+                        return False
+                elif value != expected:
+                    return False
+            return True
+
+        selected = [d for d in documents if matches(d)]
+        total = len(selected)
+        limit = int(options.get("limit", 10)) if options.get("pagination", True) else max(total, 1)
+        page = int(options.get("page", 1))
+        page_docs = [json.loads(json.dumps(d)) for d in selected[(page - 1) * limit:page * limit]]
+        for spec in options.get("populate") or []:
+            path = spec if isinstance(spec, str) else spec.get("path", "")
+            for document in page_docs:
+                self.populate(document, path.split("."))
+        total_pages = max(1, -(-total // limit))
+        return {
+            "docs": page_docs, "totalDocs": total, "limit": limit, "page": page, "totalPages": total_pages,
+            "hasPrevPage": page > 1, "hasNextPage": page < total_pages,
+            "prevPage": page - 1 if page > 1 else None, "nextPage": page + 1 if page < total_pages else None,
+        }
+
+    def populate(self, document, segments):
+        # "cores.core" gibi iç içe yolları kimlikten belgeye çevir
+        key, rest = segments[0], segments[1:]
+        value = document.get(key)
+        if rest:
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, dict):
+                    self.populate(item, rest)
+            return
+        collection = POPULATE_COLLECTIONS.get(key, key)
+        resolve = lambda ref: (self.lookup(collection, ref) or ref) if isinstance(ref, str) else ref
+        if isinstance(value, list):
+            document[key] = [resolve(ref) for ref in value]
+        elif value is not None:
+            document[key] = resolve(value)
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    store = None
+    faults = None
+    quiet = True
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def send_json(self, status, document, headers=None):
+        body = json.dumps(document).encode("utf-8")
+        headers = dict(headers or {})
+        if status == 200:
+            # Koşullu istekler: içerik değişmediyse gövdesiz 304
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                self.faults.count("not_modified")
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def inject_faults(self):
+        """Apply configured faults; returns False when the request was already answered."""
+        faults = self.faults
+        faults.count("requests")
+        if not faults.take_token():
+            faults.count("rate_limited")
+            self.send_json(429, {"error": "Too Many Requests"}, {"Retry-After": str(faults.retry_after)})
+            return False
+        time.sleep(faults.delay())
+        if faults.roll(faults.drop_rate):
+            # Yanıt göndermeden bağlantıyı kapat
+            faults.count("dropped")
+            self.close_connection = True
+            return False
+        if faults.roll(faults.error_rate):
+            faults.count("errors")
+            self.send_json(503, {"error": "Service Unavailable"})
+            return False
+        return True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b"{}"
+        if not self.inject_faults():
+            return
+        path = urlparse(self.path).path.strip("/")
+        parts = path.split("/")
+        if len(parts) != 3 or parts[0] != "v4" or parts[2] != "query":
+            self.faults.count("not_found")
+            self.send_json(404, {"error": "Not Found"})
+            return
+        try:
+            body = json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            self.send_json(400, {"error": "Invalid JSON"})
+            return
+        result = self.store.query(parts[1], body)
+        if result is None:
+            self.faults.count("not_found")
+            self.send_json(404, {"error": "Not Found"})
+            return
+        self.faults.count("ok")
+        self.send_json(200, result)
+
+    def do_GET(self):
+        if not self.inject_faults():
+            return
+        document = self.store.resolve(urlparse(self.path).path)
+        if document is None:
+            self.faults.count("not_found")
+            self.send_json(404, {"error": "Not Found"})
+            return
+        self.faults.count("ok")
+        self.send_json(200, document)
+
+
+def start_server(host="127.0.0.1", port=8765, store=None, faults=None, quiet=True):
+    """Start the mock API on a background thread and return the server."""
+    handler = type("ConfiguredMockAPIHandler", (MockAPIHandler,), {
+        "store": store or FixtureStore(),
+        "faults": faults or FaultConfig(),
+        "quiet": quiet,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def record(fixtures_dir):
+    import spacex_client
+
+    def save(relative, document):
+        path = os.path.join(fixtures_dir, relative + ".json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False)
+        print(f"  ✅ {relative}")
+
+    print(f"Recording {spacex_client.BASE_URL} into {fixtures_dir}...")
+    for path in RECORD_PATHS:
+        response = spacex_client.get(path)
+        if response.status_code != 200:
+            print(f"  ❌ {path}: HTTP {response.status_code}")
+            continue
+        document = response.json()
+        save(path.strip("/"), document)
+
+
+def synthetic_feed(rows, seed):
+    import generate_launches
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = generate_launches.generate(os.path.join(tmp, "launches.json"), rows, seed=seed)
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock SpaceX API server.")
+    parser.add_argument("command", choices=("serve", "record"), nargs="?", default="serve")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Directory with recorded responses")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--rate-limit", type=float, default=0, help="Requests per second before answering 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of connections closed without a response")
+    parser.add_argument("--synthetic-rows", type=int, default=0, help="Serve a synthetic /v4/launches when none is recorded")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.fixtures)
+        return
+
+    synthetic = synthetic_feed(args.synthetic_rows, args.seed or 42) if args.synthetic_rows else None
+    faults = FaultConfig(args.latency_ms, args.jitter_ms, args.rate_limit, args.retry_after,
+                         args.error_rate, args.drop_rate, args.seed)
+    server = start_server(args.host, args.port, FixtureStore(args.fixtures, synthetic), faults, not args.verbose)
+    print(f"Mock SpaceX API listening on http://{args.host}:{args.port} (fixtures: {args.fixtures})")
+    print(f"Use: SPACEX_API_URL=http://{args.host}:{args.port} python scripts/CsvConvert.py")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print("\nStats:", json.dumps(faults.stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Lightweight timers, counters and histograms for the dashboard hot paths.
+
+Disabled by default; set SPACEX_PERF=1 or call enable() to start recording.
+While disabled every helper returns immediately, so instrumented code pays
+for a single flag check.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from functools import wraps
+
+MAX_SAMPLES = 2048       # Her metrik için saklanan son ölçüm sayısı
+MAX_TRACE_EVENTS = 100000
+
+_enabled = os.environ.get('SPACEX_PERF', '0') == '1'
+_lock = threading.Lock()
+_samples = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+_totals = defaultdict(int)   # Histogram başına toplam kayıt sayısı
+_counters = defaultdict(int)
+_trace = deque(maxlen=MAX_TRACE_EVENTS)
+_origin = time.perf_counter()
+
+
+def enable(flag=True):
+    global _enabled
+    _enabled = bool(flag)
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    global _origin
+    with _lock:
+        _samples.clear()
+        _totals.clear()
+        _counters.clear()
+        _trace.clear()
+        _origin = time.perf_counter()
+
+
+def count(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] += n
+
+
+def record(name, value_ms):
+    if not _enabled:
+        return
+    with _lock:
+        _samples[name].append(value_ms)
+        _totals[name] += 1
+
+
+def _record_span(name, start, end):
+    duration_ms = (end - start) * 1000.0
+    with _lock:
+        _samples[name].append(duration_ms)
+        _totals[name] += 1
+        _trace.append({
+            'name': name,
+            'ph': 'X',
+            'ts': (start - _origin) * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        })
+
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _record_span(self.name, self.start, time.perf_counter())
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name):
+    """Context manager recording the wall time of a block under `name`."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(name)
+
+
+def timed(name):
+    """Decorator form of timer()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record_span(name, start, time.perf_counter())
+        return wrapper
+    return decorator
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summary():
+    """Return one row per histogram: (name, count, p50, p95, max) in ms."""
+    with _lock:
+        snapshot = {name: (sorted(values), _totals[name]) for name, values in _samples.items()}
+    rows = []
+    for name in sorted(snapshot):
+        values, total = snapshot[name]
+        rows.append((name, total, _percentile(values, 50), _percentile(values, 95), values[-1] if values else 0.0))
+    return rows
+
+
+def counters():
+    with _lock:
+        return dict(_counters)
+
+
+def export_chrome_trace(path):
+    """Write recorded spans in the Chrome trace event format (chrome://tracing, Perfetto)."""
+    with _lock:
+        events = list(_trace)
+        counter_values = dict(_counters)
+    payload = {
+        'traceEvents': events,
+        'displayTimeUnit': 'ms',
+        'otherData': {'counters': counter_values},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    return len(events)
@@ -0,0 +1,104 @@
+"""When the dashboard should refresh its data in the background.
+
+Settings live in data/refresh_settings.json:
+
+    enabled               run scheduled refreshes at all
+    interval_minutes      normal cadence
+    near_launch_minutes   cadence while a launch is less than a day away
+    quiet_start/quiet_end no refreshes in this local-time window ("23:00"-"07:00"),
+                          unless a launch is within its window
+    last_refresh          unix time of the last successful refresh (written by the dashboard)
+"""
+import datetime
+import json
+import os
+import time
+
+import data_paths
+
+SETTINGS_PATH = os.path.join(data_paths.DATA_DIR, "refresh_settings.json")
+DEFAULT_SETTINGS = {
+    "enabled": False,
+    "interval_minutes": 360,
+    "near_launch_minutes": 30,
+    "quiet_start": "23:00",
+    "quiet_end": "07:00",
+    "last_refresh": None,
+}
+RETRY_MINUTES = 15  # Başarısız yenilemeden sonra
+MIN_DELAY = 60
+NEAR_LAUNCH_WINDOW = 24 * 3600
+LAUNCH_WINDOW = (-3 * 3600, 3600)  # Fırlatmadan 1 saat önce ile 3 saat sonrası
+
+
+def load_settings(path=None):
+    settings = dict(DEFAULT_SETTINGS)
+    try:
+        with open(path or SETTINGS_PATH, "r", encoding="utf-8") as f:
+            settings.update(json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return settings
+
+
+def save_settings(settings, path=None):
+    path = path or SETTINGS_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(settings, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def _parse_time(value):
+    hours, minutes = value.split(":")
+    return datetime.time(int(hours), int(minutes))
+
+
+def in_quiet_hours(settings, when):
+    """True when the local datetime `when` falls inside the quiet window (which may wrap midnight)."""
+    start, end = _parse_time(settings["quiet_start"]), _parse_time(settings["quiet_end"])
+    if start == end:
+        return False
+    current = when.time()
+    if start < end:
+        return start <= current < end
+    return current >= start or current < end
+
+
+def quiet_hours_end(settings, when):
+    """The first moment after `when` that is outside the quiet window."""
+    end = _parse_time(settings["quiet_end"])
+    candidate = when.replace(hour=end.hour, minute=end.minute, second=0, microsecond=0)
+    if candidate <= when:
+        candidate += datetime.timedelta(days=1)
+    return candidate
+
+
+def seconds_to_launch(next_launch, now):
+    # Yalnızca saat hassasiyetli tarihler yakın fırlatma sayılır
+    if not next_launch or not next_launch.get("date_unix") or next_launch.get("date_precision") != "hour":
+        return None
+    return next_launch["date_unix"] - now
+
+
+def next_refresh_delay(settings, now=None, next_launch=None, last_refresh=None, failed=False):
+    """Seconds until the next scheduled refresh (at least MIN_DELAY)."""
+    now = time.time() if now is None else now
+    interval = RETRY_MINUTES * 60 if failed else settings["interval_minutes"] * 60
+    to_launch = seconds_to_launch(next_launch, now)
+    if to_launch is not None and LAUNCH_WINDOW[0] <= to_launch <= NEAR_LAUNCH_WINDOW:
+        interval = min(interval, settings["near_launch_minutes"] * 60)
+    due = (now if failed or not last_refresh else last_refresh) + interval
+    # Fırlatma penceresi açılırken bir yenileme daha
+    window_opens = now + to_launch - LAUNCH_WINDOW[1] if to_launch is not None else None
+    if window_opens is not None and now < window_opens < due:
+        due = window_opens
+    due = max(due, now + MIN_DELAY)
+
+    due_dt = datetime.datetime.fromtimestamp(due)
+    launch_at_due = seconds_to_launch(next_launch, due)
+    in_launch_window = launch_at_due is not None and LAUNCH_WINDOW[0] <= launch_at_due <= LAUNCH_WINDOW[1]
+    if in_quiet_hours(settings, due_dt) and not in_launch_window:
+        quiet_end = quiet_hours_end(settings, due_dt).timestamp()
+        due = window_opens if window_opens is not None and due < window_opens < quiet_end else quiet_end
+    return int(due - now)
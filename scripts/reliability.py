@@ -0,0 +1,253 @@
+"""Rolling reliability per rocket and launchpad: windowed success rates, streaks and Wilson intervals.
+
+Launch outcomes are kept in time order. Rolling counts come from cumulative
+sums over a group-sorted copy and streaks from run boundaries, so no step
+loops over launches in Python. Appending newer launches only processes the new
+rows plus the last `window` outcomes of each group they touch.
+
+Launches without a known outcome (upcoming, or success missing) are ignored.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_WINDOW = 20
+Z = 1.96  # %95 güven aralığı
+GROUPS = ("rocket", "launchpad")
+
+
+def wilson_interval(successes, trials, z=Z):
+    """Wilson score interval as fractions; (NaN, NaN) where there are no trials."""
+    k = np.asarray(successes, dtype=float)
+    n = np.asarray(trials, dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p = k / n
+        denominator = 1 + z * z / n
+        centre = (p + z * z / (2 * n)) / denominator
+        half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return centre - half, centre + half
+
+
+def rolling_counts(codes, success, window):
+    """Successes and trials among the last `window` outcomes of each row's group (rows in time order)."""
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    cumulative = np.concatenate(([0], np.cumsum(success[order], dtype=np.int64)))
+    position = np.arange(len(order))
+    group_start = np.searchsorted(sorted_codes, sorted_codes, side="left")
+    lower = np.maximum(position + 1 - window, group_start)
+    successes = np.empty(len(order), dtype=np.int32)
+    trials = np.empty(len(order), dtype=np.int32)
+    successes[order] = cumulative[position + 1] - cumulative[lower]
+    trials[order] = position + 1 - lower
+    return successes, trials
+
+
+def streak_runs(codes, success, group_count):
+    """Per-group run summary of outcomes in time order.
+
+    Returns a dict of arrays indexed by group code: present, first_value,
+    first_length, single_run, last_value, last_length, longest_success,
+    longest_failure.
+    """
+    runs = {name: np.zeros(group_count, dtype=np.int64) for name in
+            ("first_length", "last_length", "longest_success", "longest_failure")}
+    runs["present"] = np.zeros(group_count, dtype=bool)
+    runs["single_run"] = np.zeros(group_count, dtype=bool)
+    runs["first_value"] = np.full(group_count, -1, dtype=np.int64)
+    runs["last_value"] = np.full(group_count, -1, dtype=np.int64)
+    if not len(codes):
+        # Sonucu bilinen fırlatma yok: hiçbir grupta dizi yok
+        return runs
+
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    values = success[order]
+    run_start = np.ones(len(order), dtype=bool)
+    run_start[1:] = (sorted_codes[1:] != sorted_codes[:-1]) | (values[1:] != values[:-1])
+    starts = np.flatnonzero(run_start)
+    lengths = np.diff(np.append(starts, len(order)))
+    run_codes = sorted_codes[starts]
+    run_values = values[starts].astype(np.int64)
+
+    new_group = np.ones(len(starts), dtype=bool)
+    new_group[1:] = run_codes[1:] != run_codes[:-1]
+    first = np.flatnonzero(new_group)
+    last = np.append(first[1:] - 1, len(starts) - 1)
+
+    group_codes = run_codes[first]
+    runs["present"][group_codes] = True
+    runs["first_value"][group_codes] = run_values[first]
+    runs["first_length"][group_codes] = lengths[first]
+    runs["last_value"][group_codes] = run_values[last]
+    runs["last_length"][group_codes] = lengths[last]
+    runs["single_run"][group_codes] = first == last
+    successful = run_values == 1
+    np.maximum.at(runs["longest_success"], run_codes[successful], lengths[successful])
+    np.maximum.at(runs["longest_failure"], run_codes[~successful], lengths[~successful])
+    return runs
+
+
+class GroupReliability:
+    """Rolling series and running totals for one grouping column (rocket or launchpad)."""
+
+    STATE = ("trials", "successes", "longest_success", "longest_failure", "current_length")
+
+    def __init__(self, window):
+        self.window = window
+        self.ids = []
+        self.codes_by_id = {}
+        self.codes = np.empty(0, dtype=np.int32)        # Satır başına grup kodu (zaman sırasında)
+        self.rolling_successes = np.empty(0, dtype=np.int32)
+        self.rolling_trials = np.empty(0, dtype=np.int32)
+        for name in self.STATE:
+            setattr(self, name, np.zeros(0, dtype=np.int64))
+        self.current_value = np.zeros(0, dtype=np.int64)
+        self.tails = []                                   # Grup başına son `window` sonuç
+
+    def encode(self, ids):
+        values = pd.Series(ids, dtype=object).fillna("unknown").astype(str)
+        codes, uniques = pd.factorize(values)
+        # Yalnızca benzersiz kimlikler üzerinde dönülür
+        mapping = np.array([self.codes_by_id.setdefault(group_id, len(self.codes_by_id)) for group_id in uniques],
+                           dtype=np.int32)
+        added = len(self.codes_by_id) - len(self.ids)
+        if added:
+            self.ids.extend(list(self.codes_by_id)[len(self.ids):])
+            for name in self.STATE:
+                setattr(self, name, np.concatenate((getattr(self, name), np.zeros(added, dtype=np.int64))))
+            self.current_value = np.concatenate((self.current_value, np.full(added, -1, dtype=np.int64)))
+            self.tails.extend(np.empty(0, dtype=np.int8) for _ in range(added))
+        return mapping[codes] if len(mapping) else np.empty(0, dtype=np.int32)
+
+    def extend(self, ids, success):
+        if not len(ids):
+            return
+        codes = self.encode(ids)
+        touched = np.unique(codes)
+        # Etkilenen grupların son sonuçları başa eklenir; pencere tam hesaplanır
+        tail_values = [self.tails[code] for code in touched]
+        tail_codes = np.repeat(touched, [len(tail) for tail in tail_values]).astype(np.int32)
+        all_codes = np.concatenate((tail_codes, codes))
+        all_success = np.concatenate(tail_values + [success]) if tail_values else success
+        successes, trials = rolling_counts(all_codes, all_success, self.window)
+        self.codes = np.concatenate((self.codes, codes))
+        self.rolling_successes = np.concatenate((self.rolling_successes, successes[len(tail_codes):]))
+        self.rolling_trials = np.concatenate((self.rolling_trials, trials[len(tail_codes):]))
+
+        group_count = len(self.ids)
+        self.trials += np.bincount(codes, minlength=group_count)
+        self.successes += np.bincount(codes, weights=success, minlength=group_count).astype(np.int64)
+        self._merge_streaks(streak_runs(codes, success, group_count))
+
+        # Kuyruklar döngüsü fırlatma başına değil, etkilenen grup başına
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        sorted_success = success[order]
+        starts = np.searchsorted(sorted_codes, touched, side="left")
+        ends = np.searchsorted(sorted_codes, touched, side="right")
+        for code, start, end in zip(touched, starts, ends):
+            self.tails[code] = np.concatenate((self.tails[code], sorted_success[start:end]))[-self.window:]
+
+    def _merge_streaks(self, runs):
+        present = runs["present"]
+        continues = present & (self.current_value == runs["first_value"])
+        merged = np.where(continues, self.current_length + runs["first_length"], runs["first_length"])
+        for value, name in ((1, "longest_success"), (0, "longest_failure")):
+            candidate = np.where(runs["first_value"] == value, merged, 0)
+            longest = np.maximum(getattr(self, name), np.maximum(runs[name], candidate))
+            setattr(self, name, np.where(present, longest, getattr(self, name)))
+        self.current_length = np.where(present, np.where(runs["single_run"], merged, runs["last_length"]),
+                                       self.current_length)
+        self.current_value = np.where(present, runs["last_value"], self.current_value)
+
+
+class ReliabilityEngine:
+    """Rolling success rates, streaks and Wilson intervals per rocket and per launchpad."""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self.reset()
+
+    @classmethod
+    def from_columns(cls, columns, window=DEFAULT_WINDOW):
+        engine = cls(window)
+        engine.rebuild(columns)
+        return engine
+
+    def reset(self):
+        self.epoch = np.empty(0, dtype=np.int64)
+        self.success = np.empty(0, dtype=np.int8)
+        self.groups = {group: GroupReliability(self.window) for group in GROUPS}
+
+    def rebuild(self, columns):
+        """Recompute everything from a launch_columns() frame."""
+        self.reset()
+        self._extend(self._known(columns))
+
+    def append(self, columns):
+        """Add launches newer than everything seen so far; False when a full rebuild is needed instead."""
+        known = self._known(columns)
+        if known.empty:
+            return True
+        if len(self.epoch) and known["epoch"].iloc[0] < self.epoch[-1]:
+            return False
+        self._extend(known)
+        return True
+
+    @staticmethod
+    def _known(columns):
+        known = columns[columns["success"].notna()]
+        return known.sort_values("epoch", kind="stable")
+
+    def _extend(self, known):
+        success = known["success"].to_numpy(dtype=np.int8)
+        self.epoch = np.concatenate((self.epoch, known["epoch"].to_numpy(dtype=np.int64)))
+        self.success = np.concatenate((self.success, success))
+        for group, series in self.groups.items():
+            series.extend(known[group].to_numpy(dtype=object), success)
+
+    def __len__(self):
+        return len(self.epoch)
+
+    def series(self, group, group_id):
+        """Rolling rate and Wilson interval after each launch of one rocket/launchpad."""
+        groups = self.groups[group]
+        code = groups.codes_by_id.get(str(group_id))
+        rows = np.flatnonzero(groups.codes == code) if code is not None else np.empty(0, dtype=np.int64)
+        successes = groups.rolling_successes[rows]
+        trials = groups.rolling_trials[rows]
+        low, high = wilson_interval(successes, trials)
+        return pd.DataFrame({"epoch": self.epoch[rows], "rate": successes / np.maximum(trials, 1),
+                             "low": low, "high": high, "trials": trials})
+
+    def summaries(self, group):
+        """One row per rocket/launchpad: totals, Wilson interval, last-window rate and streaks."""
+        groups = self.groups[group]
+        low, high = wilson_interval(groups.successes, groups.trials)
+        recent_successes = np.array([tail.sum() for tail in groups.tails], dtype=np.int64)
+        recent_trials = np.array([len(tail) for tail in groups.tails], dtype=np.int64)
+        return pd.DataFrame({
+            "launches": groups.trials,
+            "successes": groups.successes,
+            "rate": groups.successes / np.maximum(groups.trials, 1),
+            "low": low,
+            "high": high,
+            "recent_rate": recent_successes / np.maximum(recent_trials, 1),
+            "recent_launches": recent_trials,
+            "current_streak": groups.current_length,
+            "current_streak_success": groups.current_value == 1,
+            "longest_success_streak": groups.longest_success,
+            "longest_failure_streak": groups.longest_failure,
+        }, index=pd.Index(groups.ids, name=group))
+
+    def summary(self, group, group_id):
+        summaries = self.summaries(group)
+        group_id = str(group_id)
+        return summaries.loc[group_id].to_dict() if group_id in summaries.index else None
+
+
+def engine_for(source, window=DEFAULT_WINDOW):
+    """The source's own engine when it keeps one (the dashboard), otherwise one built from its launch columns."""
+    if hasattr(source, "reliability"):
+        return source.reliability()
+    return ReliabilityEngine.from_columns(source.launch_columns(), window)
@@ -0,0 +1,308 @@
+"""Render report packs: every dashboard chart for every rocket, year and launchpad slice.
+
+    python scripts/render_reports.py                       # PNG for all slices
+    python scripts/render_reports.py --formats png,svg,pdf --workers 8
+    python scripts/render_reports.py --slices rocket --force
+
+The launch CSV is converted once into column arrays (.npy) that worker
+processes open memory-mapped and read-only, so the dataset is shared instead
+of copied into every worker. Slices whose input rows are unchanged since the
+last run (see manifest.json in the output directory) are skipped. Launch
+timelines come from the launch_timelines.npz next to the CSV; each worker
+loads it once and slices it like the columns.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+import data_paths
+import launch_backends
+import launch_charts
+import launch_map
+import launch_timeline
+
+REPORTS_DIR = os.path.join(data_paths.DATA_DIR, "reports")
+FORMATS = ("png", "svg", "pdf")
+SLICE_KINDS = ("all", "rocket", "year", "launchpad")
+DATASET_VERSION = 3
+FIGURE_SIZE = (12, 8)
+DPI = 100
+
+# Çalışan süreçte bir kez açılan, bellek eşlemeli sütunlar ve zaman çizelgeleri
+_columns = None
+_timelines = None
+
+
+def _csv_signature(csv_path):
+    stat = os.stat(csv_path)
+    return f"{DATASET_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def build_dataset(csv_path, dataset_dir):
+    """Write epoch/year/success/rocket/launchpad column arrays for csv_path unless they are current."""
+    meta_path = os.path.join(dataset_dir, "meta.json")
+    signature = _csv_signature(csv_path)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("signature") == signature:
+            return meta
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    df = launch_backends.prepare_launch_frame(pd.read_csv(csv_path, usecols=["date_utc", "success", "rocket", "launchpad"], low_memory=False))
+    # Başarı: 1 / 0 / -1 (bilinmiyor)
+    success = df["success"].map({True: 1, False: 0}).fillna(-1).to_numpy(dtype=np.int8)
+    rocket_codes, rockets = pd.factorize(df["rocket"].astype(str))
+    launchpad_codes, launchpads = pd.factorize(df["launchpad"].astype(str))
+    columns = {
+        "epoch": df["date_utc"].dt.tz_convert(None).to_numpy(dtype="datetime64[s]").astype(np.int64),
+        "year": df["year"].to_numpy(dtype=np.int16),
+        "success": success,
+        "rocket": rocket_codes.astype(np.int32),
+        "launchpad": launchpad_codes.astype(np.int32),
+    }
+    os.makedirs(dataset_dir, exist_ok=True)
+    for name, values in columns.items():
+        np.save(os.path.join(dataset_dir, f"{name}.npy"), values)
+    meta = {"signature": signature, "rows": len(df), "rockets": list(rockets), "launchpads": list(launchpads)}
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+    return meta
+
+
+def _open_columns(dataset_dir, timelines_path=None):
+    global _columns, _timelines
+    _columns = {name: np.load(os.path.join(dataset_dir, f"{name}.npy"), mmap_mode="r")
+                for name in ("epoch", "year", "success", "rocket", "launchpad")}
+    _timelines = launch_timeline.load(timelines_path) if timelines_path else launch_timeline.TimelineStore.empty()
+
+
+class SliceSource:
+    """Chart data source over one slice of the shared columns (same aggregates as the backends)."""
+
+    def __init__(self, columns, meta, timelines=None):
+        self.columns = columns
+        self.meta = meta
+        self._timelines = timelines if timelines is not None else launch_timeline.TimelineStore.empty()
+        success = pd.array(np.where(columns["success"] < 0, None, columns["success"] == 1), dtype="boolean")
+        self.df = pd.DataFrame({"year": columns["year"], "success": success})
+        self._aggregates = launch_backends.PandasBackend()
+        self._aggregates.df = self.df
+
+    def launch_columns(self):
+        success = np.where(self.columns["success"] < 0, np.nan, self.columns["success"]).astype(float)
+        return pd.DataFrame({
+            "epoch": self.columns["epoch"],
+            "success": success,
+            "rocket": np.asarray(self.meta["rockets"], dtype=object)[self.columns["rocket"]],
+            "launchpad": np.asarray(self.meta["launchpads"], dtype=object)[self.columns["launchpad"]],
+        })
+
+    def launches_per_year(self):
+        return self._aggregates.launches_per_year()
+
+    def success_counts(self):
+        return self._aggregates.success_counts()
+
+    def success_rate_by_year(self):
+        return self._aggregates.success_rate_by_year()
+
+    def timelines(self):
+        return self._timelines
+
+
+def slice_mask(kind, value):
+    if kind == "all":
+        return slice(None)
+    return np.asarray(_columns[kind] == value)
+
+
+def slice_timelines(kind, value, meta):
+    if kind in ("rocket", "launchpad"):
+        # Dilim değeri sütun kodu; zaman çizelgesi deposu kimlikle seçer
+        value = meta[f"{kind}s"][value]
+    return _timelines.select(kind, value)
+
+
+def slice_hash(columns, charts, formats, labels, timelines=None):
+    digest = hashlib.sha1()
+    for name in sorted(columns):
+        digest.update(np.ascontiguousarray(columns[name]).tobytes())
+    if timelines is not None:
+        for name in launch_timeline.ARRAYS:
+            digest.update(np.ascontiguousarray(getattr(timelines, name)).tobytes())
+    digest.update(json.dumps([charts, formats, DPI, FIGURE_SIZE, labels], sort_keys=True).encode())
+    digest.update(_charts_fingerprint().encode())
+    return digest.hexdigest()
+
+
+def _charts_fingerprint():
+    # Grafik tanımları değişirse tüm dilimler yeniden çizilir
+    digest = hashlib.sha1()
+    for module in (launch_charts, launch_map, launch_timeline):
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def chart_filename(chart_type):
+    return re.sub(r"[^a-z0-9]+", "_", chart_type.lower()).strip("_")
+
+
+def render_slice(task):
+    """Render every chart of one slice; returns (key, hash, charts rendered, files written)."""
+    key, kind, value, out_dir, charts, formats, previous_hash, meta, labels = task
+    mask = slice_mask(kind, value)
+    columns = {name: np.asarray(values[mask]) for name, values in _columns.items()}
+    timelines = slice_timelines(kind, value, meta)
+    digest = slice_hash(columns, charts, formats, labels, timelines)
+    paths = [os.path.join(out_dir, f"{chart_filename(chart)}.{fmt}") for chart in charts for fmt in formats]
+    if digest == previous_hash and all(os.path.exists(path) for path in paths):
+        return key, digest, 0, 0
+    if len(columns["year"]) == 0:
+        return key, digest, 0, 0
+
+    os.makedirs(out_dir, exist_ok=True)
+    source = SliceSource(columns, meta, timelines)
+    figure = Figure(figsize=FIGURE_SIZE, facecolor=launch_charts.FIGURE_FACECOLOR)
+    written = 0
+    for chart in charts:
+        launch_charts.draw_chart(figure, chart, source, labels)
+        for fmt in formats:
+            path = os.path.join(out_dir, f"{chart_filename(chart)}.{fmt}")
+            figure.savefig(path + ".tmp", format=fmt, dpi=DPI, facecolor=figure.get_facecolor())
+            os.replace(path + ".tmp", path)
+            written += 1
+    return key, digest, len(charts), written
+
+
+def _safe_name(value):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(value)).strip("_") or "unknown"
+
+
+def plan_slices(meta, kinds, out_dir, rocket_names=None, launchpad_names=None):
+    """(key, kind, value, directory) for every requested slice."""
+    rocket_names = rocket_names or {}
+    launchpad_names = launchpad_names or {}
+    slices = []
+    if "all" in kinds:
+        slices.append(("all", "all", None, os.path.join(out_dir, "all")))
+    if "rocket" in kinds:
+        for code, rocket_id in enumerate(meta["rockets"]):
+            label = _safe_name(rocket_names.get(rocket_id, rocket_id))
+            slices.append((f"rocket/{rocket_id}", "rocket", code, os.path.join(out_dir, "rocket", label)))
+    if "launchpad" in kinds:
+        for code, launchpad_id in enumerate(meta["launchpads"]):
+            label = _safe_name(launchpad_names.get(launchpad_id, launchpad_id))
+            slices.append((f"launchpad/{launchpad_id}", "launchpad", code, os.path.join(out_dir, "launchpad", label)))
+    if "year" in kinds:
+        for year in sorted(set(np.unique(_columns["year"]).tolist())):
+            slices.append((f"year/{year}", "year", year, os.path.join(out_dir, "year", str(year))))
+    return slices
+
+
+def _load_names():
+    rocket_names = {}
+    try:
+        with open(data_paths.ROCKETS_JSON, "r", encoding="utf-8") as f:
+            rocket_names = {r["id"]: r.get("name", r["id"]) for r in json.load(f)}
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    try:
+        import enrich_launches
+        launchpad_names = enrich_launches.load_launchpad_names()
+        launchpad_locations = enrich_launches.load_launchpad_locations()
+    except Exception:
+        launchpad_names, launchpad_locations = {}, {}
+    return rocket_names, launchpad_names, launchpad_locations
+
+
+def render_reports(csv_path, out_dir, kinds=SLICE_KINDS, charts=None, formats=("png",), workers=None, force=False):
+    """Render all slices; returns a summary dict with throughput."""
+    charts = list(charts or launch_charts.CHART_TYPES)
+    formats = list(formats)
+    started = time.perf_counter()
+    dataset_dir = os.path.join(out_dir, ".dataset")
+    meta = build_dataset(csv_path, dataset_dir)
+    timelines_path = launch_timeline.path_for(csv_path)
+    _open_columns(dataset_dir, timelines_path)
+
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    manifest = {}
+    if not force:
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            manifest = {}
+
+    rocket_names, launchpad_names, launchpad_locations = _load_names()
+    slices = plan_slices(meta, kinds, out_dir, rocket_names, launchpad_names)
+    labels = {"rocket": rocket_names, "launchpad": launchpad_names, "launchpad_location": launchpad_locations}
+    tasks = [(key, kind, value, directory, charts, formats, manifest.get(key), meta, labels)
+             for key, kind, value, directory in slices]
+
+    rendered = written = skipped = 0
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_open_columns,
+                             initargs=(dataset_dir, timelines_path)) as pool:
+        for key, digest, chart_count, file_count in pool.map(render_slice, tasks, chunksize=max(1, len(tasks) // (workers * 4))):
+            manifest[key] = digest
+            rendered += chart_count
+            written += file_count
+            skipped += chart_count == 0
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    elapsed = time.perf_counter() - started
+    return {"slices": len(tasks), "skipped": skipped, "charts": rendered, "files": written,
+            "seconds": elapsed, "charts_per_second": rendered / elapsed if elapsed else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render dashboard charts for every rocket, year and launchpad slice.")
+    parser.add_argument("--csv", default=data_paths.LAUNCHES_CSV)
+    parser.add_argument("--out", default=REPORTS_DIR)
+    parser.add_argument("--formats", default="png", help=f"Comma separated: {','.join(FORMATS)}")
+    parser.add_argument("--slices", default=",".join(SLICE_KINDS), help=f"Comma separated: {','.join(SLICE_KINDS)}")
+    parser.add_argument("--charts", help="Comma separated chart names (default: all dashboard charts)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="Re-render slices even if their input is unchanged")
+    args = parser.parse_args()
+
+    formats = [fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()]
+    kinds = [kind.strip() for kind in args.slices.split(",") if kind.strip()]
+    charts = [chart.strip() for chart in args.charts.split(",")] if args.charts else None
+    for value, allowed, label in ((formats, FORMATS, "format"), (kinds, SLICE_KINDS, "slice"),
+                                  (charts or [], launch_charts.CHART_TYPES, "chart")):
+        unknown = [v for v in value if v not in allowed]
+        if unknown:
+            parser.error(f"unknown {label}: {', '.join(unknown)}")
+    if not os.path.exists(args.csv):
+        parser.error(f"{args.csv} not found; run scripts/CsvConvert.py first")
+
+    summary = render_reports(args.csv, args.out, kinds, charts, formats, args.workers, args.force)
+    print(f"{summary['slices']} slices ({summary['skipped']} unchanged), {summary['charts']} charts, "
+          f"{summary['files']} files in {summary['seconds']:.2f}s "
+          f"({summary['charts_per_second']:.1f} charts/s) -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
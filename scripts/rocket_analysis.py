@@ -1,9 +1,15 @@
 import pandas as pd
-import requests
 import json
+import os
+
+import data_paths
+import spacex_client
+import update_pipeline
+
+STAGE = "rocket_analysis"
 
 # CSV'yi oku
-df = pd.read_csv('../data/spacex_launches.csv')
+df = pd.read_csv(data_paths.LAUNCHES_CSV)
 
 # Kullanılan roket ID'lerini bul
 rocket_ids = df['rocket'].unique()
@@ -11,15 +17,22 @@ print(f"Toplam {len(rocket_ids)} farklı roket ID'si bulundu:")
 
 # Her roket ID'si için detaylı bilgi al
 rockets_info = []
+# Yarıda kalmış bir güncellemede alınmış roketler tekrar istenmez
+fetched = update_pipeline.completed_items(STAGE)
 
 for rocket_id in rocket_ids:
     if pd.isna(rocket_id) or rocket_id == "":
         continue
+
+    if rocket_id in fetched:
+        rockets_info.append(fetched[rocket_id])
+        print(f"✅ {fetched[rocket_id]['name']} (önceki denemeden)")
+        continue
         
     try:
         # SpaceX API'den roket bilgilerini al
-        url = f"https://api.spacexdata.com/v4/rockets/{rocket_id}"
-        response = requests.get(url)
+        url = spacex_client.api_url(f"/v4/rockets/{rocket_id}")
+        response = spacex_client.get(url)
         
         if response.status_code == 200:
             rocket_data = response.json()
@@ -42,6 +55,7 @@ for rocket_id in rocket_ids:
             }
             
             rockets_info.append(rocket_info)
+            update_pipeline.mark_item_done(STAGE, rocket_id, rocket_info)
             print(f"✅ {rocket_info['name']} - {rocket_info['type']}")
             
         else:
@@ -51,8 +65,8 @@ for rocket_id in rocket_ids:
         print(f"❌ {rocket_id} için hata: {e}")
 
 # Sonuçları JSON dosyasına kaydet
-with open('../data/rockets_info.json', 'w', encoding='utf-8') as f:
-    json.dump(rockets_info, f, ensure_ascii=False, indent=2)
+os.makedirs(data_paths.DATA_DIR, exist_ok=True)
+update_pipeline.write_json_atomic(data_paths.ROCKETS_JSON, rockets_info)
 
 print(f"\n{len(rockets_info)} roket bilgisi rockets_info.json dosyasına kaydedildi.")
 
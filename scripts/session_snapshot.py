@@ -0,0 +1,140 @@
+"""Warm-start snapshot of the dashboard session.
+
+When the dashboard closes it saves data/session/:
+
+- session.json: format version, backend, content hashes of the dataset files
+  (launch CSV, rockets_info.json, spacex_related.sqlite), the filter state,
+  selected tab and chart, stat card values, the year list and the first
+  TABLE_PAGE_ROWS rendered table rows
+- frame/: the validated launch frame as column files in the data service's
+  snapshot layout (pandas backend only), so a relaunch skips CSV parsing and
+  schema validation
+- filtered_rows.npy: row positions of the filtered view in that frame
+- thumbnails/: scaled gallery and detail images as small PNGs
+
+The filters, tab and chart are always restored. Everything else is used only
+when the file hashes still match; otherwise the dashboard loads as usual.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+import data_service
+import perf_metrics
+
+SESSION_FORMAT = 2   # 2: tarih sütunu kendi çözünürlüğüyle kaydedilir
+SESSION_FILE = "session.json"
+FRAME_DIR = "frame"
+FILTERED_ROWS_FILE = "filtered_rows.npy"
+THUMBNAILS_DIR = "thumbnails"
+TABLE_PAGE_ROWS = 100
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_hash(path):
+    """Content hash of a file, or None when it does not exist."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def file_hashes(paths):
+    return {path: file_hash(path) for path in paths}
+
+
+class Session:
+    """A saved session. frame, filtered_rows and the data-bound state are only usable when valid."""
+
+    def __init__(self, state, valid, frame=None, filtered_rows=None):
+        self.state = state
+        self.valid = valid
+        self.frame = frame
+        self.filtered_rows = filtered_rows
+
+    @property
+    def filters(self):
+        return self.state["filters"]
+
+
+def load(directory, backend_name, hashes):
+    """The session saved in directory, or None when there is none or it has another format."""
+    try:
+        with open(os.path.join(directory, SESSION_FILE), "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if state.get("format") != SESSION_FORMAT:
+        return None
+    valid = state.get("backend") == backend_name and state.get("hashes") == hashes
+    frame = filtered_rows = None
+    if valid:
+        try:
+            if state.get("frame"):
+                # Bellek eşlemesiz okunur; kapanışta aynı klasör yeniden yazılabilir
+                frame = data_service.read_snapshot(os.path.join(directory, FRAME_DIR), mmap_mode=None)
+            if state.get("filtered_rows"):
+                filtered_rows = np.load(os.path.join(directory, FILTERED_ROWS_FILE))
+        except (OSError, ValueError, KeyError):
+            valid, frame, filtered_rows = False, None, None
+    perf_metrics.count("session.warm" if valid else "session.cold")
+    return Session(state, valid, frame, filtered_rows)
+
+
+def save(directory, state, hashes=None, frame=None, keep_frame=False, filtered_rows=None):
+    """Write the session.
+
+    hashes ties the data-bound state to the dataset files; pass None when the
+    data in memory no longer matches them, and only the view state is kept.
+    frame is written when given; keep_frame keeps the previously saved one.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, SESSION_FILE)
+    # Önce eski oturum geçersiz kılınır; yarıda kalan bir kayıt soğuk açılışa düşer
+    if os.path.exists(path):
+        os.remove(path)
+    frame_dir = os.path.join(directory, FRAME_DIR)
+    if frame is not None and hashes is not None:
+        shutil.rmtree(frame_dir, ignore_errors=True)
+        data_service.write_snapshot(frame.reset_index(drop=True), frame_dir)
+    elif not (keep_frame and hashes is not None):
+        shutil.rmtree(frame_dir, ignore_errors=True)
+    rows_path = os.path.join(directory, FILTERED_ROWS_FILE)
+    if filtered_rows is not None and hashes is not None:
+        np.save(rows_path, np.asarray(filtered_rows, dtype=np.int64))
+    elif os.path.exists(rows_path):
+        os.remove(rows_path)
+
+    state = dict(state, format=SESSION_FORMAT, saved=time.time(), hashes=hashes,
+                 frame=hashes is not None and os.path.isdir(frame_dir),
+                 filtered_rows=hashes is not None and os.path.exists(rows_path))
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+
+def thumbnail_path(directory, image_path, mtime_ns, width, height):
+    key = f"{os.path.abspath(image_path)}|{mtime_ns}|{width}x{height}"
+    return os.path.join(directory, THUMBNAILS_DIR, hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest() + ".png")
+
+
+def prune_thumbnails(directory, keep):
+    """Remove thumbnails not in keep (paths used during this session)."""
+    folder = os.path.join(directory, THUMBNAILS_DIR)
+    keep = {os.path.abspath(path) for path in keep}
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        return
+    for name in names:
+        path = os.path.join(folder, name)
+        if os.path.abspath(path) not in keep:
+            os.remove(path)
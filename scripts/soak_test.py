@@ -0,0 +1,158 @@
+"""Headless soak test: dashboard memory must stay flat over long sessions.
+
+    python scripts/soak_test.py --iterations 2000
+    python scripts/soak_test.py --iterations 5000 --csv data/synthetic/spacex_launches.csv --max-growth-mb 1
+
+Each iteration opens and closes the launch detail dialog, reloads the dataset
+from disk, switches the chart and every tenth iteration rebuilds the rocket
+gallery (offscreen Qt, Agg backend). After --warmup iterations, when caches
+are full and lazy imports are done, a tracemalloc baseline is taken; at the end
+Python allocations, live Qt objects and the dashboard's accounted memory
+(memory_budget.MemoryLedger) are compared with it. Exits with status 1 when
+traced memory grew by more than --max-growth-mb or Qt objects were left
+behind, and prints the allocation sites that grew. Tracing slows every
+allocation down (about 4x), so plan on a few minutes per thousand iterations.
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import matplotlib
+matplotlib.use("Agg")
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWidgets import QApplication
+
+import generate_launches
+import memory_budget
+
+
+def close_modal():
+    # exec_() ile açılan diyalog (ya da bilgi kutusu) olay döngüsünün ilk turunda kapatılır
+    dialog = QApplication.activeModalWidget()
+    if dialog is not None:
+        dialog.close()
+
+
+def qt_objects(window):
+    return len(window.findChildren(QObject)) + len(QApplication.topLevelWidgets())
+
+
+def sample(window, iteration):
+    gc.collect()
+    QApplication.processEvents()
+    return {
+        "iteration": iteration,
+        "traced": memory_budget.traced()[0],
+        "rss": memory_budget.process_rss(),
+        "qt_objects": qt_objects(window),
+        "accounted": window.memory_ledger.stats()["total_bytes"],
+    }
+
+
+def run_iteration(window, i, charts):
+    rows = window.table.rowCount()
+    if rows:
+        QTimer.singleShot(0, close_modal)
+        window.show_launch_details(window.table.item(i % rows, 0))
+    window.reload_data()
+    window.show_chart(charts[i % len(charts)])
+    if i % 10 == 0:
+        window.populate_rocket_gallery()
+    # deleteLater ile bırakılan Qt nesneleri olay döngüsünde silinir
+    QApplication.processEvents()
+
+
+def format_sample(point):
+    rss = f"{point['rss'] / 2**20:.0f} MB" if point["rss"] is not None else "n/a"
+    return (f"{point['iteration']:>7}  traced {point['traced'] / 2**20:8.2f} MB  RSS {rss:>8}  "
+            f"Qt objects {point['qt_objects']:>5}  accounted {point['accounted'] / 2**20:7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that dashboard memory stays flat over many dialogs and reloads.")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100, help="Iterations before the baseline snapshot")
+    parser.add_argument("--sample-every", type=int, default=250)
+    parser.add_argument("--csv", help="Launch CSV to load (default: data/spacex_launches.csv, else a synthetic one)")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows of the synthetic dataset")
+    parser.add_argument("--max-growth-mb", type=float, default=2.0,
+                        help="Allowed growth of traced Python memory after the warmup")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    import main as dashboard
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = args.csv or os.path.join(ROOT_DIR, dashboard.LAUNCHES_CSV)
+        if not os.path.exists(csv_path):
+            csv_path = os.path.join(tmp, "spacex_launches.csv")
+            generate_launches.generate(csv_path, args.rows, "growth", 42)
+        dashboard.LAUNCHES_CSV = os.path.abspath(csv_path)
+        dashboard.SESSION_DIR = None   # Kullanıcının oturum kaydına dokunulmaz
+
+        cwd = os.getcwd()
+        os.chdir(ROOT_DIR)
+        try:
+            window = dashboard.SpaceXGUI()
+            charts = [window.chart_combo.itemText(i) for i in range(window.chart_combo.count())]
+            started = time.perf_counter()
+            for i in range(args.warmup):
+                run_iteration(window, i, charts)
+
+            memory_budget.start_tracing()
+            baseline_snapshot = memory_budget.take_snapshot()
+            samples = [sample(window, args.warmup)]
+            print(format_sample(samples[0]))
+            for i in range(args.warmup, args.warmup + args.iterations):
+                run_iteration(window, i, charts)
+                if (i + 1 - args.warmup) % args.sample_every == 0:
+                    samples.append(sample(window, i + 1))
+                    print(format_sample(samples[-1]))
+            if samples[-1]["iteration"] != args.warmup + args.iterations:
+                samples.append(sample(window, args.warmup + args.iterations))
+            final_snapshot = memory_budget.take_snapshot()
+            elapsed = time.perf_counter() - started
+            window.close()
+        finally:
+            os.chdir(cwd)
+
+    first, last = samples[0], samples[-1]
+    growth = last["traced"] - first["traced"]
+    leaked_objects = last["qt_objects"] - first["qt_objects"]
+    print(f"\n{args.iterations} iterations in {elapsed:.1f}s ({elapsed / (args.warmup + args.iterations) * 1000:.1f} ms each)")
+    print(f"Python allocations: {growth / 2**20:+.2f} MB (limit {args.max_growth_mb:g} MB)")
+    print(f"Qt objects: {leaked_objects:+d}")
+    if first["rss"] is not None:
+        print(f"RSS: {(last['rss'] - first['rss']) / 2**20:+.1f} MB")
+    print(f"Accounted: {(last['accounted'] - first['accounted']) / 2**20:+.1f} MB "
+          f"(budget evictions: {window.memory_ledger.evictions})")
+    for name, cache in (("Chart cache", window.chart_cache), ("Pixmap cache", window.pixmap_cache)):
+        stats = cache.stats()
+        print(f"{name}: {stats['entries']} entries, {stats['used_bytes'] / 2**20:.1f}/{stats['budget_bytes'] / 2**20:.0f} MB, "
+              f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+    failed = growth > memory_budget.mb(args.max_growth_mb) or leaked_objects > 0
+    if failed:
+        print("\n⚠️  Memory did not stay flat. Largest growth since the baseline:")
+        for location, size, blocks in memory_budget.top_growth(baseline_snapshot, final_snapshot):
+            print(f"  {size / 1024:+10,.0f} KB  {blocks:+8,} blocks  {location}")
+    else:
+        print("\nMemory stayed flat.")
+    memory_budget.stop_tracing()
+    app.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
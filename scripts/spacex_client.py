@@ -0,0 +1,116 @@
+"""Shared HTTP client for the SpaceX API scripts.
+
+Every request gets a timeout, retries with exponential backoff and full jitter
+on connection errors, 429 and 5xx responses, honours Retry-After, and goes
+through a process-wide concurrency limiter.
+
+SPACEX_API_URL points the scripts at another server, e.g. the local mock:
+
+    SPACEX_API_URL=http://127.0.0.1:8765 python scripts/CsvConvert.py
+"""
+import email.utils
+import os
+import random
+import threading
+import time
+
+import requests
+
+import perf_metrics
+
+BASE_URL = os.environ.get("SPACEX_API_URL", "https://api.spacexdata.com").rstrip("/")
+
+CONNECT_TIMEOUT = float(os.environ.get("SPACEX_CONNECT_TIMEOUT", 5))
+READ_TIMEOUT = float(os.environ.get("SPACEX_READ_TIMEOUT", 30))
+MAX_RETRIES = int(os.environ.get("SPACEX_MAX_RETRIES", 4))
+BACKOFF_BASE = 0.5    # saniye
+BACKOFF_MAX = 30.0    # tek bekleme için üst sınır
+MAX_CONCURRENCY = int(os.environ.get("SPACEX_MAX_CONCURRENCY", 4))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_limiter = threading.BoundedSemaphore(MAX_CONCURRENCY)
+_local = threading.local()
+
+
+def api_url(path):
+    if path.startswith("http://") or path.startswith("https://"):
+        return path
+    return f"{BASE_URL}/{path.lstrip('/')}"
+
+
+def _session():
+    # requests.Session iş parçacıkları arasında paylaşılmamalı
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = "SpaceX-launch-Dashboard"
+        _local.session = session
+    return session
+
+
+def retry_after_seconds(response):
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt):
+    # Full jitter: 0 ile üstel sınır arasında rastgele bekleme
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def request(method, path, timeout=None, max_retries=None, **kwargs):
+    """Send a request and return the final Response.
+
+    Responses with a non-retryable status are returned as is, so callers keep
+    checking status_code. When retries run out the last Response is returned,
+    or the last RequestException is raised if no response was ever received.
+    """
+    url = api_url(path)
+    timeout = timeout or (CONNECT_TIMEOUT, READ_TIMEOUT)
+    max_retries = MAX_RETRIES if max_retries is None else max_retries
+
+    for attempt in range(max_retries + 1):
+        response = None
+        try:
+            with _limiter, perf_metrics.timer(f"http.{method.lower()}"):
+                response = _session().request(method, url, timeout=timeout, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            perf_metrics.count("http.errors")
+            if attempt == max_retries:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"  ⚠️  {url}: {e.__class__.__name__}, retrying in {delay:.1f}s ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+            continue
+
+        if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+            return response
+
+        perf_metrics.count(f"http.status_{response.status_code}")
+        delay = retry_after_seconds(response)
+        if delay is None:
+            delay = backoff_delay(attempt)
+        delay = min(delay, BACKOFF_MAX)
+        print(f"  ⚠️  {url}: HTTP {response.status_code}, retrying in {delay:.1f}s ({attempt + 1}/{max_retries})")
+        time.sleep(delay)
+
+    return response
+
+
+def get(path, **kwargs):
+    return request("GET", path, **kwargs)
+
+
+def post(path, **kwargs):
+    return request("POST", path, **kwargs)
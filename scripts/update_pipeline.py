@@ -0,0 +1,247 @@
+"""Checkpointed, resumable data update.
+
+Each stage script writes into a staging directory (data/.update/staging) instead
+of the live data/ and assets/ folders. A JSON journal records finished stages,
+and long stages record finished items in an append-only log, so a crashed or
+cancelled update resumes where it stopped. Only when every stage has finished
+are the staged files moved over the live ones, one os.replace per file.
+
+    python scripts/update_pipeline.py            # run or resume
+    python scripts/update_pipeline.py --restart  # discard the journal first
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+
+import data_paths
+import perf_metrics
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+JOURNAL_VERSION = 1
+STAGE_TIMEOUT = 900  # Güncelleme adımı başına saniye
+RESUME_MAX_AGE = 6 * 3600  # Daha eski yarım kalmış işler baştan başlar
+JOURNAL_DIR_ENV = "SPACEX_UPDATE_JOURNAL"
+
+# (adım, ilerleme mesajı, staging altında üretmesi gereken dosyalar)
+STAGES = [
+    ("CsvConvert", "Fetching latest launch data...", ["data/spacex_launches.csv", "data/launch_timelines.npz"]),
+    ("enrich_launches", "Fetching launchpads, payloads and cores...", ["data/spacex_related.sqlite"]),
+    ("rocket_analysis", "Fetching rocket details...", ["data/rockets_info.json"]),
+    ("download_rocket_images", "Downloading rocket images...", []),
+]
+
+
+def completed_items(stage):
+    """Items a stage finished in an earlier attempt of the current job, as {item: data}.
+
+    Empty when the script runs outside the pipeline.
+    """
+    journal_dir = os.environ.get(JOURNAL_DIR_ENV)
+    path = os.path.join(journal_dir, f"{stage}.items") if journal_dir else None
+    if not path or not os.path.exists(path):
+        return {}
+    items = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Çökme anında yarım yazılmış son satır
+                continue
+            items[entry["item"]] = entry.get("data")
+    return items
+
+
+def mark_item_done(stage, item, data=None):
+    """Append a finished item to the stage's log; flushed so it survives a crash."""
+    journal_dir = os.environ.get(JOURNAL_DIR_ENV)
+    if not journal_dir:
+        return
+    with open(os.path.join(journal_dir, f"{stage}.items"), "a", encoding="utf-8") as f:
+        f.write(json.dumps({"item": item, "data": data}, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_json_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class UpdatePipeline:
+    def __init__(self, data_dir=None, assets_dir=None, stages=None, stage_timeout=STAGE_TIMEOUT):
+        self.data_dir = data_dir or data_paths.DATA_DIR
+        self.assets_dir = assets_dir or data_paths.ASSETS_DIR
+        self.stages = stages or STAGES
+        self.stage_timeout = stage_timeout
+        self.work_dir = os.path.join(self.data_dir, ".update")
+        self.staging_dir = os.path.join(self.work_dir, "staging")
+        self.journal_path = os.path.join(self.work_dir, "journal.json")
+        self.journal = None
+
+    # --- günlük ---
+
+    def load_journal(self):
+        """Return the journal of an unfinished job, or None when there is nothing to resume."""
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                journal = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if journal.get("version") != JOURNAL_VERSION or time.time() - journal.get("created", 0) > RESUME_MAX_AGE:
+            return None
+        return journal
+
+    def save_journal(self):
+        self.journal["updated"] = time.time()
+        write_json_atomic(self.journal_path, self.journal)
+
+    def discard(self):
+        """Drop the journal and everything staged so the next run starts from scratch."""
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        self.journal = None
+
+    def begin(self):
+        """Resume an unfinished job or start a new one; returns True when resuming."""
+        self.journal = self.load_journal()
+        if self.journal is not None:
+            return True
+        self.discard()
+        os.makedirs(os.path.join(self.staging_dir, "data"), exist_ok=True)
+        os.makedirs(os.path.join(self.staging_dir, "assets"), exist_ok=True)
+        self.journal = {
+            "version": JOURNAL_VERSION,
+            "job_id": uuid.uuid4().hex,
+            "created": time.time(),
+            "state": "running",
+            "stages": {},
+        }
+        self.save_journal()
+        return False
+
+    def stage_done(self, stage):
+        return self.journal["stages"].get(stage, {}).get("status") == "done"
+
+    def pending_stages(self):
+        return [stage for stage, _, _ in self.stages if not self.stage_done(stage)]
+
+    # --- çalıştırma ---
+
+    def stage_env(self):
+        env = dict(os.environ)
+        env["SPACEX_DATA_DIR"] = os.path.join(self.staging_dir, "data")
+        env["SPACEX_ASSETS_DIR"] = os.path.join(self.staging_dir, "assets")
+        env[JOURNAL_DIR_ENV] = self.work_dir
+        env["SPACEX_SOURCES_FILE"] = data_paths.SOURCES_JSON
+        env["PYTHONIOENCODING"] = "utf-8"
+        return env
+
+    def run_stage(self, stage, cancelled):
+        """Run one stage script; returns an error message or None on success."""
+        script = os.path.join(SCRIPTS_DIR, f"{stage}.py")
+        log_path = os.path.join(self.work_dir, f"{stage}.log")
+        started = time.monotonic()
+        with open(log_path, "w", encoding="utf-8") as log:
+            process = subprocess.Popen([sys.executable, script], cwd=SCRIPTS_DIR, env=self.stage_env(),
+                                       stdout=log, stderr=subprocess.PIPE, text=True)
+            while True:
+                try:
+                    _, stderr = process.communicate(timeout=0.5)
+                    break
+                except subprocess.TimeoutExpired:
+                    if cancelled():
+                        process.kill()
+                        process.communicate()
+                        return "cancelled"
+                    if time.monotonic() - started > self.stage_timeout:
+                        # İstemci zaman aşımlarına rağmen takılan adımı sonlandır
+                        process.kill()
+                        process.communicate()
+                        return f"{stage}.py did not finish within {self.stage_timeout} seconds."
+        if process.returncode != 0:
+            return f"Error running {stage}.py:\n{stderr}"
+        return None
+
+    def run(self, progress=None, cancelled=None):
+        """Run the pending stages and publish the result; returns (success, message)."""
+        progress = progress or (lambda value, message: None)
+        cancelled = cancelled or (lambda: False)
+        resumed = self.begin()
+        total_steps = len(self.stages) + 1
+
+        for i, (stage, message, outputs) in enumerate(self.stages):
+            if self.stage_done(stage):
+                continue
+            progress(int((i / total_steps) * 100), ("Resuming: " if resumed else "") + message)
+            with perf_metrics.timer(f"update.{stage}"):
+                started = time.time()
+                error = self.run_stage(stage, cancelled)
+            if error is None:
+                missing = [path for path in outputs if not os.path.exists(os.path.join(self.staging_dir, path))]
+                if missing:
+                    error = f"{stage}.py did not produce {', '.join(missing)}."
+            if error is not None:
+                self.journal["state"] = "cancelled" if error == "cancelled" else "failed"
+                self.journal["stages"][stage] = {"status": "failed", "error": error}
+                self.save_journal()
+                if error == "cancelled":
+                    return False, "Update cancelled. Finished steps will be resumed on the next update."
+                return False, error
+            self.journal["stages"][stage] = {"status": "done", "seconds": round(time.time() - started, 2)}
+            self.save_journal()
+
+        if cancelled():
+            return False, "Update cancelled. Finished steps will be resumed on the next update."
+        progress(int((len(self.stages) / total_steps) * 100), "Publishing updated data...")
+        with perf_metrics.timer("update.publish"):
+            self.journal["state"] = "publishing"
+            self.save_journal()
+            published = self.publish()
+            self.discard()
+        return True, f"All data has been updated successfully ({published} files)."
+
+    def publish(self):
+        """Move staged files over the live ones; safe to repeat after a crash."""
+        published = 0
+        for staged_root, live_root in ((os.path.join(self.staging_dir, "data"), self.data_dir),
+                                       (os.path.join(self.staging_dir, "assets"), self.assets_dir)):
+            for dirpath, _, filenames in os.walk(staged_root):
+                target_dir = os.path.join(live_root, os.path.relpath(dirpath, staged_root))
+                os.makedirs(target_dir, exist_ok=True)
+                for filename in filenames:
+                    if filename.endswith(".tmp"):
+                        continue
+                    # Dosya başına atomik: okuyucular ya eski ya yeni dosyayı görür
+                    os.replace(os.path.join(dirpath, filename), os.path.join(target_dir, filename))
+                    published += 1
+        return published
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run or resume the data update pipeline.")
+    parser.add_argument("--restart", action="store_true", help="Discard an unfinished update and start over")
+    args = parser.parse_args()
+
+    pipeline = UpdatePipeline()
+    if args.restart:
+        pipeline.discard()
+    try:
+        success, message = pipeline.run(progress=lambda value, message: print(f"[{value:3d}%] {message}"))
+    except KeyboardInterrupt:
+        print("Interrupted; run again to resume.")
+        return 1
+    print(message)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())